@@ -6,7 +6,27 @@
 
 import sys
 
-from .gui import main
+
+def export(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m investment export", description="export the HTML reports and PNG charts of a ticker group, from the local data store")
+    parser.add_argument("group", help="a group (e.g. 'S&P 500') or an industry (e.g. 'Semiconductors')")
+    parser.add_argument("--output", default=None, help="output directory (default: <data root dir>/export/<group>)")
+    parser.add_argument("--processes", type=int, default=None, help="number of worker processes (default: one per core)")
+    parser.add_argument("--years", type=float, default=1.0, help="time span of the charts, in years (default: 1)")
+    parser.add_argument("--force", action="store_true", help="re-export the tickers whose data have not changed")
+    args = parser.parse_args(argv)
+    from .data import export_group
+    try:
+        result = export_group(group=args.group, output_dir=args.output, n_processes=args.processes, chart_years=args.years, force=args.force)
+    except ValueError as e:
+        parser.error(str(e))
+    return 1 if len(result['failed']) > 0 else 0
+
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "export":
+        sys.exit(export(sys.argv[2:]))
+    else:
+        from .gui import main
+        sys.exit(main())
\ No newline at end of file
@@ -4,10 +4,31 @@
 #
 #  License: LGPL-3.0
 
-from ._data import test, test_data, get_ticker_data_dict, get_formatted_ticker_data, timedata
+from ._data import test, test_data, get_ticker_data_dict, load_local_ticker_data_dict, get_formatted_ticker_data, timedata
 from ._indicator import momentum_indicator, volume_indicator, moving_average
-from ._ticker import ticker_group_dict, subgroup_group_dict, ticker_subgroup_dict, group_desc_dict, Ticker, global_data_root_dir, nasdaqlisted_df, otherlisted_df
+from ._universe import universe_index
+from ._search import ticker_search_index, get_search_index, start_search_index_build
+from ._calendar import trading_calendar
+from ._asof import history_indicators, asof_view, indicator_panel_df
+from ._view import ticker_data_view
+from ._fundamentals import get_fundamentals_df
+from ._export import export_group
+from ._dividend import dividend_events_df, dividend_events_panel_df, trailing_dividends_pct, trailing_dividend_yield_df, dividend_growth_df, dividend_growth_streak, last_1yr_dividends_pct, iter_dividend_screen, rank_dividend_screen, dividend_screen
+from ._price_target import simulate_price_target, ticker_seed, iter_price_target_probabilities, price_target_probabilities
+from ._ticker import ticker_group_dict, subgroup_group_dict, ticker_subgroup_dict, group_desc_dict, Ticker, global_data_root_dir, load_universe, get_universe_index, delisted_tickers, prune_delisted_ticker_data
 
-__all__ = ["test", "test_data", "get_ticker_data_dict", "get_formatted_ticker_data", "timedata",
+__all__ = ["test", "test_data", "get_ticker_data_dict", "load_local_ticker_data_dict", "get_formatted_ticker_data", "timedata",
            "momentum_indicator", "volume_indicator", "moving_average",
-           "ticker_group_dict", "subgroup_group_dict", "ticker_subgroup_dict", "group_desc_dict", "Ticker", "global_data_root_dir", "nasdaqlisted_df", "otherlisted_df"]
\ No newline at end of file
+           "universe_index", "ticker_search_index", "get_search_index", "start_search_index_build",
+           "trading_calendar", "history_indicators", "asof_view", "indicator_panel_df", "ticker_data_view",
+           "get_fundamentals_df", "export_group",
+           "dividend_events_df", "dividend_events_panel_df", "trailing_dividends_pct", "trailing_dividend_yield_df", "dividend_growth_df", "dividend_growth_streak", "last_1yr_dividends_pct", "iter_dividend_screen", "rank_dividend_screen", "dividend_screen",
+           "simulate_price_target", "ticker_seed", "iter_price_target_probabilities", "price_target_probabilities",
+           "ticker_group_dict", "subgroup_group_dict", "ticker_subgroup_dict", "group_desc_dict", "Ticker", "global_data_root_dir", "load_universe", "get_universe_index", "delisted_tickers", "prune_delisted_ticker_data", "nasdaqlisted_df", "otherlisted_df"]
+
+def __getattr__(name):
+    # nasdaqlisted_df and otherlisted_df are loaded on first use, not at import time
+    if name in ['nasdaqlisted_df', 'otherlisted_df']:
+        from . import _ticker
+        return getattr(_ticker, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
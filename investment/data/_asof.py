@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ._calendar import trading_calendar, to_datetime64
+from ._indicator import momentum_indicator, volume_indicator, moving_average
+
+import numpy as np
+import pandas as pd
+
+###########################################################################################
+
+class history_indicators(object):
+    def __init__(self, history_df: pd.DataFrame = None):
+        """
+        the indicators of _indicator.py computed once over the full ticker history, from which point-in-time (as-of) views are cut
+
+        all the indicators are causal (their value on a date only depends on the history up to that date), except the full-sample
+        normalizations of Z_price_vol (mean and std) and PVI_NVI (max): for these, the unnormalized series are cached together with
+        their running sums/maxima, so that an as-of view only rescales its prefix
+        """
+        self.history_df = history_df
+        self.calendar = trading_calendar(history_df['Date'])
+        self.close = history_df['Close'].to_numpy(dtype=float)
+        volume = history_df['Volume'].to_numpy()
+        self.has_volume = not all(volume==None)
+        self.volume = volume.astype(float) if self.has_volume else None
+        self._arrays = {}
+
+    def __len__(self):
+        return len(self.close)
+
+    def _cached(self, key, func):
+        if key not in self._arrays:
+            self._arrays[key] = func()
+        return self._arrays[key]
+
+    def as_of(self, last_date = None):
+        """
+        the view of the history up to and including last_date (a date, or an int number of bars; None: the full history)
+        """
+        if last_date is None:
+            n = len(self)
+        elif isinstance(last_date, (int, np.integer)):
+            n = int(last_date)
+        else:
+            n = int(self.calendar.asof(last_date)) + 1
+        return asof_view(self, max(0, min(n, len(self))))
+
+    def RSI(self, RSI_periods: int = 14):
+        return self._cached(('RSI', RSI_periods), lambda: momentum_indicator().RSI(close_price=self.close, RSI_periods=RSI_periods))
+
+    def MACD(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        return self._cached(('MACD', fast_period, slow_period, signal_period), lambda: momentum_indicator().MACD(close_price=self.close, fast_period=fast_period, slow_period=slow_period, signal_period=signal_period))
+
+    def close_EMA(self, periods: int = 9):
+        return self._cached(('close_EMA', periods), lambda: moving_average(periods=periods).exponential(self.close))
+
+    def OBV(self):
+        return self._cached('OBV', lambda: momentum_indicator().OBV(close_price=self.close, volume=self.volume) if self.has_volume else None)
+
+    def OBV_EMA(self, periods: int = 9):
+        return self._cached(('OBV_EMA', periods), lambda: moving_average(periods=periods).exponential(self.OBV()) if self.has_volume else None)
+
+    def PVI_NVI_raw(self, short_periods: int = 9, long_periods: int = 255):
+        """
+        (PVI, NVI, PVI_EMA_short, NVI_EMA_short, PVI_EMA_long, NVI_EMA_long) without the max normalization, and the running maxima of PVI and NVI
+        """
+        def func():
+            if not self.has_volume:
+                return None
+            arrays = volume_indicator(short_periods=short_periods, long_periods=long_periods).PVI_NVI(self.close, self.volume, normalize=False)
+            return arrays, np.maximum.accumulate(arrays[0]), np.maximum.accumulate(arrays[1])
+        return self._cached(('PVI_NVI', short_periods, long_periods), func)
+
+    def price_vol_sums(self):
+        """
+        close*volume, and the running sums and sums of squares of close*volume - (close*volume)[0] (for the as-of mean and std of Z_price_vol)
+        """
+        def func():
+            if not self.has_volume:
+                return None
+            price_vol = self.close * self.volume
+            shifted = price_vol - price_vol[0] # shifted by the first value, for the numerical stability of the variance
+            return price_vol, np.cumsum(shifted), np.cumsum(shifted*shifted)
+        return self._cached('price_vol', func)
+
+    def price_vol_EMA(self, periods: int = 9):
+        return self._cached(('price_vol_EMA', periods), lambda: moving_average(periods=periods).exponential(self.price_vol_sums()[0]) if self.has_volume else None)
+
+
+class asof_view(object):
+    def __init__(self, indicators: history_indicators = None, n: int = None):
+        """
+        the first n bars of a ticker history, and its indicators as they were known on the last of these bars
+
+        the history and the causal indicators are zero-copy prefixes of the full-history ones; only Z_price_vol and PVI_NVI are
+        rescaled with the statistics of the prefix
+        """
+        self.indicators = indicators
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def history(self):
+        return self.indicators.history_df.iloc[:self.n]
+
+    @property
+    def last_date(self):
+        return self.indicators.calendar.date(self.n-1)
+
+    def RSI(self, RSI_periods: int = 14):
+        return self.indicators.RSI(RSI_periods=RSI_periods)[:self.n]
+
+    def MACD(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        return tuple(x[:self.n] for x in self.indicators.MACD(fast_period=fast_period, slow_period=slow_period, signal_period=signal_period))
+
+    def close_EMA(self, periods: int = 9):
+        return self.indicators.close_EMA(periods=periods)[:self.n]
+
+    def OBV(self):
+        if not self.indicators.has_volume:
+            return [None]*self.n
+        return self.indicators.OBV()[:self.n]
+
+    def OBV_EMA(self, periods: int = 9):
+        if not self.indicators.has_volume:
+            return [None]*self.n
+        return self.indicators.OBV_EMA(periods=periods)[:self.n]
+
+    def PVI_NVI(self, short_periods: int = 9, long_periods: int = 255):
+        """
+        same as volume_indicator(short_periods, long_periods).PVI_NVI() on the first n bars (the EMAs are linear, so they rescale like PVI and NVI)
+        """
+        if not self.indicators.has_volume:
+            return tuple([None]*self.n for _ in range(6))
+        (PVI, NVI, PVI_short, NVI_short, PVI_long, NVI_long), PVI_max, NVI_max = self.indicators.PVI_NVI_raw(short_periods=short_periods, long_periods=long_periods)
+        PVI_scale = 1000/PVI_max[self.n-1]
+        NVI_scale = 1000/NVI_max[self.n-1]
+        return PVI[:self.n]*PVI_scale, NVI[:self.n]*NVI_scale, PVI_short[:self.n]*PVI_scale, NVI_short[:self.n]*NVI_scale, PVI_long[:self.n]*PVI_scale, NVI_long[:self.n]*NVI_scale
+
+    def price_vol_mean_std(self):
+        """
+        the mean and std of close*volume over the first n bars (the standardization of Z_price_vol)
+        """
+        price_vol, shifted_sum, shifted_sum2 = self.indicators.price_vol_sums()
+        shifted_mean = shifted_sum[self.n-1] / self.n
+        std = np.sqrt(max(shifted_sum2[self.n-1] / self.n - shifted_mean*shifted_mean, 0))
+        return price_vol[0] + shifted_mean, std
+
+    def Z_price_vol(self):
+        """
+        same as momentum_indicator().Z_price_vol() on the first n bars
+        """
+        if not self.indicators.has_volume:
+            return [None]*self.n
+        mean, std = self.price_vol_mean_std()
+        return (self.indicators.price_vol_sums()[0][:self.n] - mean) / std
+
+    def Z_price_vol_EMA(self, periods: int = 9):
+        """
+        same as the EMA of Z_price_vol() (the EMA commutes with the standardization)
+        """
+        if not self.indicators.has_volume:
+            return [None]*self.n
+        mean, std = self.price_vol_mean_std()
+        return (self.indicators.price_vol_EMA(periods=periods)[:self.n] - mean) / std
+
+
+def indicator_panel_df(ticker_data_dict_dict: dict = None, indicator = 'Close'):
+    """
+    an indicator of many tickers on their common calendar, {ticker: ticker data dict} -> DataFrame (UTC dates x tickers), NaN where a
+    ticker has no bar
+
+    indicator: a column of the history (e.g. 'Close'), or a function of the history_indicators of a ticker returning one value per
+    bar (e.g. lambda indicators: indicators.RSI(RSI_periods=14))
+    """
+    dates_dict = {}
+    values_dict = {}
+    for ticker, ticker_data_dict in ticker_data_dict_dict.items():
+        history_df = ticker_data_dict.get('history')
+        if history_df is None or len(history_df) == 0:
+            continue
+        dates_dict[ticker] = to_datetime64(history_df['Date'])
+        if callable(indicator):
+            values_dict[ticker] = np.asarray(indicator(history_indicators(history_df)), dtype=float)
+        else:
+            values_dict[ticker] = history_df[indicator].to_numpy(dtype=float, na_value=np.nan)
+    if len(dates_dict) == 0:
+        return pd.DataFrame(index=pd.DatetimeIndex([], tz='UTC'))
+    calendar = trading_calendar.union(list(dates_dict.values()))
+    panel = np.full((len(calendar), len(dates_dict)), np.nan)
+    for j, ticker in enumerate(dates_dict.keys()):
+        panel[calendar.index_of(dates_dict[ticker]), j] = values_dict[ticker]
+    return pd.DataFrame(panel, index=calendar.date(np.arange(len(calendar))), columns=list(dates_dict.keys()))
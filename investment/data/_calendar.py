@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import numpy as np
+import pandas as pd
+
+###########################################################################################
+
+def to_datetime64(dates = None):
+    """
+    date(s) (str, datetime, Timestamp, array-like; naive dates are taken as UTC) -> UTC datetime64[ns] scalar or array, the representation used by trading_calendar
+    """
+    if np.ndim(dates) == 0:
+        return pd.Timestamp(pd.to_datetime(dates, utc=True)).tz_convert(None).to_datetime64().astype('datetime64[ns]')
+    return pd.DatetimeIndex(pd.to_datetime(dates, utc=True)).tz_convert(None).values.astype('datetime64[ns]')
+
+
+class trading_calendar(object):
+    def __init__(self, dates = None):
+        """
+        the sorted trading dates (bars) of a ticker or a panel, mapped to integer bar indices once, so that date lookups become integer
+        positions and date ranges become slices (dates: the 'Date' column of a ticker history, or any array-like of strictly increasing
+        dates; ValueError otherwise)
+
+        index_of: exact match (-1 if not a trading date)
+        asof: the last bar at or before the date (-1 if before the first bar)
+        next: the first bar at or after the date (len(self) if after the last bar)
+        nearest: the closest bar
+        slice: the bars within [first_date, last_date], as a slice for iloc / numpy arrays
+        """
+        self.dates = to_datetime64(dates)
+        if len(self.dates) > 1 and not (self.dates[1:] > self.dates[:-1]).all():
+            # the bar indices are row positions of the history: sorting or deduplicating here would silently shift them
+            raise ValueError("the dates of a trading calendar should be strictly increasing (sort and deduplicate the history first)")
+        self._position_dict = None
+
+    @classmethod
+    def union(cls, calendars: list = None):
+        """
+        the calendar of a panel: all the trading dates of the given calendars (or date arrays)
+        """
+        return cls(np.unique(np.concatenate([c.dates if isinstance(c, trading_calendar) else to_datetime64(c) for c in calendars])))
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def first_date(self):
+        return pd.Timestamp(self.dates[0], tz='UTC')
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(self.dates[-1], tz='UTC')
+
+    def date(self, index = None):
+        """
+        bar index(es) -> UTC Timestamp / DatetimeIndex
+        """
+        if np.ndim(index) == 0:
+            return pd.Timestamp(self.dates[index], tz='UTC')
+        return pd.DatetimeIndex(self.dates[np.asarray(index)], tz='UTC')
+
+    def _position(self):
+        if self._position_dict is None:
+            self._position_dict = dict(zip(self.dates.view('int64').tolist(), range(len(self.dates))))
+        return self._position_dict
+
+    def index_of(self, dates = None):
+        if np.ndim(dates) == 0:
+            return self._position().get(int(to_datetime64(dates).view('int64')), -1)
+        dates = to_datetime64(dates)
+        idx = np.searchsorted(self.dates, dates, side='left')
+        found = idx < len(self.dates)
+        found[found] = self.dates[idx[found]] == dates[found]
+        return np.where(found, idx, -1)
+
+    def asof(self, dates = None):
+        return np.searchsorted(self.dates, to_datetime64(dates), side='right') - 1
+
+    def next(self, dates = None):
+        return np.searchsorted(self.dates, to_datetime64(dates), side='left')
+
+    def nearest(self, dates = None):
+        dates = to_datetime64(dates)
+        hi = np.clip(np.searchsorted(self.dates, dates, side='left'), 0, len(self.dates)-1)
+        lo = np.clip(hi - 1, 0, len(self.dates)-1)
+        return np.where(np.abs(self.dates[hi] - dates) < np.abs(dates - self.dates[lo]), hi, lo)
+
+    def slice(self, first_date = None, last_date = None):
+        """
+        the bars within [first_date, last_date] (None: unbounded) as a slice; O(1) when both ends are trading dates
+        """
+        if first_date is None:
+            start = 0
+        else:
+            start = self.index_of(first_date)
+            if start < 0:
+                start = int(self.next(first_date))
+        if last_date is None:
+            stop = len(self.dates)
+        else:
+            stop = self.index_of(last_date)
+            stop = int(self.asof(last_date)) + 1 if stop < 0 else stop + 1
+        return slice(start, max(start, stop))
+
+    def align(self, other = None):
+        """
+        the bar indices in this calendar of the bars of another calendar (-1 where missing), e.g. to place a ticker's bars on a panel calendar
+        """
+        if isinstance(other, trading_calendar):
+            other = other.dates
+        return self.index_of(other)
@@ -4,10 +4,8 @@
 #
 #  License: LGPL-3.0
 
-import yfinance as yf
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 from datetime import datetime, date, timedelta, timezone
 import os
@@ -17,7 +15,6 @@ import pickle
 import shutil
 
 from urllib.request import urlopen
-import base64
 
 import time
 
@@ -134,6 +131,8 @@ def gradient_test():
 # https://www.quora.com/Using-Python-whats-the-best-way-to-get-stock-data
 
 def download_ticker_history_df(ticker: str = None, verbose: bool = True, download_today_data: bool = False, auto_retry: bool = False):
+    import yfinance as yf # imported here, not at module level, to keep 'import investment' fast
+
     if ticker is None:
         raise ValueError("Error: ticker cannot be None")
 
@@ -180,6 +179,7 @@ def download_ticker_history_df(ticker: str = None, verbose: bool = True, downloa
 
 
 def download_ticker_info_dict(ticker: str = None, verbose: bool = True, auto_retry: bool = False):
+    import yfinance as yf
 
     if ticker is None:
         raise ValueError("Error: ticker cannot be None")
@@ -399,15 +399,30 @@ def get_ticker_data_dict(ticker: str = None,
                 new_df.to_csv(ticker_history_df_file, index=False)
                 pickle.dump(ticker_info_dict, open(ticker_info_dict_file, "wb"))
 
-    history_df = pd.read_csv(ticker_history_df_file, index_col=False)
-    if ticker in ['^VIX','^TNX','^VOLQ']: # these have no volume
-        history_df = history_df[(history_df['Close']>0)]
-        history_df['Volume'] = None
+    return read_ticker_data_dict(ticker = ticker, ticker_history_df_file = ticker_history_df_file, ticker_info_dict_file = ticker_info_dict_file, last_date = last_date)
+
+
+def read_ticker_data_dict(ticker: str = None, ticker_history_df_file: str = None, ticker_info_dict_file: str = None, last_date = None, with_history: bool = True):
+    """
+    read the ticker data dict from its cached history csv and info dict pickle
+
+    if with_history is False, the csv is not parsed and 'history' is None (for info-only uses, e.g. screening fundamentals)
+    """
+    if with_history:
+        history_df = pd.read_csv(ticker_history_df_file, index_col=False)
+        if ticker in ['^VIX','^TNX','^VOLQ']: # these have no volume
+            history_df = history_df[(history_df['Close']>0)]
+            history_df['Volume'] = None
+        else:
+            history_df = history_df[(history_df['Close']>0) & (history_df['Volume']>0)]
+        history_df['Date'] = pd.to_datetime(history_df['Date'], format='%Y-%m-%d', utc=True) # "utc=True" is to be consistent with yfinance datetimes, which are received as UTC.
+        if not (history_df['Date'].is_monotonic_increasing and history_df['Date'].is_unique):
+            # one row per trading date, in date order: the bar indices of the trading_calendar are row positions
+            history_df = history_df.sort_values('Date', kind='mergesort').drop_duplicates(subset='Date', keep='last')
+        if last_date is not None:
+            history_df = history_df.iloc[:history_df['Date'].searchsorted(pd.to_datetime(last_date, utc=True), side='right')]
     else:
-        history_df = history_df[(history_df['Close']>0) & (history_df['Volume']>0)]
-    history_df['Date'] = pd.to_datetime(history_df['Date'], format='%Y-%m-%d', utc=True) # "utc=True" is to be consistent with yfinance datetimes, which are received as UTC.
-    if last_date is not None:
-        history_df = history_df[history_df['Date']<=last_date]
+        history_df = None
     info_dict = pickle.load( open( ticker_info_dict_file, "rb" ) )
     if 'info' not in info_dict.keys():
         raise KeyError(f"for ticker = [{ticker}], 'info' is not in the info_dict keys")
@@ -416,328 +431,39 @@ def get_ticker_data_dict(ticker: str = None,
     return info_dict
 
 
-def get_formatted_ticker_data(ticker_data_dict, use_html: bool = False):
-    from ._ticker import Ticker
-    this_ticker = Ticker(ticker_data_dict=ticker_data_dict)
-
-    if use_html:
-        formatted_str = "<style>table, th, td {border: 1px solid black; border-collapse: collapse; padding: 2px;} body {font-family: Courier New;}</style><body>"
-    else:
-        formatted_str = ""
-
-    if not 'info' in ticker_data_dict.keys():
-        if use_html:
-            formatted_str += f"the key 'info' does not exist in ticker_data_dict</body>"
-        else:
-            formatted_str += f"the key 'info' does not exist in ticker_data_dict"
-        return formatted_str
-
-    ticker_info = ticker_data_dict['info']
-    if ticker_info is None:
-        if use_html:
-            formatted_str += f"the key 'info' does not exist in ticker_data_dict</body>"
-        else:
-            formatted_str += f"the key 'info' does not exist in ticker_data_dict"
-        return formatted_str
-
-    ticker_info_keys = ticker_info.keys()
-
-    # name amd major indexes
-    # major index
-    df = pd.DataFrame({'DOW 30': this_ticker.in_dow30, 'NASDAQ 100': this_ticker.in_nasdaq100, 'S&P 500': this_ticker.in_sandp500, 'NASDAQ Composite': this_ticker.in_nasdaq_composite, 'Russell 1000': this_ticker.in_russell1000, 'Russell 2000': this_ticker.in_russell2000}, index=[0])
-    if use_html:
-        major_indexes_str = df.to_html(index=False).replace('<table border="1" class="dataframe">', '<table>').replace('True', '<b><span style=\"color:blue;\">True</span></b>').replace('False', '<span style=\"color:#D3D3D3;\">False</span>')
-    else:
-        major_indexes_str = df.to_string(index=False)
-    #
-    if use_html:
-        ticker_name = f"<b>{this_ticker.name}</b><br/><br/>Symbol: [{this_ticker.symbol}]<br/>{major_indexes_str}"
-    else:
-        ticker_name = f"{this_ticker.name}\n\nSymbol: [{this_ticker.symbol}]\n\n{major_indexes_str}"
-
-    # stock exchange listing info
-    stock_exchange_info = ""
-    if this_ticker.nasdaq_listed:
-        if use_html:
-            stock_exchange_info = f"<br/><hr>Nasdaq Listed<br/>- Name: [{this_ticker.nasdaq_security_name}]<br/>- Market category: [{this_ticker.nasdaq_market_category}]<br/>- Financial status: [{this_ticker.nasdaq_financial_status}]<br/>- ETF? [{this_ticker.nasdaq_etf}]"
-        else:
-            stock_exchange_info = f"\n\nNasdaq Listed\n- Name: [{this_ticker.nasdaq_security_name}]\n- Market category: [{this_ticker.nasdaq_market_category}]\n- Financial status: [{this_ticker.nasdaq_financial_status}]\n- ETF? [{this_ticker.nasdaq_etf}]"
-    elif this_ticker.non_nasdaq_listed:
-        if use_html:
-            stock_exchange_info = f"<br/><hr>Exchange: {this_ticker.non_nasdaq_exchange}<br/>- Name: [{this_ticker.non_nasdaq_security_name}]<br/>- ETF? [{this_ticker.non_nasdaq_etf}]"
-        else:
-            stock_exchange_info = f"\n\nExchange: {this_ticker.non_nasdaq_exchange}\n- Name: [{this_ticker.non_nasdaq_security_name}]\n- ETF? [{this_ticker.non_nasdaq_etf}]"
+def load_local_ticker_data_dict(ticker: str = None, last_date = None, data_root_dir: str = None, with_history: bool = True):
+    """
+    like get_ticker_data_dict, but never downloads: returns None if the ticker is not in the local data store
+    """
+    from ._ticker import global_data_root_dir
 
-    # sector info
-    if use_html:
-        sector_info = f"<br/><hr>Sector info unavailable"
-    else:
-        sector_info = f"\n\nSector info unavailable"
-    if 'sector' in ticker_info_keys:
-        if use_html:
-            sector_info = f"<br/><hr>Sector: [{ticker_info['sector']}]"
-        else:
-            sector_info = f"\n\nSector: [{ticker_info['sector']}]"
-        if 'industry' in ticker_info_keys:
-            sector_info += f", Industry: [{ticker_info['industry']}]"
+    if ticker is None:
+        raise ValueError("Error: ticker cannot be None")
 
-    # earnings
-    if use_html:
-        earnings_info = f"<br/><hr>Earnings info unavailable"
-    else:
-        earnings_info = f"\n\nEarnings info unavailable"
-    if this_ticker.trailingEps is not None:
-        if use_html:
-            earnings_info = f"<br/><hr>Earnings per share (EPS) from the last four quarters: ${this_ticker.trailingEps:.2f}"
-        else:
-            earnings_info = f"\n\nEarnings per share (EPS) from the last four quarters: ${this_ticker.trailingEps:.2f}"
-        if this_ticker.forwardEps is not None:
-            if use_html:
-                earnings_info += f"<br/>EPS estimated for the next four quarters: ${this_ticker.forwardEps:.2f}, which is <b><span style=\"color:blue;\">{round(this_ticker.Eps_change_pct,2):+.2f}%</span></b>"
-            else:
-                earnings_info += f"\nEPS estimated for the next four quarters: ${this_ticker.forwardEps:.2f}, which is {round(this_ticker.Eps_change_pct,2):+.2f}%"
-        if this_ticker.Eps_growth_rate is not None:
-            if use_html:
-                earnings_info += f"<br/><br/>The 5-yr EPS growth rate is estimated to be <b><span style=\"color:blue;\">{this_ticker.Eps_growth_rate:+.2f}%</span></b> (compound rate per year)"
-            else:
-                earnings_info += f"\n\nThe 5-yr EPS growth rate is estimated to be {this_ticker.Eps_growth_rate:+.2f}% (compound rate per year)"
-    
-    # price target
-    if use_html:
-        price_target_info = f"<br/><hr>Price target info unavailable"
-    else:
-        price_target_info = f"\n\nPrice target info unavailable"
-    if this_ticker.price_target is not None:
-        up_side_pct = 100 * (this_ticker.price_target - this_ticker.last_close_price) / this_ticker.last_close_price
-        if use_html:
-            price_target_info = f"<br/><hr>1-yr price target: ${this_ticker.price_target} (<b><span style=\"color:blue;\">{up_side_pct:+.2f}%</span></b> upside)"
-        else:
-            price_target_info = f"\n\n1-yr price target: ${this_ticker.price_target} ({up_side_pct:+.2f}% upside)"
+    ticker = ticker.upper()
 
-    # apples-to-apples comparison
-    # e.g., https://www.investopedia.com/terms/p/price-earningsratio.asp#investor-expectations
-    if use_html:
-        company_to_company_comparison_info = f"<br/><hr>Company-to-company comparison info unavailable"
-    else:
-        company_to_company_comparison_info = f"\n\nCompany-to-company comparison info unavailable"
-    if this_ticker.trailingPE is not None:
-        if use_html:
-            company_to_company_comparison_info = f"<br/><hr>For an apples-to-apples comparison, the ratio of current price to the earnings from the last four quarters (the trailing P/E, <b>the earnings multiple</b>): <b><span style=\"color:blue;\">{this_ticker.trailingPE:.2f}</span></b><br/><br/>A high P/E ratio could mean that an over-valued stock, or high expectation of growth rates in the future. Traditionally the P/E could be between 6 and 120, with a long-term mean of 15."
-        else:
-            company_to_company_comparison_info = f"\n\nFor an apples-to-apples comparison, the ratio of current price to the earnings from the last four quarters (the trailing P/E, the earnings multiple): {this_ticker.trailingPE:.2f} A high P/E ratio could mean that an over-valued stock, or high expectation of growth rates in the future. Traditionally the P/E could be between 6 and 120, with a long-term mean of 15."
-        if this_ticker.forwardPE is not None:
-            if use_html:
-                company_to_company_comparison_info += f"<br/><br/>The ratio of current price to the earnings estimated for the next four quarters (the forward P/E, <b>the earnings multiple</b>): <b><span style=\"color:blue;\">{this_ticker.forwardPE:.2f}</span></b>. If the forward P/E ratio is lower (or higher) than the trailing P/E ratio, it means analysts are expecting earnings to increase (or decrease)."
-            else:
-                company_to_company_comparison_info += f"\n\nThe ratio of current price to the earnings estimated for the next four quarters (the forward P/E, the earnings multiple): {this_ticker.forwardPE:.2f}. If the forward P/E ratio is lower (or higher) than the trailing P/E ratio, it means analysts are expecting earnings to increase (or decrease)."
-    if this_ticker.PEG_ratio is not None:
-        if use_html:
-            company_to_company_comparison_info += f"<br/><br/>The Price/Earnings-to-Growth (PEG) ratio is <b><span style=\"color:blue;\">{this_ticker.PEG_ratio}</span></b> (which is over-valued if &gt; 1.0, or under-valued if &lt; 1.0; in theory, the lower the PEG ratio the better, which implies paying less for future earnings growth.)"
-        else:
-            company_to_company_comparison_info += f"\n\nThe Price/Earnings-to-Growth (PEG) ratio is {this_ticker.PEG_ratio} (which is over-valued if > 1.0, or under-valued if < 1.0; in theory, the lower the PEG ratio the better, which implies paying less for future earnings growth.)"
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
 
-    # shares info
-    if use_html:
-        shares_info = f"<br/><hr>Share info unavailable"
-    else:
-        shares_info = f"\n\nShare info unavailable"
-    if 'floatShares' in ticker_info_keys and 'sharesOutstanding' in ticker_info_keys and 'marketCap' in ticker_info_keys:
-        floatShares = ticker_info['floatShares']
-        sharesOutstanding = ticker_info['sharesOutstanding']
-        marketCap = ticker_info['marketCap']
-        if floatShares is not None and sharesOutstanding is not None and marketCap is not None:
-            if sharesOutstanding > 1e9:
-                sharesOutstanding_info = f"{sharesOutstanding/1e9:.2f} billions"
-            else:
-                sharesOutstanding_info = f"{sharesOutstanding/1e6:.2f} millions"
-            if marketCap > 1e12:
-                marketCap_info = f"${marketCap/1e12:.2f} trillions"
-            elif marketCap > 1e9:
-                marketCap_info = f"${marketCap/1e9:.2f} billions"
-            else:
-                marketCap_info = f"${marketCap/1e6:.2f} millions"
-            if use_html:
-                shares_info = f"<br/><hr>Total number of shares issued: {sharesOutstanding_info} (<b><span style=\"color:blue;\">{floatShares/sharesOutstanding*100:.2f}%</span></b> freely tradable, which largely determines liquidity, while the other {100-floatShares/sharesOutstanding*100:.2f}% are held by institutions and insiders), and marketCap is {marketCap_info}."
-            else:
-                shares_info = f"\n\nTotal number of shares issued: {sharesOutstanding_info} ({floatShares/sharesOutstanding*100:.2f}% freely tradable, which largely determines liquidity, while the other {100-floatShares/sharesOutstanding*100:.2f}% are held by institutions and insiders), and marketCap is {marketCap_info}."
+    data_dir = join(data_root_dir, "ticker_data/yfinance")
+    ticker_history_df_file = join(data_dir, f"{ticker}_history.csv")
+    ticker_info_dict_file = join(data_dir, f"{ticker}_info_dict.pkl")
 
-    # profitability
-    if use_html:
-        profitability_info = f"<br/><hr>Profitability info unavailable"
-    else:
-        profitability_info = f"\n\nProfitability info unavailable"
-    if 'profitMargins' in ticker_info_keys:
-        profitMargins = ticker_info['profitMargins']
-        if profitMargins is not None:
-            if use_html:
-                profitability_info = f"<br/><hr>The business has generated {profitMargins*100:.2f}% profit out of each dollar of sale"
-            else:
-                profitability_info = f"\n\nThe business has generated {profitMargins*100:.2f}% profit out of each dollar of sale"
+    if (not os.path.isfile(ticker_info_dict_file)) or (with_history and not os.path.isfile(ticker_history_df_file)):
+        return None
 
-    # valuation analysis
-    # https://www.investopedia.com/terms/m/multiple.asp
-    if use_html:
-        valuation_info = f"<br/><hr>Valuation info unavailable"
-    else:
-        valuation_info = f"/n/nValuation info unavailable"
-    # method1: cash flow (intrinsic valuation)
-    # method2: multiple of performance (relative valuation)
-    if this_ticker.EV_to_EBITDA is not None:
-        if use_html:
-            valuation_info = f"<br/><hr>Valuation info. How much to buy a company? The firm's total value to its EBITDA (earnings before interest, taxes, depreciation, and amortization): <b><span style=\"color:blue;\">{this_ticker.EV_to_EBITDA:.2f}</span></b> (tends to be between 11-14, while below 10 is considered healthy; the lower, the better)"
-        else:
-            valuation_info = f"\n\nValuation info. How much to buy a company? The firm's total value to its EBITDA (earnings before interest, taxes, depreciation, and amortization): {this_ticker.EV_to_EBITDA:.2f} (which tends to be between 11-14, while below 10 is considered healthy; the lower, the better)"
+    return read_ticker_data_dict(ticker = ticker, ticker_history_df_file = ticker_history_df_file, ticker_info_dict_file = ticker_info_dict_file, last_date = last_date, with_history = with_history)
 
-    # institutions
-    if use_html:
-        institutions_holding_info = f"<br/><hr>Institution holding info unavailable"
-    else:
-        institutions_holding_info = f"\n\nInstitution holding info unavailable"   
-    if 'heldPercentInstitutions' in ticker_info_keys:
-        percent_held_by_institutions = ticker_info['heldPercentInstitutions']
-        if percent_held_by_institutions is not None:
-            if use_html:
-                institutions_holding_info = f"<br/><hr>Shares held by institutions: {100*percent_held_by_institutions:.2f}%<br/><br/>- Large % could be risky: when there is bad news, the price may plunge.<br/>- Low % could have more upside.<br/>- Increase in % is a good sign."
-            else:
-                institutions_holding_info = f"\n\nShares held by institutions: {100*percent_held_by_institutions:.2f}%\n\n- Large % could be risky: when there is bad news, the price may plunge.\n- Low % could have more upside.\n- Increase in % is a good sign."
-            if 'institutional_holders' in ticker_data_dict.keys():
-                institutional_holders_df = ticker_data_dict['institutional_holders']
-                if institutional_holders_df is not None:
-                    if all(elem in institutional_holders_df.columns for elem in ['% Out','Value']):
-                        tmp_df = institutional_holders_df.drop(['% Out','Value'], axis=1, inplace=False) # axis: 0=row, 1=col
-                        if 'sharesOutstanding' in ticker_info_keys:
-                            sharesOutstanding = ticker_info['sharesOutstanding']
-                            if sharesOutstanding is not None:
-                                tmp_df['% Out'] = tmp_df['Shares'].apply(lambda x: f"{x/sharesOutstanding * 100:.2f}%")
-                                tmp_df['Shares (mil.)'] = round(tmp_df['Shares'] / 1e6, 2)
-                                if tmp_df['Shares'].max() * this_ticker.last_close_price / 1e9 < 1:
-                                    tmp_df['Curr Value(mil.$)'] = round(tmp_df['Shares'] * this_ticker.last_close_price / 1e6, 2)
-                                    tmp_df = tmp_df[['Holder','Shares (mil.)','Date Reported','% Out','Curr Value(mil.$)']]
-                                else:
-                                    tmp_df['Curr Value(bil.$)'] = round(tmp_df['Shares'] * this_ticker.last_close_price / 1e9, 2)
-                                    tmp_df = tmp_df[['Holder','Shares (mil.)','Date Reported','% Out','Curr Value(bil.$)']]                                   
-                        if use_html:
-                            institutions_holding_info += f"<br/><br/>Institutional Holders:{tmp_df.to_html(index=False)}"
-                        else:
-                            institutions_holding_info += f"\n\nInstitutional Holders:\n{tmp_df.to_string(index=False)}"
-
-    # dividends
-    if use_html:
-        dividends_info = f"<br/><hr>Dividends info unavailable"
-    else:
-        dividends_info = f"\n\nDividends info unavailable"
-    if ticker_data_dict['dividends'] is not None:
-        dividends_df = ticker_data_dict['dividends'].reset_index(level=0)
-        if len(dividends_df) == 0:
-            if use_html:
-                dividends_info = "<br/><hr>Dividends info never reported"
-            else:
-                dividends_info = "\n\nDividends info never reported"
-        else:
-            dividends_df['Date'] = pd.to_datetime(dividends_df['Date'], format='%Y-%m-%d', utc=True)
-            if use_html:
-                dividends_info = f"<br/><hr>Most recent 10 reported dividends:"
-                dividends_info_df = pd.DataFrame()
-            else:
-                dividends_info = f"\n\nMost recent 10 reported dividends:\nDate\tDividends\tapprox. Yield %"
-            date_close_df = ticker_data_dict['history'][['Date','Close']]
-            for idx, row in dividends_df.tail(10).iterrows():
-                try:
-                    close_price_on_this_date = float(date_close_df[date_close_df.Date == row['Date']].Close)
-                    dividends_yield_percent = f"{100*row['Dividends']/close_price_on_this_date:.2f}%"
-                except:
-                    dividends_yield_percent = "NA"
-                if use_html:
-                    dividends_info_df = dividends_info_df.append({'Date': row['Date'].date(), 'Dividends': f"${row['Dividends']:.2f}", 'approx. Yield %': dividends_yield_percent}, ignore_index = True)
-                else:
-                    dividends_info += f"\n{row['Date'].date()}\t${row['Dividends']:.2f}\t{dividends_yield_percent}"
-            if use_html:
-                dividends_info += dividends_info_df.to_html(index=False)
-            if use_html:
-                dividends_info += f"<br/><br/>Dividends yield in the past 12 mo: {this_ticker.last_1yr_dividends_pct:.2f}%"
-            else:
-                dividends_info += f"\n\nDividends yield in the past 12 mo: {this_ticker.last_1yr_dividends_pct:.2f}%"
-            if 'payoutRatio' in ticker_info_keys:
-                payoutRatio = ticker_info['payoutRatio']
-                if payoutRatio is not None:
-                    if use_html:
-                        dividends_info += f"<br/><br/>As an evaluation of the dividend payment system, {payoutRatio*100:.2f}% of the earnings is paid out to shareholders."
-                    else:
-                        dividends_info += f"\n\nAs an evaluation of the dividend payment system, {payoutRatio*100:.2f}% of the earnings is paid out to shareholders."
-
-    # measures
-    if use_html:
-        risk_info = f"<br/><hr>Beta measure unavailable"
-    else:
-        risk_info = f"\n\nBeta measure unavailable"
-    # beta: covariance of stock with market
-    if 'beta' in ticker_info_keys:
-        beta = ticker_info['beta']
-        if beta is not None:
-            if use_html:
-                risk_info = f"<br/><hr>Beta: {beta:.2f}"
-            else:
-                risk_info = f"\n\nBeta: {beta:.2f}"
-            if beta > 1.00:
-                risk_info += f" (more volatile than the overall market)"
-            if beta <= 1.00:
-                risk_info += f" (less volatile than the overall market)"
-
-    # options
-    if use_html:
-        options_info = f"<br/><hr>Options info unavailable"
-    else:
-        options_info = f"\n\nOptions info unavailable"
-    if this_ticker.options is not None:
-        if use_html:
-            options_info = f"<br/><hr>Options expirations: {this_ticker.options}"
-        else:
-            options_info = f"\n\nOptions expirations: {this_ticker.options}"
-        if this_ticker.option_chain(expiration_date = this_ticker.options[0]) is not None:
-            if use_html:
-                options_info += f"<br/><br/>The most recent one:{this_ticker.option_chain(expiration_date = this_ticker.options[0]).to_html(index=False)}"
-            else:
-                options_info += f"\n\nThe most recent one:{this_ticker.option_chain(expiration_date = this_ticker.options[0]).to_string(index=False)}"
 
-    # recommendations
-    if use_html:
-        recommendations_info = f"<br/><hr>Recommendations info unavailable"
-    else:
-        recommendations_info = f"\n\nRecommendations info unavailable"
-    if this_ticker.recommendations is not None:
-        recommend_n = 5
-        if use_html:
-            recommendations_info = f"<br/><hr>Recommendations (last {recommend_n}):<br\>" + this_ticker.recommendations.tail(recommend_n).to_html(index=False)
-        else:
-            recommendations_info = f"\n\nRecommendations (last {recommend_n}):\n" + this_ticker.recommendations.tail(recommend_n).to_string(index=False)
+def get_formatted_ticker_data(ticker_data_dict, use_html: bool = False, include_option_chain: bool = True):
+    """
+    the ticker report, rendered section by section with cached sections (see ticker_report)
 
-    # summary
-    if 'longBusinessSummary' in ticker_info_keys:
-        if use_html:
-            long_business_summary = f"<br/><hr>{this_ticker.longBusinessSummary}"
-        else:
-            long_business_summary = f"\n\n{this_ticker.longBusinessSummary}"
-    else:
-        long_business_summary = ""
-
-    # logo
-    logo = ""
-    if 'logo' in ticker_info_keys:
-        if this_ticker.logo is not None:
-            logo_base64 = base64.b64encode(this_ticker.logo)
-            if logo_base64 is not None:
-                if use_html:
-                    logo = f"<br/><hr>Logo:<br/><img src=\"data:image/png;base64,{str(logo_base64,'utf-8')}\">"
-                else:
-                    if 'logo_url' in ticker_info_keys:
-                        logo = f"\n\nLogo: {ticker_info['logo_url']}"
-
-    if use_html:
-        formatted_str += f"{ticker_name}{stock_exchange_info}{sector_info}{earnings_info}{company_to_company_comparison_info}{shares_info}{institutions_holding_info}{profitability_info}{valuation_info}{dividends_info}{risk_info}{options_info}{recommendations_info}{long_business_summary}{price_target_info}{logo}</body>"  
-    else:
-        formatted_str += f"{ticker_name}{stock_exchange_info}{sector_info}{earnings_info}{company_to_company_comparison_info}{shares_info}{institutions_holding_info}{profitability_info}{valuation_info}{dividends_info}{risk_info}{options_info}{recommendations_info}{long_business_summary}{price_target_info}{logo}"  
-    
-    return formatted_str
+    with include_option_chain=False, the (heavy) option chain table is left out, and can be rendered on request with
+    ticker_report_engine.section('option_chain', ticker_data_dict, use_html)
+    """
+    from ._report import ticker_report_engine
+    return ticker_report_engine.render(ticker_data_dict, use_html=use_html, include_option_chain=include_option_chain)
 
 
 def test_data(ticker_only: bool = False):
@@ -752,6 +478,8 @@ def test_data(ticker_only: bool = False):
 
 
 def test():
+    import matplotlib.pyplot as plt
+
     data_dict = test_data()
     for key in data_dict.keys():
         print("\n<-------------------------------------------------------------------------------------------")
@@ -777,8 +505,8 @@ class web_scrape(object):
             self.web_scrape_enable = True
             
     def price_target(self, ticker='AAPL', host='yahoo_finance'):
-        from ._ticker import ticker_group_dict
-        if ticker in ticker_group_dict['ETF'] or ticker in ticker_group_dict['ETF database']:
+        from ._ticker import get_universe_index
+        if get_universe_index().in_group(ticker, 'ETF') or get_universe_index().in_group(ticker, 'ETF database'):
             return None
         if self.web_scrape_enable:
             from selenium import webdriver
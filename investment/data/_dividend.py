@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ._pool import _chunks, _iter_pool_chunks
+
+import numpy as np
+import pandas as pd
+
+from datetime import datetime, timedelta, timezone
+
+###########################################################################################
+
+# a dividend is matched to the last close at or before its date, but not to a close older than this
+dividend_close_tolerance = pd.Timedelta(days=7)
+
+def dividends_frame(dividends = None):
+    """
+    the dividends of a ticker (the 'dividends' series of the ticker data dict, indexed by date) as a DataFrame
+    with columns Date (UTC) and Dividends, sorted by Date, zero dividends removed
+    """
+    if dividends is None or len(dividends) == 0:
+        return pd.DataFrame({'Date': pd.Series([], dtype='datetime64[ns, UTC]'), 'Dividends': pd.Series([], dtype='float64')})
+    if isinstance(dividends, pd.Series):
+        df = dividends.rename('Dividends').reset_index()
+        df = df.rename(columns={df.columns[0]: 'Date'})
+    else:
+        df = dividends.reset_index(drop=('Date' in dividends.columns))
+    df = df[['Date','Dividends']].copy()
+    df['Date'] = pd.to_datetime(df['Date'], utc=True).astype('datetime64[ns, UTC]')
+    df['Dividends'] = df['Dividends'].astype('float64')
+    df = df[df['Dividends'] > 0]
+    return df.sort_values('Date', kind='mergesort').reset_index(drop=True)
+
+def _close_frame(history_df: pd.DataFrame = None):
+    df = history_df[['Date','Close']].copy()
+    df['Date'] = df['Date'].astype('datetime64[ns, UTC]')
+    df['Close'] = df['Close'].astype('float64')
+    return df.sort_values('Date', kind='mergesort').reset_index(drop=True)
+
+def dividend_events_df(dividends = None, history_df: pd.DataFrame = None):
+    """
+    one row per dividend: Date, Dividends, Close (the last close at or before the dividend date, via a sorted as-of join) and yield_pct
+
+    Close and yield_pct are NaN when there is no close within dividend_close_tolerance before the dividend
+    """
+    df = dividends_frame(dividends)
+    if history_df is None or len(history_df) == 0:
+        df['Close'] = np.nan
+    else:
+        df = pd.merge_asof(df, _close_frame(history_df), on='Date', direction='backward', tolerance=dividend_close_tolerance)
+    df['yield_pct'] = 100 * df['Dividends'] / df['Close']
+    return df
+
+def dividend_events_panel_df(ticker_data_dict_dict: dict = None):
+    """
+    dividend_events_df for many tickers in one as-of join, {ticker: ticker data dict} -> long DataFrame with a 'ticker' column
+    """
+    dividends_list = []
+    close_list = []
+    for ticker, ticker_data_dict in ticker_data_dict_dict.items():
+        df = dividends_frame(ticker_data_dict.get('dividends'))
+        if len(df) == 0 or ticker_data_dict.get('history') is None:
+            continue
+        dividends_list.append(df.assign(ticker=ticker))
+        close_list.append(_close_frame(ticker_data_dict['history']).assign(ticker=ticker))
+    if len(dividends_list) == 0:
+        return dividend_events_df().assign(ticker=pd.Series([], dtype=object))
+    dividends_df = pd.concat(dividends_list, ignore_index=True).sort_values('Date', kind='mergesort')
+    close_df = pd.concat(close_list, ignore_index=True).sort_values('Date', kind='mergesort')
+    df = pd.merge_asof(dividends_df, close_df, on='Date', by='ticker', direction='backward', tolerance=dividend_close_tolerance)
+    df['yield_pct'] = 100 * df['Dividends'] / df['Close']
+    return df.sort_values(['ticker','Date'], kind='mergesort').reset_index(drop=True)[['ticker','Date','Dividends','Close','yield_pct']]
+
+def trailing_dividends_pct(events_df: pd.DataFrame = None, now = None, window: timedelta = timedelta(days=365.25)):
+    """
+    the sum of the per-event yields (%) of the dividends paid within window before now (events without a close count as 0)
+
+    events_df comes from dividend_events_df(), or dividend_events_panel_df() (then a Series indexed by ticker is returned)
+    """
+    if now is None:
+        now = datetime.now(tz=timezone.utc)
+    now = pd.Timestamp(now)
+    if now.tzinfo is None:
+        now = now.tz_localize('UTC')
+    recent_df = events_df[ events_df['Date'] > (now - window) ]
+    if 'ticker' in events_df.columns:
+        return recent_df['yield_pct'].fillna(0).groupby(recent_df['ticker']).sum().reindex(events_df['ticker'].unique(), fill_value=0)
+    return float(recent_df['yield_pct'].fillna(0).sum())
+
+def trailing_dividend_yield_df(dividends = None, history_df: pd.DataFrame = None, window: timedelta = timedelta(days=365.25)):
+    """
+    the trailing-12-month (window) dividend yield on every trading day, for charting:
+    Date, Close, trailing_dividends (sum of the dividends paid in (Date - window, Date]) and trailing_yield_pct
+    """
+    div_df = dividends_frame(dividends)
+    close_df = _close_frame(history_df)
+    div_dates = div_df['Date'].values
+    cum_dividends = np.concatenate([[0.0], np.cumsum(div_df['Dividends'].values)])
+    dates = close_df['Date'].values
+    hi = np.searchsorted(div_dates, dates, side='right')
+    lo = np.searchsorted(div_dates, dates - np.timedelta64(pd.Timedelta(window)), side='right')
+    close_df['trailing_dividends'] = cum_dividends[hi] - cum_dividends[lo]
+    close_df['trailing_yield_pct'] = 100 * close_df['trailing_dividends'] / close_df['Close']
+    return close_df
+
+def dividend_growth_df(dividends = None, last_date = None):
+    """
+    dividends per calendar year: year, dividends, n_payments, growth_pct (vs. the previous year) and streak,
+    the number of consecutive years of dividend growth ending at that year
+
+    the year of last_date (default: today) is left out as incomplete, unless it already has more dividends than the year before
+    """
+    df = dividends_frame(dividends)
+    if len(df) == 0:
+        return pd.DataFrame(columns=['year','dividends','n_payments','growth_pct','streak'])
+    years = df['Date'].dt.year
+    annual_df = df.groupby(years)['Dividends'].agg(['sum','count']).rename(columns={'sum': 'dividends', 'count': 'n_payments'})
+    annual_df = annual_df.reindex(range(annual_df.index.min(), annual_df.index.max()+1), fill_value=0)
+    annual_df.index.name = 'year'
+    annual_df = annual_df.reset_index()
+    last_year = (datetime.now(tz=timezone.utc) if last_date is None else pd.Timestamp(last_date)).year
+    if len(annual_df) > 1 and annual_df['year'].iloc[-1] == last_year and annual_df['dividends'].iloc[-1] <= annual_df['dividends'].iloc[-2]:
+        annual_df = annual_df.iloc[:-1]
+    prev = annual_df['dividends'].shift(1)
+    annual_df['growth_pct'] = 100 * (annual_df['dividends'] - prev) / prev.where(prev > 0)
+    grew = (annual_df['dividends'] > prev).values
+    # streak: length of the run of True in grew ending at each year
+    run_id = np.cumsum(~grew)
+    annual_df['streak'] = pd.Series(grew.astype(int)).groupby(run_id).cumsum().values
+    return annual_df
+
+def dividend_growth_streak(dividends = None, last_date = None):
+    """
+    the number of consecutive (complete) years of dividend growth, up to the most recent one
+    """
+    annual_df = dividend_growth_df(dividends, last_date=last_date)
+    if len(annual_df) == 0:
+        return 0
+    return int(annual_df['streak'].iloc[-1])
+
+def last_1yr_dividends_pct(ticker_data_dict: dict = None, events_df: pd.DataFrame = None):
+    """
+    the recent 1-year dividends (%) of a ticker: the trailingAnnualDividendYield of its info when known, else the sum of the yields of
+    the dividends of the last year (events_df: dividend_events_df() of the ticker, computed if not given); 0 if it pays no dividends
+    """
+    dividends = ticker_data_dict.get('dividends')
+    if dividends is None or len(dividends) == 0:
+        return 0
+    info = ticker_data_dict.get('info') or {}
+    if info.get('trailingAnnualDividendYield') is not None:
+        return info['trailingAnnualDividendYield'] * 100
+    if events_df is None:
+        events_df = dividend_events_df(dividends, ticker_data_dict.get('history'))
+    return trailing_dividends_pct(events_df)
+
+###########################################################################################
+
+dividend_screen_column = 'recent 1-year dividends (%)'
+
+def _dividend_screen_chunk(args):
+    """
+    screen a chunk of tickers (runs in a worker process); returns [(ticker, recent 1-year dividends (%) or None, status)]
+    """
+    tickers, data_root_dir, online, download_today_data = args
+    from ._data import get_ticker_data_dict, load_local_ticker_data_dict
+    rows = []
+    for ticker in tickers:
+        try:
+            if online:
+                ticker_data_dict = get_ticker_data_dict(ticker=ticker, verbose=False, download_today_data=download_today_data, data_root_dir=data_root_dir)
+            else:
+                ticker_data_dict = load_local_ticker_data_dict(ticker=ticker, data_root_dir=data_root_dir)
+            if ticker_data_dict is None:
+                rows.append((ticker, None, 'missing'))
+            else:
+                rows.append((ticker, float(last_1yr_dividends_pct(ticker_data_dict)), 'screened'))
+        except Exception as e:
+            rows.append((ticker, None, f'error: {e}'))
+    return rows
+
+def iter_dividend_screen(tickers: list = None, data_root_dir: str = None, online: bool = False, download_today_data: bool = False, n_processes: int = None, chunksize: int = None, mp_context = None, cancel_event = None):
+    """
+    screen the tickers for dividends on a pool of n_processes worker processes (default: one per core), yielding
+    (n_done, n_total, rows) as each chunk of tickers completes, rows: [(ticker, recent 1-year dividends (%) or None, status)]
+
+    online=False: only the local data store is read, a ticker not in it is 'missing'; online=True: as get_ticker_data_dict()
+    (tickers not in the store are downloaded, and download_today_data applies)
+
+    the screen stops, and the pending chunks are cancelled, when cancel_event (a threading.Event) is set or the generator is closed
+    """
+    from ._ticker import global_data_root_dir
+
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+    tickers = sorted(set(tickers))
+    n_total = len(tickers)
+    if n_total == 0:
+        return
+    n_processes, chunks = _chunks(tickers, n_processes=n_processes, chunksize=chunksize)
+    n_done = 0
+    for rows in _iter_pool_chunks(_dividend_screen_chunk, chunks, args=(data_root_dir, online, download_today_data), n_processes=n_processes, mp_context=mp_context, cancel_event=cancel_event):
+        n_done += len(rows)
+        yield n_done, n_total, rows
+
+def rank_dividend_screen(rows: list = None):
+    """
+    the dividend payers of screen rows, as a DataFrame (ticker, recent 1-year dividends (%)) ranked by decreasing dividends
+    """
+    df = pd.DataFrame([(ticker, round(pct, 2)) for ticker, pct, _ in rows if pct is not None and pct > 0], columns=['ticker', dividend_screen_column])
+    return df.sort_values(by=[dividend_screen_column, 'ticker'], ascending=[False, True], kind='mergesort').reset_index(drop=True)
+
+def dividend_screen(tickers: list = None, data_root_dir: str = None, online: bool = False, download_today_data: bool = False, n_processes: int = None, verbose: bool = True):
+    """
+    iter_dividend_screen() run to completion: the ranked DataFrame of rank_dividend_screen(), with the missing and failed tickers
+    in df.attrs['missing'] and df.attrs['failed'] ({ticker: error})
+    """
+    rows = []
+    for n_done, n_total, chunk_rows in iter_dividend_screen(tickers, data_root_dir=data_root_dir, online=online, download_today_data=download_today_data, n_processes=n_processes):
+        rows += chunk_rows
+        if verbose:
+            print(f"\r[{n_done}/{n_total}] screened for dividends" + " "*20, end='', flush=True)
+    if verbose and len(rows) > 0:
+        print("")
+    df = rank_dividend_screen(rows)
+    df.attrs['missing'] = sorted(ticker for ticker, _, status in rows if status == 'missing')
+    df.attrs['failed'] = {ticker: status for ticker, _, status in rows if status.startswith('error')}
+    return df
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ..__about__ import __version__
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+import html
+import os
+from os.path import join
+import pathlib
+import pickle
+import re
+import time
+
+###########################################################################################
+
+def _export_worker_init(data_root_dir: str = None):
+    # charts are rendered off-screen in the worker processes, and the universe is the one of the export's data store (never refreshed)
+    import matplotlib
+    matplotlib.use('Agg')
+    from ._ticker import load_universe
+    load_universe(data_root_dir, refresh=False)
+
+def _write_file(file_: str = None, write = None, mode: str = "w"):
+    """
+    write(f) to a temporary file that then replaces file_, so that a failed write never leaves a truncated file_
+    """
+    try:
+        with open(file_ + ".tmp", mode, **({'encoding': 'utf-8'} if 'b' not in mode else {})) as f:
+            write(f)
+        os.replace(file_ + ".tmp", file_)
+    except:
+        if os.path.isfile(file_ + ".tmp"):
+            os.remove(file_ + ".tmp")
+        raise
+
+def _ticker_data_signature(ticker: str = None, data_root_dir: str = None, chart_years: float = None):
+    """
+    what an exported report/chart depends on: the package version, the chart options and the cached data files of the ticker
+    """
+    data_dir = join(data_root_dir, "ticker_data/yfinance")
+    signature = [__version__, chart_years]
+    for file_ in [join(data_dir, f"{ticker}_history.csv"), join(data_dir, f"{ticker}_info_dict.pkl")]:
+        try:
+            signature.append(os.stat(file_).st_mtime_ns)
+        except OSError:
+            return None
+    return tuple(signature)
+
+def _safe_name(name: str = None):
+    return re.sub(r'[^A-Za-z0-9._^-]+', '_', name).strip('_')
+
+def draw_ticker_chart(ticker_data_dict: dict = None, chart_file: str = None, chart_years: float = 1.0):
+    """
+    save a price (close, EMA9, EMA255), volume, RSI14 and MACD chart of the last chart_years of the ticker history to chart_file (PNG)
+    """
+    import matplotlib.pyplot as plt
+    from ._asof import history_indicators
+
+    history_df = ticker_data_dict['history']
+    indicators = history_indicators(history_df)
+    view = indicators.as_of()
+    first_date = indicators.calendar.last_date - timedelta(days=365.25*chart_years)
+    window = indicators.calendar.slice(first_date, None)
+    dates = history_df['Date'].iloc[window].dt.tz_localize(None).to_numpy()
+
+    fig, axes = plt.subplots(nrows=4, ncols=1, sharex=True, figsize=(10, 8), gridspec_kw={'height_ratios': [3, 1, 1, 1]})
+    fig.suptitle(f"{ticker_data_dict['ticker']}: {str(indicators.calendar.date(window.start).date())} ~ {str(indicators.calendar.last_date.date())}")
+    axes[0].plot(dates, view.indicators.close[window], color='black', linewidth=1, label='Close')
+    axes[0].plot(dates, view.close_EMA(periods=9)[window], color='blue', linewidth=0.8, label='EMA9')
+    axes[0].plot(dates, view.close_EMA(periods=255)[window], color='orange', linewidth=0.8, label='EMA255')
+    axes[0].legend(loc='upper left', fontsize=8)
+    axes[0].grid(True, alpha=0.3)
+    if indicators.has_volume:
+        axes[1].fill_between(dates, indicators.volume[window], step='mid', color='gray', linewidth=0)
+    axes[1].set_ylabel('Volume', fontsize=8)
+    axes[2].plot(dates, view.RSI(RSI_periods=14)[window], color='purple', linewidth=0.8)
+    axes[2].axhline(30, color='gray', linestyle='dashed', linewidth=0.5)
+    axes[2].axhline(70, color='gray', linestyle='dashed', linewidth=0.5)
+    axes[2].set_ylabel('RSI14', fontsize=8)
+    macd, signal, histogram = view.MACD(fast_period=12, slow_period=26, signal_period=9)
+    axes[3].plot(dates, macd[window], color='blue', linewidth=0.8)
+    axes[3].plot(dates, signal[window], color='orange', linewidth=0.8)
+    axes[3].fill_between(dates, histogram[window], step='mid', color='gray', linewidth=0)
+    axes[3].set_ylabel('MACD', fontsize=8)
+    fig.tight_layout()
+    try:
+        _write_file(chart_file, lambda f: fig.savefig(f, format='png', dpi=80), mode="wb")
+    finally:
+        plt.close(fig)
+
+def _export_ticker(args):
+    """
+    export the report and the chart of one ticker (runs in a worker process); returns (ticker, status, signature, summary)
+    """
+    ticker, data_root_dir, output_dir, chart_years = args
+    from ._data import load_local_ticker_data_dict, get_formatted_ticker_data
+    signature = _ticker_data_signature(ticker, data_root_dir, chart_years)
+    if signature is None:
+        return ticker, 'missing', None, None
+    try:
+        ticker_data_dict = load_local_ticker_data_dict(ticker=ticker, data_root_dir=data_root_dir)
+        if ticker_data_dict is None or len(ticker_data_dict['history']) == 0:
+            return ticker, 'missing', None, None
+        report = get_formatted_ticker_data(ticker_data_dict, use_html=True) # rendered first: a failure keeps the previous report
+        _write_file(join(output_dir, f"{_safe_name(ticker)}.html"), lambda f: f.write(report))
+        draw_ticker_chart(ticker_data_dict, chart_file=join(output_dir, f"{_safe_name(ticker)}.png"), chart_years=chart_years)
+        info = ticker_data_dict['info']
+        summary = {'name': info.get('longName') or info.get('shortName') or '',
+                   'last_date': str(ticker_data_dict['history']['Date'].iloc[-1].date()),
+                   'last_close': float(ticker_data_dict['history']['Close'].iloc[-1])}
+    except Exception as e:
+        return ticker, f'error: {e}', None, None
+    return ticker, 'exported', signature, summary
+
+def _write_index_page(output_dir: str = None, title: str = None, manifest: dict = None):
+    rows = []
+    for ticker in sorted(manifest.keys()):
+        summary = manifest[ticker]['summary']
+        name = _safe_name(ticker)
+        rows.append(f"<tr><td><a href=\"{name}.html\">{html.escape(ticker)}</a></td><td>{html.escape(summary['name'])}</td><td>{summary['last_date']}</td><td>${summary['last_close']:.2f}</td><td><a href=\"{name}.png\"><img src=\"{name}.png\" height=\"80\"></a></td></tr>")
+    with open(join(output_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write("<style>table, th, td {border: 1px solid black; border-collapse: collapse; padding: 2px;} body {font-family: Courier New;}</style><body>")
+        f.write(f"<b>{html.escape(title)}</b><br/><br/>{len(rows)} tickers, exported with investment {__version__}<br/><br/>")
+        f.write("<table><tr><th>Ticker</th><th>Name</th><th>Last Date</th><th>Last Close</th><th>Chart</th></tr>" + "".join(rows) + "</table></body>")
+
+def export_group(group: str = None, tickers: list = None, output_dir: str = None, data_root_dir: str = None, n_processes: int = None, chart_years: float = 1.0, force: bool = False, verbose: bool = True):
+    """
+    export the HTML report and a PNG chart for each ticker of a group (ticker_group_dict) or an industry (ticker_subgroup_dict),
+    or of the given tickers, plus an index.html page, using a pool of n_processes worker processes (default: one per core)
+
+    only the tickers in the local data store are exported (nothing is downloaded), and a ticker whose data files have not changed
+    since its last export is skipped (see manifest.pkl in output_dir), unless force=True
+
+    returns {'exported': [...], 'skipped': [...], 'missing': [...], 'failed': {ticker: error}}
+    """
+    from ._ticker import ticker_group_dict, ticker_subgroup_dict, global_data_root_dir, load_universe
+
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+    load_universe(data_root_dir, refresh=False)
+
+    if tickers is None:
+        if group in ticker_group_dict:
+            tickers = ticker_group_dict[group]
+        elif group in ticker_subgroup_dict:
+            tickers = ticker_subgroup_dict[group]
+        else:
+            raise ValueError(f"unknown group or industry: [{group}]")
+    title = group if group is not None else "Tickers"
+    tickers = sorted(set(tickers))
+
+    if output_dir is None:
+        output_dir = join(data_root_dir, "export", _safe_name(title))
+    pathlib.Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    manifest_file = join(output_dir, "manifest.pkl")
+    manifest = {}
+    if os.path.isfile(manifest_file) and not force:
+        try:
+            with open(manifest_file, "rb") as f:
+                manifest = pickle.load(f)
+        except:
+            manifest = {}
+
+    result = {'exported': [], 'skipped': [], 'missing': [], 'failed': {}}
+    todo = []
+    for ticker in tickers:
+        entry = manifest.get(ticker)
+        signature = _ticker_data_signature(ticker, data_root_dir, chart_years)
+        if signature is None:
+            manifest.pop(ticker, None)
+            result['missing'].append(ticker)
+        elif entry is not None and entry['signature'] == signature \
+           and os.path.isfile(join(output_dir, f"{_safe_name(ticker)}.html")) and os.path.isfile(join(output_dir, f"{_safe_name(ticker)}.png")):
+            result['skipped'].append(ticker)
+        else:
+            todo.append(ticker)
+
+    start_time = time.time()
+    if len(todo) > 0:
+        if n_processes is None:
+            n_processes = os.cpu_count() or 1
+        n_processes = max(1, min(n_processes, len(todo)))
+        chunksize = max(1, len(todo) // (n_processes * 8))
+        n_done = 0
+        with ProcessPoolExecutor(max_workers=n_processes, initializer=_export_worker_init, initargs=(data_root_dir,)) as executor:
+            for ticker, status, signature, summary in executor.map(_export_ticker, [(ticker, data_root_dir, output_dir, chart_years) for ticker in todo], chunksize=chunksize):
+                if status == 'exported':
+                    manifest[ticker] = {'signature': signature, 'summary': summary}
+                    result['exported'].append(ticker)
+                elif status == 'missing':
+                    manifest.pop(ticker, None)
+                    result['missing'].append(ticker)
+                else:
+                    manifest.pop(ticker, None)
+                    result['failed'][ticker] = status
+                if verbose:
+                    n_done += 1
+                    print(f"\r[{n_done}/{len(todo)}] {ticker}: {status}" + " "*20, end='', flush=True)
+        if verbose:
+            print("")
+
+    manifest = {ticker: entry for ticker, entry in manifest.items() if ticker in tickers}
+    with open(manifest_file + ".tmp", "wb") as f:
+        pickle.dump(manifest, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(manifest_file + ".tmp", manifest_file)
+    _write_index_page(output_dir=output_dir, title=title, manifest=manifest)
+
+    if verbose:
+        print(f"{title}: {len(result['exported'])} exported, {len(result['skipped'])} unchanged, {len(result['missing'])} not in the local data store, {len(result['failed'])} failed ({time.time()-start_time:.1f} s) -> {join(output_dir, 'index.html')}")
+    return result
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ..__about__ import __version__
+
+import numpy as np
+import pandas as pd
+
+import os
+from os.path import join
+import pathlib
+import pickle
+import threading
+
+###########################################################################################
+
+# numeric fields of the yfinance info dict, stored as float64 columns
+fundamentals_numeric_fields = ['marketCap', 'enterpriseValue', 'beta',
+                               'forwardPE', 'trailingPE', 'pegRatio', 'enterpriseToEbitda', 'enterpriseToRevenue', 'priceToBook', 'priceToSalesTrailing12Months',
+                               'forwardEps', 'trailingEps', 'bookValue', 'profitMargins', 'returnOnEquity', 'returnOnAssets', 'earningsQuarterlyGrowth', 'revenueGrowth',
+                               'payoutRatio', 'dividendRate', 'dividendYield', 'trailingAnnualDividendRate', 'trailingAnnualDividendYield', 'fiveYearAvgDividendYield',
+                               'heldPercentInstitutions', 'heldPercentInsiders', 'sharesOutstanding', 'floatShares', 'shortRatio', 'shortPercentOfFloat',
+                               'previousClose', 'fiftyTwoWeekHigh', 'fiftyTwoWeekLow', 'fiftyDayAverage', 'twoHundredDayAverage', 'averageVolume',
+                               'targetMeanPrice', 'numberOfAnalystOpinions']
+
+# text fields of the yfinance info dict, stored as object (or category) columns
+fundamentals_text_fields = ['symbol', 'shortName', 'longName', 'quoteType', 'exchange', 'currency', 'country']
+fundamentals_category_fields = ['sector', 'industry']
+
+_fundamentals_lock = threading.RLock()
+_fundamentals_df = None
+_fundamentals_mtimes = None
+_fundamentals_root_dir = None
+
+def _fundamentals_snapshot_file(data_root_dir: str = None):
+    return pathlib.Path(join(data_root_dir, "ticker_data/fundamentals.pkl"))
+
+def _info_dict_files(data_dir: str = None):
+    """
+    returns {ticker: (info dict file, mtime_ns)} for all the info dicts in the local data store
+    """
+    files = {}
+    if not os.path.isdir(data_dir):
+        return files
+    suffix = "_info_dict.pkl"
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(suffix):
+                files[entry.name[:-len(suffix)]] = (entry.path, entry.stat().st_mtime_ns)
+    return files
+
+def fundamentals_row(ticker: str = None, info_dict: dict = None):
+    """
+    the raw (untyped) fundamentals of one ticker, from its cached info dict
+    """
+    info = info_dict.get('info')
+    if info is None:
+        info = {}
+    row = {field: info.get(field) for field in fundamentals_numeric_fields + fundamentals_text_fields + fundamentals_category_fields}
+    row['price_target'] = info_dict.get('price_target')
+    row['data_download_time'] = info_dict.get('data_download_time')
+    row['ticker'] = ticker
+    return row
+
+def _typed_fundamentals_df(rows: list = None):
+    columns = ['ticker'] + fundamentals_numeric_fields + ['price_target'] + fundamentals_text_fields + fundamentals_category_fields + ['data_download_time']
+    df = pd.DataFrame.from_records(rows, columns=columns).set_index('ticker')
+    for field in fundamentals_numeric_fields + ['price_target']:
+        df[field] = pd.to_numeric(df[field], errors='coerce').astype('float64').round(7) # rounded like Ticker.key_value()
+    for field in fundamentals_text_fields + fundamentals_category_fields:
+        df[field] = df[field].astype(object).where(df[field].notna(), None)
+    df['data_download_time'] = pd.to_datetime(df['data_download_time'], utc=True, errors='coerce')
+    return df
+
+def add_derived_fundamentals(df: pd.DataFrame = None):
+    """
+    add the columns derived from the info fields, in one vectorized pass (same definitions as the Ticker properties)
+
+    Eps_growth_rate = forwardPE / pegRatio
+    Eps_change_pct = 100 * (forwardEps - trailingEps) / |trailingEps|
+    """
+    peg = df['pegRatio'].where(df['pegRatio'] != 0)
+    df['Eps_growth_rate'] = (df['forwardPE'] / peg).round(7)
+    df['Eps_change_pct'] = 100 * (df['forwardEps'] - df['trailingEps']) / df['trailingEps'].abs()
+    df['Eps_change_pct'] = df['Eps_change_pct'].replace([np.inf, -np.inf], np.nan)
+    for field in fundamentals_category_fields:
+        df[field] = df[field].astype('category')
+    return df
+
+def get_fundamentals_df(tickers: list = None, data_root_dir: str = None, refresh: bool = True, verbose: bool = False):
+    """
+    a columnar snapshot of the fundamentals in the local data store: one row per ticker (index), one typed column per info field,
+    plus the derived columns Eps_growth_rate and Eps_change_pct
+
+    the snapshot is persisted under ticker_data/fundamentals.pkl; with refresh=True, only the info dicts that were added, modified or
+    removed since the last snapshot are (re)read. tickers selects a subset of the rows (tickers not in the store are left out)
+
+    the result is a copy of the snapshot, which the caller is free to modify
+    """
+    global _fundamentals_df
+    global _fundamentals_mtimes
+    global _fundamentals_root_dir
+
+    from ._ticker import global_data_root_dir
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+
+    with _fundamentals_lock:
+        snapshot_file = _fundamentals_snapshot_file(data_root_dir)
+        if _fundamentals_root_dir != data_root_dir:
+            _fundamentals_df = None
+            _fundamentals_root_dir = data_root_dir
+        if _fundamentals_df is None and snapshot_file.exists():
+            try:
+                with open(snapshot_file, "rb") as f:
+                    snapshot = pickle.load(f)
+                if snapshot.get('version') == __version__:
+                    _fundamentals_df = snapshot['fundamentals_df']
+                    _fundamentals_mtimes = snapshot['mtimes']
+            except:
+                pass
+        if _fundamentals_df is None:
+            _fundamentals_df = add_derived_fundamentals(_typed_fundamentals_df([]))
+            _fundamentals_mtimes = {}
+
+        if refresh:
+            files = _info_dict_files(join(data_root_dir, "ticker_data/yfinance"))
+            removed = [ticker for ticker in _fundamentals_mtimes.keys() if ticker not in files]
+            changed = [ticker for ticker, (_, mtime) in files.items() if _fundamentals_mtimes.get(ticker) != mtime]
+            if removed or changed:
+                rows = []
+                mtimes = dict(_fundamentals_mtimes)
+                for ticker in removed:
+                    mtimes.pop(ticker, None)
+                for ticker in changed:
+                    info_dict_file, mtime = files[ticker]
+                    try:
+                        with open(info_dict_file, "rb") as f:
+                            rows.append(fundamentals_row(ticker, pickle.load(f)))
+                        mtimes[ticker] = mtime
+                    except Exception as e:
+                        mtimes.pop(ticker, None)
+                        if verbose:
+                            print(f"ticker [{ticker}]: cannot read {info_dict_file}: {e}")
+                kept_df = _fundamentals_df.drop(index=removed+changed, errors='ignore')
+                kept_df = kept_df.drop(columns=['Eps_growth_rate', 'Eps_change_pct'])
+                for field in fundamentals_category_fields:
+                    kept_df[field] = kept_df[field].astype(object)
+                new_df = _typed_fundamentals_df(rows)
+                if len(kept_df) == 0:
+                    df = new_df
+                elif len(new_df) == 0:
+                    df = kept_df
+                else:
+                    df = pd.concat([kept_df, new_df], axis=0)
+                _fundamentals_df = add_derived_fundamentals(df.sort_index())
+                _fundamentals_mtimes = mtimes
+                if verbose:
+                    print(f"fundamentals snapshot: {len(changed)} tickers (re)read, {len(removed)} removed, {len(_fundamentals_df)} in total")
+                try:
+                    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+                    with open(str(snapshot_file) + ".tmp", "wb") as f:
+                        pickle.dump({'version': __version__, 'fundamentals_df': _fundamentals_df, 'mtimes': _fundamentals_mtimes}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(str(snapshot_file) + ".tmp", snapshot_file)
+                except OSError:
+                    pass
+
+        df = _fundamentals_df
+
+    if tickers is not None:
+        df = df[df.index.isin(tickers)]
+    return df.copy() # the snapshot is the session cache (and is persisted): never hand it out
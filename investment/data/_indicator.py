@@ -100,7 +100,10 @@ class volume_indicator(object):
         self.short_periods = short_periods
         self.long_periods = long_periods
         
-    def PVI_NVI(self, close_price: np.ndarray, volume: np.ndarray):
+    def PVI_NVI(self, close_price: np.ndarray, volume: np.ndarray, normalize: bool = True):
+        """
+        if normalize = False, PVI and NVI are not rescaled by their maxima (so that they stay causal, see history_indicators)
+        """
         if type(close_price) == pd.Series:
             close_price = close_price.to_numpy()
         if type(volume) == pd.Series:
@@ -127,8 +130,9 @@ class volume_indicator(object):
             else:
                 PVI[today_idx] = PVI[today_idx-1]
                 NVI[today_idx] = NVI[today_idx-1] + ((close_price[today_idx] - close_price[today_idx-1]) / close_price[today_idx-1] * NVI[today_idx-1])
-        PVI *= 1000/np.max(PVI)
-        NVI *= 1000/np.max(NVI)
+        if normalize:
+            PVI *= 1000/np.max(PVI)
+            NVI *= 1000/np.max(NVI)
         return PVI, NVI, moving_average(periods=self.short_periods).exponential(PVI), moving_average(periods=self.short_periods).exponential(NVI), moving_average(periods=self.long_periods).exponential(PVI), moving_average(periods=self.long_periods).exponential(NVI)
 
 
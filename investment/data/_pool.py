@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import os
+
+###########################################################################################
+
+def _chunks(items: list = None, n_processes: int = None, chunksize: int = None, max_chunksize: int = 50):
+    """
+    (n_processes, chunks of items): small chunks, for the progress and the cancellation, but large enough to amortize the inter-process calls
+    """
+    if n_processes is None:
+        n_processes = os.cpu_count() or 1
+    n_processes = max(1, min(n_processes, len(items)))
+    if chunksize is None:
+        chunksize = max(1, min(max_chunksize, len(items) // (n_processes * 8)))
+    return n_processes, [items[i:i+chunksize] for i in range(0, len(items), chunksize)]
+
+def _iter_pool_chunks(worker = None, chunks: list = None, args: tuple = (), n_processes: int = None, mp_context = None, cancel_event = None):
+    """
+    run worker((chunk, *args)) for each chunk on a pool of n_processes worker processes, yielding the results as the chunks complete
+
+    the run stops, and the pending chunks are cancelled, when cancel_event (a threading.Event) is set or the generator is closed
+    """
+    executor = ProcessPoolExecutor(max_workers=n_processes, mp_context=mp_context)
+    pending = set()
+    try:
+        pending = {executor.submit(worker, (chunk, *args)) for chunk in chunks}
+        while len(pending) > 0:
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            for future in done:
+                yield future.result()
+    finally:
+        # cancel the chunks not started yet (shutdown(cancel_futures=True) needs Python 3.9)
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ._pool import _chunks, _iter_pool_chunks
+
+import numpy as np
+import pandas as pd
+
+import time
+import zlib
+
+###########################################################################################
+
+price_target_horizon = 252 # bars: the price targets of the analysts are 1-year targets
+price_target_lookback = 1260 # bars: the return history the simulation is calibrated on (5 years)
+price_target_min_returns = 60 # the fewest daily returns to calibrate a simulation on
+price_target_methods = ['bootstrap', 'gbm']
+
+def ticker_seed(ticker: str = None, seed: int = 0):
+    """
+    the seed of the simulation of a ticker: stable across runs and processes, so that a Ticker and a group run agree
+    """
+    return np.random.SeedSequence([seed, zlib.crc32(str(ticker).encode())])
+
+def _calibration_returns(close = None, lookback: int = None):
+    close = np.asarray(close, dtype=float)
+    if lookback is not None:
+        close = close[-(lookback+1):]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.diff(np.log(close))
+    returns = returns[np.isfinite(returns)]
+    if len(returns) < price_target_min_returns:
+        raise ValueError(f"{len(returns)} daily returns, not enough history to simulate (at least {price_target_min_returns})")
+    return returns
+
+def _simulated_log_paths(returns = None, n_paths: int = None, horizon: int = None, method: str = None, block_length: int = None, rng = None):
+    """
+    n_paths x horizon cumulative log returns: a circular block bootstrap of the returns, or a GBM with their mean and std
+    """
+    if method == 'bootstrap':
+        n_blocks = -(-horizon // block_length)
+        starts = rng.integers(0, len(returns), size=(n_paths, n_blocks, 1))
+        index = ((starts + np.arange(block_length)) % len(returns)).reshape(n_paths, -1)[:, :horizon]
+        steps = returns[index]
+    else:
+        steps = rng.normal(returns.mean(), returns.std(ddof=1), size=(n_paths, horizon))
+    return np.cumsum(steps, axis=1)
+
+def simulate_price_target(close = None, price_target: float = None, horizon: int = price_target_horizon, n_paths: int = 10000, method: str = 'bootstrap', block_length: int = 20,
+                          lookback: int = price_target_lookback, chunk_paths: int = 2000, tolerance: float = 0.005, early_stop: bool = False, seed = None):
+    """
+    the Monte Carlo probability that the close reaches price_target (at or above it for a target above the last close, at or below
+    it otherwise) on a bar within the next horizon bars
+
+    the daily log returns of the last lookback bars calibrate the paths:
+        method='bootstrap': circular blocks of block_length consecutive returns (keeps the volatility clustering and the fat tails)
+        method='gbm': a geometric Brownian motion with the mean and std of the returns
+    the paths are simulated in chunks of chunk_paths (bounded memory); seed: an int or a SeedSequence (see ticker_seed())
+
+    returns a dict:
+        probability, std_error, CI_low, CI_high: the estimate, its binomial standard error and its 95% Wilson interval
+        n_paths: the number of paths simulated (fewer than requested if early_stop and the std_error reached tolerance)
+        converged: std_error <= tolerance; n_paths_needed: the paths for a std_error of tolerance at this probability
+        convergence: DataFrame of the running (n_paths, probability, std_error) after each chunk
+        runtime: seconds
+    raises ValueError for a price_target or a last close that is not a positive number, or too few returns
+    """
+    start_time = time.perf_counter()
+    if method not in price_target_methods:
+        raise ValueError(f"method should be one of {price_target_methods}, not [{method}]")
+    close = np.asarray(close, dtype=float)
+    last_close = float(close[-1]) if len(close) > 0 else np.nan
+    # a NaN target would never be reached: a silent probability of 0
+    if price_target is None or not (np.isfinite(price_target) and price_target > 0):
+        raise ValueError(f"the price target should be a positive number, not [{price_target}]")
+    if not (np.isfinite(last_close) and last_close > 0):
+        raise ValueError(f"the last close should be a positive number, not [{last_close}]")
+    returns = _calibration_returns(close, lookback)
+    target = np.log(price_target / last_close)
+    rng = np.random.default_rng(seed)
+    n_hits = 0
+    n_done = 0
+    trace = []
+    while n_done < n_paths:
+        m = min(chunk_paths, n_paths - n_done)
+        log_paths = _simulated_log_paths(returns, n_paths=m, horizon=horizon, method=method, block_length=max(1, int(block_length)), rng=rng)
+        if target >= 0:
+            n_hits += int(np.count_nonzero(log_paths.max(axis=1) >= target))
+        else:
+            n_hits += int(np.count_nonzero(log_paths.min(axis=1) <= target))
+        n_done += m
+        p = n_hits / n_done
+        std_error = float(np.sqrt(p*(1-p)/n_done))
+        trace.append((n_done, p, std_error))
+        if early_stop and std_error <= tolerance:
+            break
+    # 95% Wilson score interval (well-behaved near 0 and 1), which contains p (the bounds are clipped for the rounding at p = 0 or 1)
+    z = 1.959963984540054
+    center = (p + z*z/(2*n_done)) / (1 + z*z/n_done)
+    half_width = z*np.sqrt(p*(1-p)/n_done + z*z/(4*n_done*n_done)) / (1 + z*z/n_done)
+    return {'probability': p, 'std_error': std_error, 'CI_low': float(max(0.0, min(p, center - half_width))), 'CI_high': float(min(1.0, max(p, center + half_width))),
+            'n_paths': n_done, 'converged': bool(std_error <= tolerance), 'n_paths_needed': int(np.ceil(max(p*(1-p), 1/n_done) / tolerance**2)),
+            'convergence': pd.DataFrame(trace, columns=['n_paths', 'probability', 'std_error']),
+            'method': method, 'horizon': horizon, 'last_close': last_close, 'price_target': float(price_target),
+            'runtime': time.perf_counter() - start_time}
+
+###########################################################################################
+
+price_target_columns = ['ticker', 'last_close', 'price_target', 'upside_pct', 'probability', 'std_error', 'CI_low', 'CI_high', 'n_paths', 'converged', 'n_paths_needed', 'runtime']
+
+def _price_target_chunk(args):
+    """
+    simulate a chunk of tickers (runs in a worker process); returns [(ticker, row dict or None, status)]
+    """
+    tickers, data_root_dir, seed, kwargs = args
+    from ._data import load_local_ticker_data_dict
+    rows = []
+    for ticker in tickers:
+        try:
+            ticker_data_dict = load_local_ticker_data_dict(ticker=ticker, data_root_dir=data_root_dir)
+            if ticker_data_dict is None:
+                rows.append((ticker, None, 'missing'))
+                continue
+            price_target = ticker_data_dict.get('price_target')
+            if price_target is None or not price_target > 0:
+                rows.append((ticker, None, 'no price target'))
+                continue
+            close = ticker_data_dict['history']['Close'].to_numpy(dtype=float)
+            result = simulate_price_target(close, price_target, seed=ticker_seed(ticker, seed), **kwargs)
+            row = {column: result[column] for column in price_target_columns if column in result}
+            row['ticker'] = ticker
+            row['upside_pct'] = 100 * (price_target - result['last_close']) / result['last_close']
+            rows.append((ticker, row, 'simulated'))
+        except Exception as e:
+            rows.append((ticker, None, f'error: {e}'))
+    return rows
+
+def iter_price_target_probabilities(tickers: list = None, data_root_dir: str = None, seed: int = 0, n_processes: int = None, chunksize: int = None, mp_context = None, cancel_event = None, **kwargs):
+    """
+    simulate_price_target() for the tickers of the local data store with a price target, on a pool of n_processes worker processes
+    (default: one per core), yielding (n_done, n_total, rows) as each chunk of tickers completes, rows: [(ticker, row dict or None, status)]
+
+    kwargs go to simulate_price_target() (horizon, n_paths, method, ...); each ticker is seeded with ticker_seed(ticker, seed), so the
+    results do not depend on the chunking or the number of processes, and match Ticker.price_target_simulation for seed=0
+
+    the run stops, and the pending chunks are cancelled, when cancel_event (a threading.Event) is set or the generator is closed
+    """
+    from ._ticker import global_data_root_dir
+
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+    tickers = sorted(set(tickers))
+    n_total = len(tickers)
+    if n_total == 0:
+        return
+    n_processes, chunks = _chunks(tickers, n_processes=n_processes, chunksize=chunksize, max_chunksize=20)
+    n_done = 0
+    for rows in _iter_pool_chunks(_price_target_chunk, chunks, args=(data_root_dir, seed, kwargs), n_processes=n_processes, mp_context=mp_context, cancel_event=cancel_event):
+        n_done += len(rows)
+        yield n_done, n_total, rows
+
+def price_target_probabilities(tickers: list = None, data_root_dir: str = None, seed: int = 0, n_processes: int = None, verbose: bool = True, **kwargs):
+    """
+    iter_price_target_probabilities() run to completion: a DataFrame with one row per simulated ticker (price_target_columns), by
+    decreasing probability, with the tickers missing, without a price target and failed in df.attrs['missing'],
+    df.attrs['no_price_target'] and df.attrs['failed'] ({ticker: error})
+    """
+    start_time = time.time()
+    rows = []
+    for n_done, n_total, chunk_rows in iter_price_target_probabilities(tickers, data_root_dir=data_root_dir, seed=seed, n_processes=n_processes, **kwargs):
+        rows += chunk_rows
+        if verbose:
+            print(f"\r[{n_done}/{n_total}] simulated" + " "*20, end='', flush=True)
+    if verbose and len(rows) > 0:
+        print("")
+    df = pd.DataFrame([row for _, row, status in rows if status == 'simulated'], columns=price_target_columns)
+    df = df.sort_values(by=['probability', 'ticker'], ascending=[False, True], kind='mergesort').reset_index(drop=True)
+    df.attrs['missing'] = sorted(ticker for ticker, _, status in rows if status == 'missing')
+    df.attrs['no_price_target'] = sorted(ticker for ticker, _, status in rows if status == 'no price target')
+    df.attrs['failed'] = {ticker: status for ticker, _, status in rows if status.startswith('error')}
+    if verbose:
+        print(f"{len(df)} simulated ({df['runtime'].sum():.1f} s of simulation, {time.time()-start_time:.1f} s), {len(df.attrs['missing'])} not in the local data store, {len(df.attrs['no_price_target'])} without a price target, {len(df.attrs['failed'])} failed")
+    return df
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import pandas as pd
+
+from collections import OrderedDict
+import base64
+import hashlib
+import threading
+
+###########################################################################################
+
+_logo_base64_cache = OrderedDict()
+_logo_base64_lock = threading.Lock()
+
+def logo_base64(logo: bytes = None):
+    """
+    the base64 string of the logo image, encoded once per distinct logo
+    """
+    key = hashlib.md5(logo).digest()
+    with _logo_base64_lock:
+        if key not in _logo_base64_cache:
+            _logo_base64_cache[key] = str(base64.b64encode(logo), 'utf-8')
+            if len(_logo_base64_cache) > 256:
+                _logo_base64_cache.popitem(last=False)
+        return _logo_base64_cache[key]
+
+###########################################################################################
+# the sections of the ticker report: each one renders either HTML (use_html=True) or text
+
+def _name_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # name amd major indexes
+    # major index
+    df = pd.DataFrame({'DOW 30': this_ticker.in_dow30, 'NASDAQ 100': this_ticker.in_nasdaq100, 'S&P 500': this_ticker.in_sandp500, 'NASDAQ Composite': this_ticker.in_nasdaq_composite, 'Russell 1000': this_ticker.in_russell1000, 'Russell 2000': this_ticker.in_russell2000}, index=[0])
+    if use_html:
+        major_indexes_str = df.to_html(index=False).replace('<table border="1" class="dataframe">', '<table>').replace('True', '<b><span style=\"color:blue;\">True</span></b>').replace('False', '<span style=\"color:#D3D3D3;\">False</span>')
+    else:
+        major_indexes_str = df.to_string(index=False)
+    #
+    if use_html:
+        ticker_name = f"<b>{this_ticker.name}</b><br/><br/>Symbol: [{this_ticker.symbol}]<br/>{major_indexes_str}"
+    else:
+        ticker_name = f"{this_ticker.name}\n\nSymbol: [{this_ticker.symbol}]\n\n{major_indexes_str}"
+    return ticker_name
+
+
+def _stock_exchange_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # stock exchange listing info
+    stock_exchange_info = ""
+    if this_ticker.nasdaq_listed:
+        if use_html:
+            stock_exchange_info = f"<br/><hr>Nasdaq Listed<br/>- Name: [{this_ticker.nasdaq_security_name}]<br/>- Market category: [{this_ticker.nasdaq_market_category}]<br/>- Financial status: [{this_ticker.nasdaq_financial_status}]<br/>- ETF? [{this_ticker.nasdaq_etf}]"
+        else:
+            stock_exchange_info = f"\n\nNasdaq Listed\n- Name: [{this_ticker.nasdaq_security_name}]\n- Market category: [{this_ticker.nasdaq_market_category}]\n- Financial status: [{this_ticker.nasdaq_financial_status}]\n- ETF? [{this_ticker.nasdaq_etf}]"
+    elif this_ticker.non_nasdaq_listed:
+        if use_html:
+            stock_exchange_info = f"<br/><hr>Exchange: {this_ticker.non_nasdaq_exchange}<br/>- Name: [{this_ticker.non_nasdaq_security_name}]<br/>- ETF? [{this_ticker.non_nasdaq_etf}]"
+        else:
+            stock_exchange_info = f"\n\nExchange: {this_ticker.non_nasdaq_exchange}\n- Name: [{this_ticker.non_nasdaq_security_name}]\n- ETF? [{this_ticker.non_nasdaq_etf}]"
+    return stock_exchange_info
+
+
+def _sector_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # sector info
+    if use_html:
+        sector_info = f"<br/><hr>Sector info unavailable"
+    else:
+        sector_info = f"\n\nSector info unavailable"
+    if 'sector' in ticker_info_keys:
+        if use_html:
+            sector_info = f"<br/><hr>Sector: [{ticker_info['sector']}]"
+        else:
+            sector_info = f"\n\nSector: [{ticker_info['sector']}]"
+        if 'industry' in ticker_info_keys:
+            sector_info += f", Industry: [{ticker_info['industry']}]"
+    return sector_info
+
+
+def _earnings_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # earnings
+    if use_html:
+        earnings_info = f"<br/><hr>Earnings info unavailable"
+    else:
+        earnings_info = f"\n\nEarnings info unavailable"
+    if this_ticker.trailingEps is not None:
+        if use_html:
+            earnings_info = f"<br/><hr>Earnings per share (EPS) from the last four quarters: ${this_ticker.trailingEps:.2f}"
+        else:
+            earnings_info = f"\n\nEarnings per share (EPS) from the last four quarters: ${this_ticker.trailingEps:.2f}"
+        if this_ticker.forwardEps is not None:
+            if use_html:
+                earnings_info += f"<br/>EPS estimated for the next four quarters: ${this_ticker.forwardEps:.2f}, which is <b><span style=\"color:blue;\">{round(this_ticker.Eps_change_pct,2):+.2f}%</span></b>"
+            else:
+                earnings_info += f"\nEPS estimated for the next four quarters: ${this_ticker.forwardEps:.2f}, which is {round(this_ticker.Eps_change_pct,2):+.2f}%"
+        if this_ticker.Eps_growth_rate is not None:
+            if use_html:
+                earnings_info += f"<br/><br/>The 5-yr EPS growth rate is estimated to be <b><span style=\"color:blue;\">{this_ticker.Eps_growth_rate:+.2f}%</span></b> (compound rate per year)"
+            else:
+                earnings_info += f"\n\nThe 5-yr EPS growth rate is estimated to be {this_ticker.Eps_growth_rate:+.2f}% (compound rate per year)"
+    return earnings_info
+
+
+def _price_target_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # price target
+    if use_html:
+        price_target_info = f"<br/><hr>Price target info unavailable"
+    else:
+        price_target_info = f"\n\nPrice target info unavailable"
+    if this_ticker.price_target is not None:
+        up_side_pct = 100 * (this_ticker.price_target - this_ticker.last_close_price) / this_ticker.last_close_price
+        if use_html:
+            price_target_info = f"<br/><hr>1-yr price target: ${this_ticker.price_target} (<b><span style=\"color:blue;\">{up_side_pct:+.2f}%</span></b> upside)"
+        else:
+            price_target_info = f"\n\n1-yr price target: ${this_ticker.price_target} ({up_side_pct:+.2f}% upside)"
+    return price_target_info
+
+
+def _company_to_company_comparison_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # apples-to-apples comparison
+    # e.g., https://www.investopedia.com/terms/p/price-earningsratio.asp#investor-expectations
+    if use_html:
+        company_to_company_comparison_info = f"<br/><hr>Company-to-company comparison info unavailable"
+    else:
+        company_to_company_comparison_info = f"\n\nCompany-to-company comparison info unavailable"
+    if this_ticker.trailingPE is not None:
+        if use_html:
+            company_to_company_comparison_info = f"<br/><hr>For an apples-to-apples comparison, the ratio of current price to the earnings from the last four quarters (the trailing P/E, <b>the earnings multiple</b>): <b><span style=\"color:blue;\">{this_ticker.trailingPE:.2f}</span></b><br/><br/>A high P/E ratio could mean that an over-valued stock, or high expectation of growth rates in the future. Traditionally the P/E could be between 6 and 120, with a long-term mean of 15."
+        else:
+            company_to_company_comparison_info = f"\n\nFor an apples-to-apples comparison, the ratio of current price to the earnings from the last four quarters (the trailing P/E, the earnings multiple): {this_ticker.trailingPE:.2f} A high P/E ratio could mean that an over-valued stock, or high expectation of growth rates in the future. Traditionally the P/E could be between 6 and 120, with a long-term mean of 15."
+        if this_ticker.forwardPE is not None:
+            if use_html:
+                company_to_company_comparison_info += f"<br/><br/>The ratio of current price to the earnings estimated for the next four quarters (the forward P/E, <b>the earnings multiple</b>): <b><span style=\"color:blue;\">{this_ticker.forwardPE:.2f}</span></b>. If the forward P/E ratio is lower (or higher) than the trailing P/E ratio, it means analysts are expecting earnings to increase (or decrease)."
+            else:
+                company_to_company_comparison_info += f"\n\nThe ratio of current price to the earnings estimated for the next four quarters (the forward P/E, the earnings multiple): {this_ticker.forwardPE:.2f}. If the forward P/E ratio is lower (or higher) than the trailing P/E ratio, it means analysts are expecting earnings to increase (or decrease)."
+    if this_ticker.PEG_ratio is not None:
+        if use_html:
+            company_to_company_comparison_info += f"<br/><br/>The Price/Earnings-to-Growth (PEG) ratio is <b><span style=\"color:blue;\">{this_ticker.PEG_ratio}</span></b> (which is over-valued if &gt; 1.0, or under-valued if &lt; 1.0; in theory, the lower the PEG ratio the better, which implies paying less for future earnings growth.)"
+        else:
+            company_to_company_comparison_info += f"\n\nThe Price/Earnings-to-Growth (PEG) ratio is {this_ticker.PEG_ratio} (which is over-valued if > 1.0, or under-valued if < 1.0; in theory, the lower the PEG ratio the better, which implies paying less for future earnings growth.)"
+    return company_to_company_comparison_info
+
+
+def _shares_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # shares info
+    if use_html:
+        shares_info = f"<br/><hr>Share info unavailable"
+    else:
+        shares_info = f"\n\nShare info unavailable"
+    if 'floatShares' in ticker_info_keys and 'sharesOutstanding' in ticker_info_keys and 'marketCap' in ticker_info_keys:
+        floatShares = ticker_info['floatShares']
+        sharesOutstanding = ticker_info['sharesOutstanding']
+        marketCap = ticker_info['marketCap']
+        if floatShares is not None and sharesOutstanding is not None and marketCap is not None:
+            if sharesOutstanding > 1e9:
+                sharesOutstanding_info = f"{sharesOutstanding/1e9:.2f} billions"
+            else:
+                sharesOutstanding_info = f"{sharesOutstanding/1e6:.2f} millions"
+            if marketCap > 1e12:
+                marketCap_info = f"${marketCap/1e12:.2f} trillions"
+            elif marketCap > 1e9:
+                marketCap_info = f"${marketCap/1e9:.2f} billions"
+            else:
+                marketCap_info = f"${marketCap/1e6:.2f} millions"
+            if use_html:
+                shares_info = f"<br/><hr>Total number of shares issued: {sharesOutstanding_info} (<b><span style=\"color:blue;\">{floatShares/sharesOutstanding*100:.2f}%</span></b> freely tradable, which largely determines liquidity, while the other {100-floatShares/sharesOutstanding*100:.2f}% are held by institutions and insiders), and marketCap is {marketCap_info}."
+            else:
+                shares_info = f"\n\nTotal number of shares issued: {sharesOutstanding_info} ({floatShares/sharesOutstanding*100:.2f}% freely tradable, which largely determines liquidity, while the other {100-floatShares/sharesOutstanding*100:.2f}% are held by institutions and insiders), and marketCap is {marketCap_info}."
+    return shares_info
+
+
+def _profitability_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # profitability
+    if use_html:
+        profitability_info = f"<br/><hr>Profitability info unavailable"
+    else:
+        profitability_info = f"\n\nProfitability info unavailable"
+    if 'profitMargins' in ticker_info_keys:
+        profitMargins = ticker_info['profitMargins']
+        if profitMargins is not None:
+            if use_html:
+                profitability_info = f"<br/><hr>The business has generated {profitMargins*100:.2f}% profit out of each dollar of sale"
+            else:
+                profitability_info = f"\n\nThe business has generated {profitMargins*100:.2f}% profit out of each dollar of sale"
+    return profitability_info
+
+
+def _valuation_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # valuation analysis
+    # https://www.investopedia.com/terms/m/multiple.asp
+    if use_html:
+        valuation_info = f"<br/><hr>Valuation info unavailable"
+    else:
+        valuation_info = f"/n/nValuation info unavailable"
+    # method1: cash flow (intrinsic valuation)
+    # method2: multiple of performance (relative valuation)
+    if this_ticker.EV_to_EBITDA is not None:
+        if use_html:
+            valuation_info = f"<br/><hr>Valuation info. How much to buy a company? The firm's total value to its EBITDA (earnings before interest, taxes, depreciation, and amortization): <b><span style=\"color:blue;\">{this_ticker.EV_to_EBITDA:.2f}</span></b> (tends to be between 11-14, while below 10 is considered healthy; the lower, the better)"
+        else:
+            valuation_info = f"\n\nValuation info. How much to buy a company? The firm's total value to its EBITDA (earnings before interest, taxes, depreciation, and amortization): {this_ticker.EV_to_EBITDA:.2f} (which tends to be between 11-14, while below 10 is considered healthy; the lower, the better)"
+    return valuation_info
+
+
+def _institutions_holding_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # institutions
+    if use_html:
+        institutions_holding_info = f"<br/><hr>Institution holding info unavailable"
+    else:
+        institutions_holding_info = f"\n\nInstitution holding info unavailable"   
+    if 'heldPercentInstitutions' in ticker_info_keys:
+        percent_held_by_institutions = ticker_info['heldPercentInstitutions']
+        if percent_held_by_institutions is not None:
+            if use_html:
+                institutions_holding_info = f"<br/><hr>Shares held by institutions: {100*percent_held_by_institutions:.2f}%<br/><br/>- Large % could be risky: when there is bad news, the price may plunge.<br/>- Low % could have more upside.<br/>- Increase in % is a good sign."
+            else:
+                institutions_holding_info = f"\n\nShares held by institutions: {100*percent_held_by_institutions:.2f}%\n\n- Large % could be risky: when there is bad news, the price may plunge.\n- Low % could have more upside.\n- Increase in % is a good sign."
+            if 'institutional_holders' in ticker_data_dict.keys():
+                institutional_holders_df = ticker_data_dict['institutional_holders']
+                if institutional_holders_df is not None:
+                    if all(elem in institutional_holders_df.columns for elem in ['% Out','Value']):
+                        tmp_df = institutional_holders_df.drop(['% Out','Value'], axis=1, inplace=False) # axis: 0=row, 1=col
+                        if 'sharesOutstanding' in ticker_info_keys:
+                            sharesOutstanding = ticker_info['sharesOutstanding']
+                            if sharesOutstanding is not None:
+                                tmp_df['% Out'] = tmp_df['Shares'].apply(lambda x: f"{x/sharesOutstanding * 100:.2f}%")
+                                tmp_df['Shares (mil.)'] = round(tmp_df['Shares'] / 1e6, 2)
+                                if tmp_df['Shares'].max() * this_ticker.last_close_price / 1e9 < 1:
+                                    tmp_df['Curr Value(mil.$)'] = round(tmp_df['Shares'] * this_ticker.last_close_price / 1e6, 2)
+                                    tmp_df = tmp_df[['Holder','Shares (mil.)','Date Reported','% Out','Curr Value(mil.$)']]
+                                else:
+                                    tmp_df['Curr Value(bil.$)'] = round(tmp_df['Shares'] * this_ticker.last_close_price / 1e9, 2)
+                                    tmp_df = tmp_df[['Holder','Shares (mil.)','Date Reported','% Out','Curr Value(bil.$)']]                                   
+                        if use_html:
+                            institutions_holding_info += f"<br/><br/>Institutional Holders:{tmp_df.to_html(index=False)}"
+                        else:
+                            institutions_holding_info += f"\n\nInstitutional Holders:\n{tmp_df.to_string(index=False)}"
+    return institutions_holding_info
+
+
+def _dividends_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # dividends
+    if use_html:
+        dividends_info = f"<br/><hr>Dividends info unavailable"
+    else:
+        dividends_info = f"\n\nDividends info unavailable"
+    if ticker_data_dict['dividends'] is not None:
+        dividends_df = ticker_data_dict['dividends'].reset_index(level=0)
+        if len(dividends_df) == 0:
+            if use_html:
+                dividends_info = "<br/><hr>Dividends info never reported"
+            else:
+                dividends_info = "\n\nDividends info never reported"
+        else:
+            events_df = this_ticker.dividend_events.tail(10)
+            yield_str = events_df['yield_pct'].map(lambda x: "NA" if pd.isna(x) else f"{x:.2f}%")
+            dividends_str = events_df['Dividends'].map(lambda x: f"${x:.2f}")
+            dates = events_df['Date'].dt.date
+            if use_html:
+                dividends_info = f"<br/><hr>Most recent 10 reported dividends:"
+                dividends_info += pd.DataFrame({'Date': dates, 'Dividends': dividends_str, 'approx. Yield %': yield_str}).to_html(index=False)
+            else:
+                dividends_info = f"\n\nMost recent 10 reported dividends:\nDate\tDividends\tapprox. Yield %"
+                dividends_info += "".join([f"\n{d}\t{v}\t{y}" for d, v, y in zip(dates, dividends_str, yield_str)])
+            if use_html:
+                dividends_info += f"<br/><br/>Dividends yield in the past 12 mo: {this_ticker.last_1yr_dividends_pct:.2f}%"
+            else:
+                dividends_info += f"\n\nDividends yield in the past 12 mo: {this_ticker.last_1yr_dividends_pct:.2f}%"
+            if use_html:
+                dividends_info += f"<br/>Consecutive years of dividend growth: {this_ticker.dividend_growth_streak}"
+            else:
+                dividends_info += f"\nConsecutive years of dividend growth: {this_ticker.dividend_growth_streak}"
+            if 'payoutRatio' in ticker_info_keys:
+                payoutRatio = ticker_info['payoutRatio']
+                if payoutRatio is not None:
+                    if use_html:
+                        dividends_info += f"<br/><br/>As an evaluation of the dividend payment system, {payoutRatio*100:.2f}% of the earnings is paid out to shareholders."
+                    else:
+                        dividends_info += f"\n\nAs an evaluation of the dividend payment system, {payoutRatio*100:.2f}% of the earnings is paid out to shareholders."
+    return dividends_info
+
+
+def _risk_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # measures
+    if use_html:
+        risk_info = f"<br/><hr>Beta measure unavailable"
+    else:
+        risk_info = f"\n\nBeta measure unavailable"
+    # beta: covariance of stock with market
+    if 'beta' in ticker_info_keys:
+        beta = ticker_info['beta']
+        if beta is not None:
+            if use_html:
+                risk_info = f"<br/><hr>Beta: {beta:.2f}"
+            else:
+                risk_info = f"\n\nBeta: {beta:.2f}"
+            if beta > 1.00:
+                risk_info += f" (more volatile than the overall market)"
+            if beta <= 1.00:
+                risk_info += f" (less volatile than the overall market)"
+    return risk_info
+
+
+def _options_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # options
+    if use_html:
+        options_info = f"<br/><hr>Options info unavailable"
+    else:
+        options_info = f"\n\nOptions info unavailable"
+    if this_ticker.options is not None:
+        if use_html:
+            options_info = f"<br/><hr>Options expirations: {this_ticker.options}"
+        else:
+            options_info = f"\n\nOptions expirations: {this_ticker.options}"
+    return options_info
+
+
+def _option_chain_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # the most recent option chain (heavy: rendered on request)
+    option_chain_info = ""
+    if this_ticker.options is not None and len(this_ticker.options) > 0:
+        option_chain_df = this_ticker.option_chain(expiration_date = this_ticker.options[0])
+        if option_chain_df is not None:
+            if use_html:
+                option_chain_info = f"<br/><br/>The most recent one:{option_chain_df.to_html(index=False)}"
+            else:
+                option_chain_info = f"\n\nThe most recent one:{option_chain_df.to_string(index=False)}"
+    return option_chain_info
+
+
+def _recommendations_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # recommendations
+    if use_html:
+        recommendations_info = f"<br/><hr>Recommendations info unavailable"
+    else:
+        recommendations_info = f"\n\nRecommendations info unavailable"
+    if this_ticker.recommendations is not None:
+        recommend_n = 5
+        if use_html:
+            recommendations_info = f"<br/><hr>Recommendations (last {recommend_n}):<br\>" + this_ticker.recommendations.tail(recommend_n).to_html(index=False)
+        else:
+            recommendations_info = f"\n\nRecommendations (last {recommend_n}):\n" + this_ticker.recommendations.tail(recommend_n).to_string(index=False)
+    return recommendations_info
+
+
+def _long_business_summary_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # summary
+    if 'longBusinessSummary' in ticker_info_keys:
+        if use_html:
+            long_business_summary = f"<br/><hr>{this_ticker.longBusinessSummary}"
+        else:
+            long_business_summary = f"\n\n{this_ticker.longBusinessSummary}"
+    else:
+        long_business_summary = ""
+    return long_business_summary
+
+
+def _logo_section(this_ticker, ticker_data_dict, ticker_info, ticker_info_keys, use_html):
+    # logo
+    logo = ""
+    if 'logo' in ticker_info_keys:
+        if this_ticker.logo is not None:
+            if use_html:
+                logo = f"<br/><hr>Logo:<br/><img src=\"data:image/png;base64,{logo_base64(this_ticker.logo)}\">"
+            else:
+                if 'logo_url' in ticker_info_keys:
+                    logo = f"\n\nLogo: {ticker_info['logo_url']}"
+    return logo
+
+###########################################################################################
+
+# (name, render function, whether the section depends on the history, i.e. the last close, besides the info), in the report order
+report_sections = [('name',                          _name_section,                          False),
+                   ('stock_exchange',                _stock_exchange_section,                False),
+                   ('sector',                        _sector_section,                        False),
+                   ('earnings',                      _earnings_section,                      False),
+                   ('company_to_company_comparison', _company_to_company_comparison_section, False),
+                   ('shares',                        _shares_section,                        False),
+                   ('institutions_holding',          _institutions_holding_section,          True),
+                   ('profitability',                 _profitability_section,                 False),
+                   ('valuation',                     _valuation_section,                     False),
+                   ('dividends',                     _dividends_section,                     True),
+                   ('risk',                          _risk_section,                          False),
+                   ('options',                       _options_section,                       False),
+                   ('option_chain',                  _option_chain_section,                  False),
+                   ('recommendations',               _recommendations_section,               False),
+                   ('long_business_summary',         _long_business_summary_section,         False),
+                   ('price_target',                  _price_target_section,                  True),
+                   ('logo',                          _logo_section,                          False),]
+
+report_section_dict = {name: (func, depends_on_history) for name, func, depends_on_history in report_sections}
+
+option_chain_link = "<br/><br/><a href=\"investment:option_chain\">Show the most recent option chain</a>"
+
+
+class ticker_report(object):
+    def __init__(self, max_entries: int = 4096):
+        """
+        renders the report of get_formatted_ticker_data() section by section, caching each section by data version and output format,
+        so that rendering the same ticker data again only joins cached strings
+
+        the data version is the ticker and its download time (or the identity of its info dict, if the download time is unknown),
+        plus the last date and close for the sections that depend on the history
+        """
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def data_version(ticker_data_dict: dict = None):
+        """
+        returns (info version, history version, anchor): anchor is the object whose identity the info version relies on (or None)
+        """
+        info = ticker_data_dict.get('info')
+        download_time = ticker_data_dict.get('data_download_time')
+        if download_time is not None:
+            info_version = (ticker_data_dict.get('ticker'), download_time, ticker_data_dict.get('price_target'))
+            anchor = None
+        else:
+            info_version = (ticker_data_dict.get('ticker'), 'id', id(info))
+            anchor = info
+        history = ticker_data_dict.get('history')
+        if history is None or len(history) == 0:
+            history_version = None
+        else:
+            history_version = (history['Date'].iloc[-1], float(history['Close'].iloc[-1]), len(history))
+        return info_version, history_version, anchor
+
+    def section(self, name: str = None, ticker_data_dict: dict = None, use_html: bool = False, this_ticker = None, data_version = None):
+        """
+        one section of the report, e.g. section('option_chain', ticker_data_dict, use_html=True) to render it on request
+        """
+        func, depends_on_history = report_section_dict[name]
+        info_version, history_version, anchor = self.data_version(ticker_data_dict) if data_version is None else data_version
+        key = (info_version, history_version if depends_on_history else None, name, use_html)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] is anchor:
+                self._cache.move_to_end(key)
+                return entry[1]
+        if this_ticker is None:
+            from ._ticker import Ticker
+            this_ticker = Ticker(ticker_data_dict=ticker_data_dict)
+        ticker_info = ticker_data_dict['info']
+        text = func(this_ticker, ticker_data_dict, ticker_info, ticker_info.keys(), use_html)
+        with self._lock:
+            self._cache[key] = (anchor, text)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return text
+
+    def render(self, ticker_data_dict: dict = None, use_html: bool = False, include_option_chain: bool = True):
+        """
+        the whole report; with include_option_chain=False, the option chain table is left out (the HTML report links to it instead)
+        """
+        if use_html:
+            formatted_str = "<style>table, th, td {border: 1px solid black; border-collapse: collapse; padding: 2px;} body {font-family: Courier New;}</style><body>"
+        else:
+            formatted_str = ""
+
+        if ticker_data_dict.get('info') is None:
+            if use_html:
+                formatted_str += f"the key 'info' does not exist in ticker_data_dict</body>"
+            else:
+                formatted_str += f"the key 'info' does not exist in ticker_data_dict"
+            return formatted_str
+
+        data_version = self.data_version(ticker_data_dict)
+        this_ticker = _lazy_ticker(ticker_data_dict)
+        for name, _, _ in report_sections:
+            if name == 'option_chain' and not include_option_chain:
+                options = ticker_data_dict.get('options')
+                if use_html and options is not None and len(options) > 0 and ticker_data_dict.get('option_chain_dict') is not None:
+                    formatted_str += option_chain_link
+                continue
+            formatted_str += self.section(name, ticker_data_dict, use_html=use_html, this_ticker=this_ticker, data_version=data_version)
+        if use_html:
+            formatted_str += "</body>"
+        return formatted_str
+
+
+class _lazy_ticker(object):
+    """
+    a Ticker constructed on the first attribute access, i.e. only if a section is not cached
+    """
+    def __init__(self, ticker_data_dict: dict = None):
+        self._ticker_data_dict = ticker_data_dict
+        self._ticker = None
+
+    def __getattr__(self, name):
+        if self._ticker is None:
+            from ._ticker import Ticker
+            self._ticker = Ticker(ticker_data_dict=self._ticker_data_dict)
+        return getattr(self._ticker, name)
+
+
+ticker_report_engine = ticker_report()
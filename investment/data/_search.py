@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ..__about__ import __version__
+
+import numpy as np
+import pandas as pd
+
+import os
+from os.path import join
+import pathlib
+import pickle
+import re
+import threading
+
+###########################################################################################
+
+# the searchable fields of a ticker, and the score of a query word matching the start of a word of each field
+search_fields = ['symbol', 'name', 'sector', 'industry']
+search_field_scores = {'symbol': 60, 'name': 40, 'sector': 20, 'industry': 20}
+search_substring_score = 10 # a query word found anywhere (3+ characters, via the trigram index)
+search_exact_symbol_score = 100
+
+def _normalize(text: str = None):
+    return re.sub(r'[^0-9a-z.^$-]+', ' ', str(text).lower()).strip()
+
+def _trigrams(text: str = None):
+    return {text[i:i+3] for i in range(len(text)-2)}
+
+
+class ticker_search_index(object):
+    def __init__(self, records: list = None):
+        """
+        a search index over the symbol, security name, sector and industry of the tickers (records: [(ticker, name, sector, industry)])
+
+        prefix index: per field, the sorted words with the ticker of each, so that the tickers with a word starting with the
+        query word are a contiguous (binary-searched) range
+        trigram index: {trigram: sorted ticker ids} over all the fields, for substring matches of query words of 3+ characters
+
+        query() ranks the tickers matching all the query words by their scores (search_field_scores): see query()
+        """
+        records = sorted(set((str(ticker), *('' if v is None else str(v) for v in rest)) for ticker, *rest in records))
+        self.tickers = np.array([record[0] for record in records], dtype=object)
+        self.names = np.array([record[1] for record in records], dtype=object)
+        self.sectors = np.array([record[2] for record in records], dtype=object)
+        self.industries = np.array([record[3] for record in records], dtype=object)
+        self.ticker_id = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.symbol_lengths = np.array([len(ticker) for ticker in self.tickers], dtype=np.int32)
+        # prefix index
+        self.words = {}
+        self.word_ids = {}
+        for field, values in zip(search_fields, [self.tickers, self.names, self.sectors, self.industries]):
+            pairs = sorted({(word, i) for i, value in enumerate(values) for word in ([_normalize(value)] if field == 'symbol' else _normalize(value).split()) if word})
+            self.words[field] = np.array([word for word, _ in pairs], dtype=str)
+            self.word_ids[field] = np.array([i for _, i in pairs], dtype=np.int32)
+        # trigram index
+        self.texts = [' '.join(_normalize(value) for value in record) for record in records]
+        postings = {}
+        for i, text in enumerate(self.texts):
+            for trigram in _trigrams(text):
+                postings.setdefault(trigram, []).append(i)
+        self.trigram_ids = {trigram: np.array(ids, dtype=np.int32) for trigram, ids in postings.items()}
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def _prefix_ids(self, field: str = None, word: str = None):
+        words = self.words[field]
+        lo = np.searchsorted(words, word, side='left')
+        hi = np.searchsorted(words, word + '\uffff', side='left')
+        return self.word_ids[field][lo:hi]
+
+    def _substring_ids(self, word: str = None):
+        if len(word) < 3:
+            return np.empty(0, dtype=np.int32)
+        postings = [self.trigram_ids.get(trigram) for trigram in _trigrams(word)]
+        if any(ids is None for ids in postings):
+            return np.empty(0, dtype=np.int32)
+        postings.sort(key=len)
+        ids = postings[0]
+        for other in postings[1:]:
+            ids = np.intersect1d(ids, other, assume_unique=True)
+            if len(ids) == 0:
+                return ids
+        # the trigrams may be found apart: keep the true substring matches
+        return np.array([i for i in ids if word in self.texts[i]], dtype=np.int32)
+
+    def scores(self, text: str = None):
+        """
+        the score of every ticker for the query text (0: no match); a ticker matches if each word of the query is the start of a word
+        of one of its fields, or (3+ characters) a substring of them; the score adds up the best match of each word, plus a bonus
+        for the exact symbol
+        """
+        words = _normalize(text).split()
+        if len(words) == 0:
+            return np.zeros(len(self), dtype=np.int32)
+        total = np.zeros(len(self), dtype=np.int32)
+        matched = np.ones(len(self), dtype=bool)
+        for word in words:
+            score = np.zeros(len(self), dtype=np.int32)
+            score[self._substring_ids(word)] = search_substring_score
+            for field in ['sector', 'industry', 'name', 'symbol']: # increasing scores
+                score[self._prefix_ids(field, word)] = search_field_scores[field]
+            matched &= score > 0
+            total += score
+        exact = self.ticker_id.get(''.join(words).upper())
+        if exact is None:
+            exact = self.ticker_id.get(str(text).strip().upper())
+        if exact is not None:
+            total[exact] += search_exact_symbol_score
+        total[~matched] = 0
+        return total
+
+    def query_tickers(self, text: str = None, limit: int = 50, tickers: list = None):
+        """
+        the tickers matching the query text, best first (ties: shorter symbol first, then alphabetical); tickers restricts the result to a subset
+        """
+        total = self.scores(text)
+        if tickers is not None:
+            subset = np.zeros(len(self), dtype=bool)
+            subset[[self.ticker_id[ticker] for ticker in tickers if ticker in self.ticker_id]] = True
+            total[~subset] = 0
+        ids = np.nonzero(total)[0]
+        ids = ids[np.lexsort((ids, self.symbol_lengths[ids], -total[ids]))] # ids are in alphabetical order of the tickers
+        if limit is not None:
+            ids = ids[:limit]
+        return self.tickers[ids].tolist()
+
+    def query(self, text: str = None, limit: int = 50, tickers: list = None):
+        """
+        query_tickers() as a DataFrame with columns ticker, name, sector, industry and score
+        """
+        result = self.query_tickers(text, limit=limit, tickers=tickers)
+        ids = np.array([self.ticker_id[ticker] for ticker in result], dtype=np.int64)
+        return pd.DataFrame({'ticker': self.tickers[ids], 'name': self.names[ids], 'sector': self.sectors[ids], 'industry': self.industries[ids], 'score': self.scores(text)[ids]})
+
+    @classmethod
+    def from_universe(cls, universe_index=None, tickers: list = None):
+        """
+        the records of the given tickers (default: group 'All') from a universe_index: names from the nasdaqtrader listings,
+        sector and industry from the group/subgroup dicts
+        """
+        if tickers is None:
+            tickers = universe_index.group_sets.get('All', frozenset())
+        records = []
+        for ticker in tickers:
+            record = universe_index.nasdaq_records.get(ticker) or universe_index.non_nasdaq_records.get(ticker) or {}
+            records.append((ticker, record.get('Security Name'), universe_index.sector(ticker), universe_index.industry(ticker)))
+        return cls(records)
+
+###########################################################################################
+
+_search_index_lock = threading.RLock()
+_search_index = None
+_search_index_thread = None
+
+def _search_index_file(data_root_dir: str = None):
+    return pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/search_index.pkl"))
+
+def get_search_index(data_root_dir: str = None, wait: bool = True):
+    """
+    the ticker_search_index of the universe, built on first use and persisted (search_index.pkl) for the same universe snapshot
+
+    wait=False: never blocks, returns None (and starts start_search_index_build()) until the index is ready
+    """
+    global _search_index
+
+    index = _search_index
+    if index is not None:
+        return index
+    if not wait:
+        start_search_index_build(data_root_dir = data_root_dir)
+        return None
+    from ._ticker import global_data_root_dir, get_universe_index, _universe_snapshot_signature
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+    with _search_index_lock:
+        if _search_index is not None:
+            return _search_index
+        universe_index = get_universe_index()
+        signature = (__version__, _universe_snapshot_signature(data_root_dir))
+        index_file = _search_index_file(data_root_dir)
+        if index_file.exists():
+            try:
+                with open(index_file, "rb") as f:
+                    snapshot = pickle.load(f)
+                if snapshot.get('signature') == signature:
+                    _search_index = snapshot['search_index']
+                    return _search_index
+            except Exception:
+                pass
+        index = ticker_search_index.from_universe(universe_index)
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(str(index_file) + ".tmp", "wb") as f:
+                pickle.dump({'signature': signature, 'search_index': index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(str(index_file) + ".tmp", index_file)
+        except OSError:
+            pass # the persisted index is only a cache
+        _search_index = index
+        return index
+
+def start_search_index_build(data_root_dir: str = None):
+    """
+    build (or load) the search index in a daemon thread, so that the first query does not wait for it
+    """
+    global _search_index_thread
+    if _search_index is not None or (_search_index_thread is not None and _search_index_thread.is_alive()):
+        return _search_index_thread
+    _search_index_thread = threading.Thread(target=get_search_index, kwargs={'data_root_dir': data_root_dir}, name='search_index_build', daemon=True)
+    _search_index_thread.start()
+    return _search_index_thread
+
+def invalidate_search_index():
+    global _search_index
+    _search_index = None
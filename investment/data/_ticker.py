@@ -4,8 +4,13 @@
 #
 #  License: LGPL-3.0
 
-from ..math_and_stats import sigmoid
+from ..__about__ import __version__
+from ._calendar import trading_calendar
+from ._asof import history_indicators
+from ._dividend import dividend_events_df, last_1yr_dividends_pct, trailing_dividend_yield_df, dividend_growth_streak
+from ._price_target import simulate_price_target, ticker_seed
 
+import numpy as np
 import pandas as pd
 
 from datetime import datetime, timedelta, timezone
@@ -18,6 +23,9 @@ import ftplib
 import os
 from os.path import join
 import pathlib
+import pickle
+import re
+import threading
 
 # NASDAQ Composite Components:
 # https://indexes.nasdaqomx.com/Index/Weighting/COMP -> Export
@@ -32,18 +40,20 @@ import pathlib
 
 ###########################################################################################
 
-nasdaqlisted_df = pd.DataFrame()
-otherlisted_df = pd.DataFrame()
+# nasdaqlisted_df and otherlisted_df are loaded on first use (see load_universe() and __getattr__() below)
 options_df = pd.DataFrame()
 global_data_root_dir = join(str(pathlib.Path.home()), ".investment")
 
+nasdaqtrader_files = ['nasdaqlisted.txt', 'otherlisted.txt', 'options.txt']
+nasdaqtrader_max_age = timedelta(days=3)
+
 ###########################################################################################
 
-def Internet_connection_available():
+def Internet_connection_available(timeout: float = 3.0):
     try:
-        sock = socket.create_connection(("www.google.com", 80))
+        sock = socket.create_connection(("www.google.com", 80), timeout=timeout)
         if sock is not None:
-            sock.close
+            sock.close()
         return True
     except OSError:
         pass
@@ -52,7 +62,7 @@ def Internet_connection_available():
 # references:
 # https://quant.stackexchange.com/questions/1640/where-to-download-list-of-all-common-stocks-traded-on-nyse-nasdaq-and-amex
 # http://www.nasdaqtrader.com/trader.aspx?id=symboldirdefs
-def download_nasdaqtrader_data(data_root_dir: str = None):
+def download_nasdaqtrader_data(data_root_dir: str = None, timeout: float = 30.0):
     if data_root_dir is None:
          raise ValueError("Error: data_root_dir cannot be None")
 
@@ -65,100 +75,297 @@ def download_nasdaqtrader_data(data_root_dir: str = None):
     ftp_server = 'ftp.nasdaqtrader.com'
     ftp_username = 'anonymous'
     ftp_password = 'anonymous'
-    ftp = ftplib.FTP(ftp_server)
+    ftp = ftplib.FTP(ftp_server, timeout=timeout)
     ftp.login(ftp_username, ftp_password)
-    files = [('SymbolDirectory/nasdaqlisted.txt', join(data_dir, 'nasdaqlisted.txt')), 
-             ('SymbolDirectory/otherlisted.txt',  join(data_dir, 'otherlisted.txt' )),
-             ('SymbolDirectory/options.txt',      join(data_dir, 'options.txt'     ))]
+    files = [(f"SymbolDirectory/{file_name}", join(data_dir, file_name)) for file_name in nasdaqtrader_files]
     for file_ in files:
-        with open(file_[1], "wb") as f:
+        # write to a temporary file first, so that a reader never sees a half-downloaded file
+        with open(file_[1] + ".tmp", "wb") as f:
             ftp.retrbinary("RETR " + file_[0], f.write)
+        os.replace(file_[1] + ".tmp", file_[1])
     ftp.quit()
 
 
-def load_nasdaqtrader_data(data_root_dir: str = None):
-
+def nasdaqtrader_data_status(data_root_dir: str = None):
+    """
+    returns (missing, stale) for the nasdaqtrader files, without touching the network
+    """
     from ._data import timedata
 
+    if data_root_dir is None:
+        raise ValueError("Error: data_root_dir cannot be None")
+
+    missing = False
+    stale = False
+    for file_name in nasdaqtrader_files:
+        file_ = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader", file_name))
+        if file_.exists():
+            if timedata().now.datetime - timedata(time_stamp=file_.stat().st_ctime).datetime > nasdaqtrader_max_age: # creation time
+                stale = True
+        else:
+            missing = True
+    return missing, stale
+
+
+# NASDAQ/CQS symbols that yfinance knows under a different ticker
+ticker_special_cases = {'ACIC=': 'ACIC-UN',
+                        'AJAX=': 'AJAX-UN',
+                        'PRIF-A': 'PRIF-PA',
+                        'PRIF-B': 'PRIF-PB',
+                        'PRIF-C': 'PRIF-PC',
+                        'PRIF-D': 'PRIF-PD',
+                        'PRIF-E': 'PRIF-PE',
+                        'PRIF-F': 'PRIF-PF'}
+
+def normalize_symbols(symbols: pd.Series = None, special_cases: dict = None):
+    """
+    nasdaqtrader symbol -> yfinance ticker, e.g., 'BRK.B' -> 'BRK-B'
+    """
+    tickers = symbols.str.replace('.', '-', regex=False).str.replace('\\', '', regex=False)
+    if special_cases:
+        pattern = '|'.join(re.escape(key) for key in sorted(special_cases.keys(), key=len, reverse=True))
+        has_special_case = tickers.str.contains(pattern, regex=True)
+        if has_special_case.any():
+            tickers[has_special_case] = tickers[has_special_case].str.replace(pattern, lambda m: special_cases[m.group(0)], regex=True)
+    return tickers
+
+def read_nasdaqtrader_file(file_=None, symbol_column: str = None):
+    """
+    read a pipe-delimited symbol directory file with the C parser; the last line ('File Creation Time: ...') is dropped
+    """
+    df = pd.read_csv(file_, sep='|', header=0, dtype=str, keep_default_na=False, na_values=[''])
+    return df[~df[symbol_column].str.startswith('File Creation Time', na=False)]
+
+def preprocess_nasdaqtrader_data(data_root_dir: str = None):
+    """
+    parse nasdaqlisted.txt and otherlisted.txt, and compare them with the previous preprocessed.h5
+
+    returns nasdaqlisted_df, otherlisted_df, listing_diff (see diff_listings())
+    preprocessed.h5 is only rewritten when the listings have changed; delisted tickers are flagged in its 'delisted_df'
+    """
+    from ._universe import diff_listings
+
     if data_root_dir is None:
         raise ValueError("Error: data_root_dir cannot be None")
 
     file1 = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/nasdaqlisted.txt"))
     file2 = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/otherlisted.txt"))
-    file3 = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/options.txt"))
-
-    to_download = False
+    preprocessed_file = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/preprocessed.h5"))
+    #
+    nasdaqlisted_df = read_nasdaqtrader_file(file1, symbol_column='Symbol')
+    otherlisted_df = read_nasdaqtrader_file(file2, symbol_column='ACT Symbol')
+    #
+    nasdaqlisted_df['ticker'] = normalize_symbols(nasdaqlisted_df['Symbol'])
+    otherlisted_df['ticker'] = normalize_symbols(otherlisted_df['NASDAQ Symbol'], special_cases=ticker_special_cases)
+    #
+    nasdaqlisted_df = nasdaqlisted_df[ (nasdaqlisted_df['Test Issue'] == 'N') & (nasdaqlisted_df['NextShares'] == 'N') ].drop(['Test Issue','Symbol','NextShares','Round Lot Size'], axis=1)
+    otherlisted_df = otherlisted_df[ otherlisted_df['Test Issue'] == 'N' ].drop(['Test Issue','NASDAQ Symbol','ACT Symbol','CQS Symbol','Round Lot Size'], axis=1)
+    #
+    prev_nasdaqlisted_df = None
+    prev_otherlisted_df = None
+    delisted_df = pd.DataFrame(columns=['ticker', 'delisted_date'])
+    if preprocessed_file.exists():
+        data_store = pd.HDFStore(preprocessed_file, mode='r')
+        try:
+            prev_nasdaqlisted_df = data_store['nasdaqlisted_df']
+            prev_otherlisted_df = data_store['otherlisted_df']
+            if 'delisted_df' in data_store:
+                delisted_df = data_store['delisted_df']
+        except KeyError:
+            pass
+        data_store.close()
+    listing_diff = diff_listings(prev_nasdaqlisted_df, prev_otherlisted_df, nasdaqlisted_df, otherlisted_df)
+    #
+    if prev_nasdaqlisted_df is None or listing_diff['added'] or listing_diff['removed'] or listing_diff['changed']:
+        # tickers that are listed again are no longer flagged
+        delisted_df = delisted_df[ ~delisted_df['ticker'].isin(listing_diff['added']) ]
+        if listing_diff['removed']:
+            delisted_df = pd.concat([delisted_df, pd.DataFrame({'ticker': listing_diff['removed'], 'delisted_date': datetime.now(timezone.utc).strftime("%Y-%m-%d")})], axis=0).drop_duplicates(subset=['ticker'], keep='first')
+        data_store = pd.HDFStore(preprocessed_file, mode='w')
+        data_store['nasdaqlisted_df'] = nasdaqlisted_df
+        data_store['otherlisted_df'] = otherlisted_df
+        data_store['delisted_df'] = delisted_df.reset_index(drop=True)
+        data_store.close()
+    return nasdaqlisted_df, otherlisted_df, listing_diff
 
-    if file1.exists():
-        if timedata().now.datetime - timedata(time_stamp=file1.stat().st_ctime).datetime > timedelta(days=3): # creation time
-            to_download = True
-    else:
-        to_download = True
 
-    if file2.exists():
-        if timedata().now.datetime - timedata(time_stamp=file2.stat().st_ctime).datetime > timedelta(days=3): # creation time
-            to_download = True
-    else:
-        to_download = True
+def delisted_tickers(data_root_dir: str = None):
+    """
+    tickers that have disappeared from the nasdaqtrader listings since they were first seen, as flagged by preprocess_nasdaqtrader_data()
+    """
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+    preprocessed_file = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/preprocessed.h5"))
+    if not preprocessed_file.exists():
+        return []
+    data_store = pd.HDFStore(preprocessed_file, mode='r')
+    try:
+        if 'delisted_df' not in data_store:
+            return []
+        return data_store['delisted_df']['ticker'].tolist()
+    finally:
+        data_store.close()
 
-    if file3.exists():
-        if timedata().now.datetime - timedata(time_stamp=file3.stat().st_ctime).datetime > timedelta(days=3): # creation time
-            to_download = True
-    else:
-        to_download = True
 
+def prune_delisted_ticker_data(data_root_dir: str = None, dry_run: bool = True):
+    """
+    remove the cached yfinance data of delisted tickers that are not part of any ticker group; returns the affected files
+    """
+    if data_root_dir is None:
+        data_root_dir = global_data_root_dir
+    data_dir = join(data_root_dir, "ticker_data/yfinance")
+    index = get_universe_index()
+    files = []
+    for ticker in delisted_tickers(data_root_dir = data_root_dir):
+        if index.groups_of(ticker):
+            continue
+        for file_name in [f"{ticker}_history.csv", f"{ticker}_info_dict.pkl"]:
+            file_ = join(data_dir, file_name)
+            if os.path.isfile(file_):
+                files.append(file_)
+                if not dry_run:
+                    os.remove(file_)
+    return files
+
+
+def refresh_nasdaqtrader_data(data_root_dir: str = None, verbose: bool = False):
+    """
+    download the latest nasdaqtrader files; if the universe is already loaded, the listing changes are applied to it in place
+    """
     if not Internet_connection_available():
+        return False
+    try:
+        download_nasdaqtrader_data(data_root_dir = data_root_dir) # always get the most up-to-date version
+        new_nasdaqlisted_df, new_otherlisted_df, listing_diff = preprocess_nasdaqtrader_data(data_root_dir = data_root_dir)
+    except Exception as e:
+        if verbose:
+            print(f"Warning: unable to refresh data from ftp.nasdaqtrader.com: {e}")
+        return False
+    with _universe_lock:
+        if _universe_loaded:
+            apply_listing_diff(new_nasdaqlisted_df, new_otherlisted_df, listing_diff)
+            _save_universe_snapshot(data_root_dir = data_root_dir)
+    if verbose:
+        print(f"Data from ftp.nasdaqtrader.com refreshed: {len(listing_diff['added'])} added, {len(listing_diff['removed'])} removed, {len(listing_diff['changed'])} changed")
+    return True
+
+
+_refresh_thread = None
+
+def start_background_refresh(data_root_dir: str = None):
+    """
+    refresh stale nasdaqtrader files in a daemon thread, so that nothing waits for the network
+    """
+    global _refresh_thread
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return _refresh_thread
+    _refresh_thread = threading.Thread(target=refresh_nasdaqtrader_data, kwargs={'data_root_dir': data_root_dir}, name='nasdaqtrader_refresh', daemon=True)
+    _refresh_thread.start()
+    return _refresh_thread
+
+
+def load_nasdaqtrader_data(data_root_dir: str = None, background_refresh: bool = True, refresh: bool = True):
+    """
+    if the local files are stale and background_refresh is True, the current files are used and the refresh happens in a daemon thread;
+    with refresh=False, stale files are used as they are (only missing files are downloaded)
+    """
+    if data_root_dir is None:
+        raise ValueError("Error: data_root_dir cannot be None")
+
+    missing, stale = nasdaqtrader_data_status(data_root_dir = data_root_dir)
+    stale = stale and refresh
+
+    to_download = missing or (stale and not background_refresh)
+
+    if to_download and not Internet_connection_available():
         to_download = False
-        if (not file1.exists()) or (not file2.exists()) or (not file3.exists()):
+        if missing:
             raise RuntimeError("Internet is unavailable but the system depends on certain nasdaqtrader files to run")
 
     if to_download:
         print('Download data from ftp.nasdaqtrader.com ...', end='')
         download_nasdaqtrader_data(data_root_dir = data_root_dir) # always get the most up-to-date version
         print(' Done')
-        
+    elif stale:
+        start_background_refresh(data_root_dir = data_root_dir)
+
     global nasdaqlisted_df
     global otherlisted_df
-    global options_df
 
     #
     preprocessed_file = pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/preprocessed.h5"))
     if to_download or (not preprocessed_file.exists()):
-        #print('Creating preprocessed.h5 ...', end='')
-        #
-        nasdaqlisted_df = pd.read_csv(file1,sep='|',header=0,skipfooter=1,engine='python')
-        otherlisted_df = pd.read_csv(file2,sep='|',header=0,skipfooter=1,engine='python')
-        #options_df = pd.read_csv(file3,sep='|',header=0,skipfooter=1,engine='python')
-        #
-        nasdaqlisted_df['ticker'] = nasdaqlisted_df['Symbol'].str.replace('\.','\-').str.replace('\\','')
-        otherlisted_df['ticker'] = otherlisted_df['NASDAQ Symbol'].str.replace('\.','\-').str.replace('\\','').str.replace('ACIC=','ACIC-UN').str.replace('AJAX=','AJAX-UN').str.replace('PRIF-A','PRIF-PA').str.replace('PRIF-B','PRIF-PB').str.replace('PRIF-C','PRIF-PC').str.replace('PRIF-D','PRIF-PD').str.replace('PRIF-E','PRIF-PE').str.replace('PRIF-F','PRIF-PF')
-        #options_df['ticker'] = options_df['Underlying Symbol'].str.replace('\.','\-').str.replace('\\','')
-        #
-        nasdaqlisted_df = nasdaqlisted_df[ (nasdaqlisted_df['Test Issue'] == 'N') & (nasdaqlisted_df['NextShares'] == 'N') ].drop(['Test Issue','Symbol','NextShares','Round Lot Size'], axis=1)
-        otherlisted_df = otherlisted_df[ otherlisted_df['Test Issue'] == 'N' ].drop(['Test Issue','NASDAQ Symbol','ACT Symbol','CQS Symbol','Round Lot Size'], axis=1)
-        #options_df = options_df.drop(['Underlying Symbol'], axis=1)
-        #
-        data_store = pd.HDFStore(preprocessed_file)
-        data_store['nasdaqlisted_df'] = nasdaqlisted_df
-        data_store['otherlisted_df'] = otherlisted_df
-        #data_store['options_df'] = options_df
-        data_store.close()
-        #print('Done')
+        nasdaqlisted_df, otherlisted_df, _ = preprocess_nasdaqtrader_data(data_root_dir = data_root_dir)
     else:
-        #print('Reading preprocessed.h5 ... ', end='')
         data_store = pd.HDFStore(preprocessed_file)
         nasdaqlisted_df = data_store['nasdaqlisted_df']
         otherlisted_df = data_store['otherlisted_df']
-        #options_df = data_store['options_df']
         data_store.close()
-        #print('Done')
-
-load_nasdaqtrader_data(data_root_dir=global_data_root_dir)
    
 ###########################################################################################
 
+class lazy_group_dict(dict):
+    """
+    a dict that is completed by load_universe() the first time it is read
+    """
+    def __getitem__(self, key):
+        if not _universe_loaded:
+            load_universe()
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if not _universe_loaded:
+            load_universe()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        if not _universe_loaded:
+            load_universe()
+        return super().__iter__()
+
+    def __len__(self):
+        if not _universe_loaded:
+            load_universe()
+        return super().__len__()
+
+    def __repr__(self):
+        if not _universe_loaded:
+            load_universe()
+        return super().__repr__()
+
+    def get(self, key, default=None):
+        if not _universe_loaded:
+            load_universe()
+        return super().get(key, default)
+
+    def keys(self):
+        if not _universe_loaded:
+            load_universe()
+        return super().keys()
+
+    def values(self):
+        if not _universe_loaded:
+            load_universe()
+        return super().values()
+
+    def items(self):
+        if not _universe_loaded:
+            load_universe()
+        return super().items()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        invalidate_universe_index()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        invalidate_universe_index()
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
 # this one can be modified
-ticker_group_dict = {'All': [],
+ticker_group_dict = lazy_group_dict({'All': [],
                      'Basic Materials': ['DOW','HUN','EXP','AVTR','ECL','APD','DD','FNV','NEM','GDX','XLB'],
                      'Communication Services': ['CMCSA','DIS','EA','FB','GOOG','GOOGL','NFLX','ROKU','TMUS','VZ','ZM','T','TWTR','IRDM','TWLO','ESPO','XLC'],
                      'Consumer Cyclical': ['AMZN','BABA','HD','LOW','F','FIVE','JD','M','MCD','LGIH','MELI','PTON','NIO','NKE','OSTK','TSLA','TM','ARD','BERY','SBUX','BKNG','NCLH','W','XLY','FCAU'],
@@ -194,22 +401,12 @@ ticker_group_dict = {'All': [],
                      'Volatility': ['^VIX','VIXY','VXX','^VOLQ'],
                      'Treasury Yield': ['^TNX','SHV','TIP','FLOT','VUT','BND'],
                      'OTC Market': ['JCPNQ',],
-                     'Others': ['JWN','KSS','HMC','BRK-A','PROG','DS','OBSV']}
-
-ticker_group_dict['Russell 3000'] = sorted(ticker_group_dict['Russell 1000'] + ticker_group_dict['Russell 2000'])
-
-###########################################################################################
-
-df1 = nasdaqlisted_df[['ticker', 'ETF']]
-df2 = otherlisted_df[['ticker', 'ETF']]        
-df = pd.concat([df1, df2],axis=0)[['ticker', 'ETF']].reset_index().drop(['index'],axis=1) # axis=0 (1): row (column)
-ticker_group_dict['ETF database'] = df[ df['ETF'] == 'Y' ]['ticker'].tolist()
-ticker_group_dict['Equity database'] = df[ df['ETF'] == 'N' ]['ticker'].tolist()
+                     'Others': ['JWN','KSS','HMC','BRK-A','PROG','DS','OBSV']})
 
 ###########################################################################################
 
 # Note: there are 145 industries, and their names are unique
-subgroup_group_dict = {'All': [],
+subgroup_group_dict = lazy_group_dict({'All': [],
                        'Basic Materials': ['Aluminum','Specialty Chemicals','Chemicals','Coking Coal','Agricultural Inputs','Lumber & Wood Production','Gold','Other Industrial Metals & Mining','Steel','Paper & Paper Products','Building Materials','Copper','Other Precious Metals & Mining','Silver',],
                        'Communication Services': ['Entertainment','Telecom Services','Broadcasting','Internet Content & Information','Electronic Gaming & Multimedia','Advertising Agencies','Publishing',],
                        'Consumer Cyclical': ['Specialty Retail','Auto & Truck Dealerships','Gambling','Auto Parts','Apparel Retail','Textile Manufacturing','Packaging & Containers','Furnishings, Fixtures & Appliances','Internet Retail','Leisure','Restaurants','Auto Manufacturers','Personal Services','Travel Services','Resorts & Casinos','Residential Construction','Footwear & Accessories','Lodging','Apparel Manufacturing','Luxury Goods','Recreational Vehicles','Department Stores','Home Improvement Retail',],
@@ -220,7 +417,7 @@ subgroup_group_dict = {'All': [],
                        'Industrials': ['Airlines','Building Products & Equipment','Airports & Air Services','Aerospace & Defense','Specialty Business Services','Infrastructure Operations','Business Equipment & Supplies','Engineering & Construction','Pollution & Treatment Controls','Staffing & Employment Services','Security & Protection Services','Electrical Equipment & Parts','Farm & Heavy Construction Machinery','Specialty Industrial Machinery','Integrated Freight & Logistics','Industrial Distribution','Rental & Leasing Services','Waste Management','Trucking','Marine Shipping','Metal Fabrication','Consulting Services','Railroads','Tools & Accessories','Conglomerates',],
                        'Real Estate': ['REIT—Diversified','REIT—Mortgage','REIT—Residential','REIT—Retail','REIT—Specialty','REIT—Hotel & Motel','REIT—Office','Real Estate—Development','Real Estate Services','Real Estate—Diversified','REIT—Healthcare Facilities','REIT—Industrial',],
                        'Technology': ['Semiconductors','Consumer Electronics','Software—Application','Communication Equipment','Software—Infrastructure','Semiconductor Equipment & Materials','Information Technology Services','Electronics & Computer Distribution','Computer Hardware','Electronic Components','Solar','Scientific & Technical Instruments',],
-                       'Utilities': ['Utilities—Regulated Electric','Utilities—Diversified','Utilities—Regulated Water','Utilities—Independent Power Producers','Utilities—Regulated Gas','Utilities—Renewable',],}
+                       'Utilities': ['Utilities—Regulated Electric','Utilities—Diversified','Utilities—Regulated Water','Utilities—Independent Power Producers','Utilities—Regulated Gas','Utilities—Renewable',],})
 
 # this one is fixed for now (but can be re-generated by find_value_stock() if ticker_group_dict is substantially modified)
 # Note: there are 145 industries, and their names are unique
@@ -411,6 +608,14 @@ def ticker_preprocessing():
     global subgroup_group_dict
     global ticker_subgroup_dict
 
+    ticker_group_dict['Russell 3000'] = sorted(ticker_group_dict['Russell 1000'] + ticker_group_dict['Russell 2000'])
+
+    df1 = nasdaqlisted_df[['ticker', 'ETF']]
+    df2 = otherlisted_df[['ticker', 'ETF']]
+    df = pd.concat([df1, df2],axis=0)[['ticker', 'ETF']].reset_index().drop(['index'],axis=1) # axis=0 (1): row (column)
+    ticker_group_dict['ETF database'] = df[ df['ETF'] == 'Y' ]['ticker'].tolist()
+    ticker_group_dict['Equity database'] = df[ df['ETF'] == 'N' ]['ticker'].tolist()
+
     # make sure ticker_group_dict has everything
     for group in subgroup_group_dict.keys():
         for subgroup in subgroup_group_dict[group]:
@@ -435,15 +640,187 @@ def ticker_preprocessing():
         subgroup_group_dict[group] = sorted(subgroup_group_dict[group])
         subgroup_group_dict[group].insert(0, 'All')
 
-ticker_preprocessing()
+###########################################################################################
+
+_universe_lock = threading.RLock()
+_universe_loaded = False # set once the group dicts are complete: the other threads wait on _universe_lock until then
+_universe_loading = threading.local() # the loading thread reads the group dicts while completing them
+
+def _universe_snapshot_file(data_root_dir: str = None):
+    return pathlib.Path(join(data_root_dir, "ticker_data/nasdaqtrader/universe.pkl"))
+
+def _universe_snapshot_signature(data_root_dir: str = None):
+    """
+    the snapshot is only valid for the same package version, the same group definitions (this file) and the same nasdaqtrader files
+    """
+    signature = [__version__, os.stat(__file__).st_mtime_ns]
+    for file_name in nasdaqtrader_files[:2] + ['preprocessed.h5']:
+        file_ = join(data_root_dir, "ticker_data/nasdaqtrader", file_name)
+        signature.append(os.stat(file_).st_mtime_ns if os.path.isfile(file_) else None)
+    return tuple(signature)
+
+def _load_universe_snapshot(data_root_dir: str = None):
+    global nasdaqlisted_df
+    global otherlisted_df
+
+    snapshot_file = _universe_snapshot_file(data_root_dir)
+    if not snapshot_file.exists():
+        return False
+    try:
+        with open(snapshot_file, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return False
+    if snapshot.get('signature') != _universe_snapshot_signature(data_root_dir):
+        return False
+    nasdaqlisted_df = snapshot['nasdaqlisted_df']
+    otherlisted_df = snapshot['otherlisted_df']
+    dict.clear(ticker_group_dict)
+    dict.update(ticker_group_dict, snapshot['ticker_group_dict'])
+    dict.clear(subgroup_group_dict)
+    dict.update(subgroup_group_dict, snapshot['subgroup_group_dict'])
+    return True
+
+def _save_universe_snapshot(data_root_dir: str = None):
+    snapshot = {'signature': _universe_snapshot_signature(data_root_dir),
+                'nasdaqlisted_df': nasdaqlisted_df,
+                'otherlisted_df': otherlisted_df,
+                'ticker_group_dict': dict(ticker_group_dict.items()),
+                'subgroup_group_dict': dict(subgroup_group_dict.items())}
+    snapshot_file = _universe_snapshot_file(data_root_dir)
+    try:
+        with open(str(snapshot_file) + ".tmp", "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(str(snapshot_file) + ".tmp", snapshot_file)
+    except OSError:
+        pass # the snapshot is only a cache
+
+def load_universe(data_root_dir: str = None, refresh: bool = True):
+    """
+    load nasdaqlisted_df/otherlisted_df and complete ticker_group_dict/subgroup_group_dict, once per session
+
+    this is called on first use rather than at import time; a snapshot of the result (universe.pkl) is reused across sessions
+    refresh=False: stale nasdaqtrader files are used as they are, without a refresh (e.g. in worker processes)
+    """
+    global _universe_loaded
+
+    if _universe_loaded or getattr(_universe_loading, 'active', False):
+        return
+    with _universe_lock:
+        if _universe_loaded:
+            return
+        if data_root_dir is None:
+            data_root_dir = global_data_root_dir
+        _universe_loading.active = True
+        try:
+            missing, stale = nasdaqtrader_data_status(data_root_dir = data_root_dir)
+            if (not missing) and _load_universe_snapshot(data_root_dir = data_root_dir):
+                _universe_loaded = True
+                if stale and refresh:
+                    start_background_refresh(data_root_dir = data_root_dir)
+                return
+            load_nasdaqtrader_data(data_root_dir = data_root_dir, refresh = refresh)
+            ticker_preprocessing()
+            _universe_loaded = True
+            _save_universe_snapshot(data_root_dir = data_root_dir)
+        finally:
+            _universe_loading.active = False
+
+def apply_listing_diff(new_nasdaqlisted_df=None, new_otherlisted_df=None, listing_diff=None):
+    """
+    pick up new listings (and drop delisted ones) in the loaded universe, without rerunning ticker_preprocessing()
+    """
+    global nasdaqlisted_df
+    global otherlisted_df
+
+    with _universe_lock:
+        nasdaqlisted_df = new_nasdaqlisted_df
+        otherlisted_df = new_otherlisted_df
+        touched = listing_diff['added'] + listing_diff['changed']
+        etf_flag = dict(zip(new_nasdaqlisted_df['ticker'], new_nasdaqlisted_df['ETF']))
+        etf_flag.update(zip(new_otherlisted_df['ticker'], new_otherlisted_df['ETF']))
+        etf_set = set(dict.__getitem__(ticker_group_dict, 'ETF database'))
+        equity_set = set(dict.__getitem__(ticker_group_dict, 'Equity database'))
+        for ticker in listing_diff['removed'] + listing_diff['changed']:
+            etf_set.discard(ticker)
+            equity_set.discard(ticker)
+        for ticker in touched:
+            if etf_flag.get(ticker) == 'Y':
+                etf_set.add(ticker)
+            elif etf_flag.get(ticker) == 'N':
+                equity_set.add(ticker)
+        # a delisted ticker stays in 'All' if it is still part of a hand-made group
+        all_set = set(dict.__getitem__(ticker_group_dict, 'All')) | set(listing_diff['added'])
+        other_groups = [tickers for group, tickers in dict.items(ticker_group_dict) if group not in ['All', 'ETF database', 'Equity database']]
+        for ticker in listing_diff['removed']:
+            if not any(ticker in tickers for tickers in other_groups):
+                all_set.discard(ticker)
+        dict.__setitem__(ticker_group_dict, 'ETF database', sorted(etf_set))
+        dict.__setitem__(ticker_group_dict, 'Equity database', sorted(equity_set))
+        dict.__setitem__(ticker_group_dict, 'All', sorted(all_set))
+        from ._search import invalidate_search_index
+        invalidate_search_index()
+        if _universe_index is not None:
+            _universe_index.apply_listing_diff(nasdaqlisted_df=nasdaqlisted_df, otherlisted_df=otherlisted_df, listing_diff=listing_diff, ticker_group_dict=ticker_group_dict, groups=['ETF database', 'Equity database', 'All'])
+
+_universe_index = None
+
+def get_universe_index():
+    """
+    the universe_index for the current group dicts and listings, built on first use
+
+    note: assigning to ticker_group_dict invalidates it; after mutating a group list in place, call invalidate_universe_index()
+    """
+    global _universe_index
+    index = _universe_index
+    if index is None:
+        from ._universe import universe_index
+        load_universe()
+        with _universe_lock:
+            index = _universe_index = universe_index(ticker_group_dict=ticker_group_dict, subgroup_group_dict=subgroup_group_dict, ticker_subgroup_dict=ticker_subgroup_dict, nasdaqlisted_df=nasdaqlisted_df, otherlisted_df=otherlisted_df)
+    return index
+
+def invalidate_universe_index():
+    global _universe_index
+    _universe_index = None
+
+def __getattr__(name):
+    # PEP 562: nasdaqlisted_df and otherlisted_df become module attributes once the universe is loaded
+    if name in ['nasdaqlisted_df', 'otherlisted_df']:
+        load_universe()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 ###########################################################################################
 
+def memoized_property(func):
+    """
+    a read-only property computed once per Ticker, and recomputed only after its ticker data dict (or the dict's 'info' / 'history') is replaced
+    """
+    name = func.__name__
+    def getter(self):
+        cache = self._valid_cache()
+        if name not in cache:
+            cache[name] = func(self)
+        return cache[name]
+    getter.__name__ = name
+    getter.__doc__ = func.__doc__
+    return property(getter)
+
+
 class Ticker(object):
+    __slots__ = ['ticker', '_ticker_data_dict', '_cache', '_cache_info', '_cache_history']
+
     def __init__(self, ticker=None, ticker_data_dict=None, last_date=None, keep_up_to_date=False):
         """
         if keep_up_to_date = True ==> try to download the lastest data so it's as new as today
+
+        a Ticker built from a ticker_data_dict does not load the universe: it is loaded on first use (see get_universe_index)
         """
+        self._ticker_data_dict = None
+        self._cache = {}
+        self._cache_info = None
+        self._cache_history = None
         if ticker is None:
             if ticker_data_dict is None:
                 raise ValueError('error')
@@ -453,35 +830,78 @@ class Ticker(object):
         else:
             if ticker_data_dict is None:
                 from ._data import get_ticker_data_dict
+                load_universe()
                 self.ticker = ticker
                 self.ticker_data_dict = get_ticker_data_dict(ticker=self.ticker, last_date=last_date, keep_up_to_date=keep_up_to_date, download_today_data=True)
             else:
                 self.ticker_data_dict = ticker_data_dict
                 self.ticker = ticker_data_dict['ticker']
 
+    @classmethod
+    def from_store(cls, tickers: list = None, last_date = None, data_root_dir: str = None, with_history: bool = True, verbose: bool = False):
+        """
+        build many Tickers from the local data store in one go (no download), returns {ticker: Ticker}
+
+        tickers not in the store are skipped; with_history=False skips parsing the history csv, for info-only screening
+        """
+        from ._data import load_local_ticker_data_dict
+        load_universe(data_root_dir)
+        ticker_dict = {}
+        for ticker in tickers:
+            try:
+                ticker_data_dict = load_local_ticker_data_dict(ticker=ticker, last_date=last_date, data_root_dir=data_root_dir, with_history=with_history)
+            except Exception as e:
+                if verbose:
+                    print(f'ticker [{ticker}]: {e}')
+                continue
+            if ticker_data_dict is None:
+                if verbose:
+                    print(f'ticker [{ticker}] is not in the local data store')
+                continue
+            ticker_dict[ticker_data_dict['ticker']] = cls(ticker_data_dict=ticker_data_dict)
+        return ticker_dict
+
+    @property
+    def ticker_data_dict(self):
+        return self._ticker_data_dict
+
+    @ticker_data_dict.setter
+    def ticker_data_dict(self, ticker_data_dict):
+        self._ticker_data_dict = ticker_data_dict
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        drop the memoized metrics, e.g. after modifying the ticker data dict in place
+        """
+        self._cache = {}
+        self._cache_info = None
+        self._cache_history = None
+
+    def _valid_cache(self):
+        info = self._ticker_data_dict.get('info')
+        history = self._ticker_data_dict.get('history')
+        if info is not self._cache_info or history is not self._cache_history:
+            self._cache = {}
+            self._cache_info = info
+            self._cache_history = history
+        return self._cache
+
     @property
     def nasdaq_listed(self):
-        df = nasdaqlisted_df[ nasdaqlisted_df['ticker'] == self.ticker ]
-        n_len = len(df)
-        if n_len == 0:
-            return False
-        elif n_len == 1:
-            return True
-        else:
-            raise ValueError(f'self.ticker = {self.ticker}, n_len should not be >1')
+        return get_universe_index().nasdaq_record(self.ticker) is not None
 
     @property
     def nasdaq_security_name(self):
         if self.nasdaq_listed:
-            sn = nasdaqlisted_df[ nasdaqlisted_df['ticker'] == self.ticker ]['Security Name'].iloc[0]
-            return sn
+            return get_universe_index().nasdaq_record(self.ticker)['Security Name']
         else:
             raise ValueError("this question should be asked for NASDAQ-listed ticker only")
 
     @property
     def nasdaq_market_category(self):
         if self.nasdaq_listed:
-            mc = nasdaqlisted_df[ nasdaqlisted_df['ticker'] == self.ticker ]['Market Category'].iloc[0]
+            mc = get_universe_index().nasdaq_record(self.ticker)['Market Category']
             mc_dict = {'Q': 'NASDAQ Global Select MarketSM', 'G': 'NASDAQ Global MarketSM', 'S': 'NASDAQ Capital Market'}
             return mc_dict[mc]
         else:
@@ -490,7 +910,7 @@ class Ticker(object):
     @property
     def nasdaq_financial_status(self):
         if self.nasdaq_listed:
-            fs = nasdaqlisted_df[ nasdaqlisted_df['ticker'] == self.ticker ]['Financial Status'].iloc[0]
+            fs = get_universe_index().nasdaq_record(self.ticker)['Financial Status']
             fs_dict = {'D': 'Deficient: Issuer Failed to Meet NASDAQ Continued Listing Requirements',
                        'E': 'Delinquent: Issuer Missed Regulatory Filing Deadline',
                        'Q': 'Bankrupt: Issuer Has Filed for Bankruptcy',
@@ -506,7 +926,7 @@ class Ticker(object):
     @property
     def nasdaq_etf(self):
         if self.nasdaq_listed:
-            etf = nasdaqlisted_df[ nasdaqlisted_df['ticker'] == self.ticker ]['ETF'].iloc[0]
+            etf = get_universe_index().nasdaq_record(self.ticker)['ETF']
             if etf == 'Y':
                 return True
             elif etf == 'N':
@@ -518,27 +938,19 @@ class Ticker(object):
 
     @property
     def non_nasdaq_listed(self):
-        df = otherlisted_df[ otherlisted_df['ticker'] == self.ticker ]
-        n_len = len(df)
-        if n_len == 0:
-            return False
-        elif n_len == 1:
-            return True
-        else:
-            raise ValueError(f'self.ticker = {self.ticker}, n_len should not be >1')
+        return get_universe_index().non_nasdaq_record(self.ticker) is not None
 
     @property
     def non_nasdaq_security_name(self):
         if self.non_nasdaq_listed:
-            sn = otherlisted_df[ otherlisted_df['ticker'] == self.ticker ]['Security Name'].iloc[0]
-            return sn
+            return get_universe_index().non_nasdaq_record(self.ticker)['Security Name']
         else:
             raise ValueError("this question should be asked for non-NASDAQ-listed ticker only")
 
     @property
     def non_nasdaq_exchange(self):
         if self.non_nasdaq_listed:
-            ex = otherlisted_df[ otherlisted_df['ticker'] == self.ticker ]['Exchange'].iloc[0]
+            ex = get_universe_index().non_nasdaq_record(self.ticker)['Exchange']
             ex_dict = {'A': 'NYSE MKT',
                        'N': 'New York Stock Exchange (NYSE)',
                        'P': 'NYSE ARCA',
@@ -551,7 +963,7 @@ class Ticker(object):
     @property
     def non_nasdaq_etf(self):
         if self.non_nasdaq_listed:
-            etf = otherlisted_df[ otherlisted_df['ticker'] == self.ticker ]['ETF'].iloc[0]
+            etf = get_universe_index().non_nasdaq_record(self.ticker)['ETF']
             if etf == 'Y':
                 return True
             elif etf == 'N':
@@ -563,59 +975,56 @@ class Ticker(object):
 
     @property
     def is_etf(self):
-        if (self.ticker in ticker_group_dict['ETF']) or (self.ticker in ticker_group_dict['ETF database']):
-            return True
-        else:
-            return False
-        
+        index = get_universe_index()
+        return index.in_group(self.ticker, 'ETF') or index.in_group(self.ticker, 'ETF database')
+
     @property
     def in_dow30(self):
-        if self.ticker in ticker_group_dict['DOW 30']:
-            return True
-        else:
-            return False
+        return get_universe_index().in_group(self.ticker, 'DOW 30')
 
     @property
     def in_nasdaq100(self):
-        if self.ticker in ticker_group_dict['NASDAQ 100']:
-            return True
-        else:
-            return False
+        return get_universe_index().in_group(self.ticker, 'NASDAQ 100')
 
     @property
     def in_sandp500(self):
-        if self.ticker in ticker_group_dict['S&P 500']:
-            return True
-        else:
-            return False
+        return get_universe_index().in_group(self.ticker, 'S&P 500')
 
     @property
     def in_russell1000(self):
-        if self.ticker in ticker_group_dict['Russell 1000']:
-            return True
-        else:
-            return False
+        return get_universe_index().in_group(self.ticker, 'Russell 1000')
 
     @property
     def in_russell2000(self):
-        if self.ticker in ticker_group_dict['Russell 2000']:
-            return True
-        else:
-            return False
+        return get_universe_index().in_group(self.ticker, 'Russell 2000')
 
     @property
     def in_russell3000(self):
-        if self.ticker in ticker_group_dict['Russell 3000']:
-            return True
-        else:
-            return False
+        return get_universe_index().in_group(self.ticker, 'Russell 3000')
 
     @property
     def in_nasdaq_composite(self):
-        if self.ticker in ticker_group_dict['NASDAQ Composite']:
-            return True
-        else:
-            return False       
+        return get_universe_index().in_group(self.ticker, 'NASDAQ Composite')
+
+    @property
+    def industry(self):
+        """
+        the industry (subgroup) in ticker_subgroup_dict, or the one reported by yfinance
+        """
+        industry = get_universe_index().industry(self.ticker)
+        if industry is None and self.ticker_info is not None:
+            industry = self.ticker_info.get('industry')
+        return industry
+
+    @property
+    def sector(self):
+        """
+        the sector (group) in subgroup_group_dict, or the one reported by yfinance
+        """
+        sector = get_universe_index().sector(self.ticker)
+        if sector is None and self.ticker_info is not None:
+            sector = self.ticker_info.get('sector')
+        return sector
 
     @property
     def symbol(self):
@@ -686,7 +1095,7 @@ class Ticker(object):
     def ticker_history(self):
         return self.ticker_data_dict['history']
 
-    @property
+    @memoized_property
     def last_date(self):
         return self.ticker_history['Date'].iloc[-1]
 
@@ -694,29 +1103,48 @@ class Ticker(object):
     def last_date_dayname(self):
         return day_name[self.last_date.weekday()]
         
-    @property
+    @memoized_property
     def last_close_price(self):
         return self.ticker_history['Close'].iloc[-1]
 
+    @memoized_property
+    def calendar(self):
+        """
+        the trading_calendar of the ticker history: date lookups as integer bar indices
+        """
+        return trading_calendar(self.ticker_history['Date'])
+
     def nearest_actual_date(self, target_date):
-        idx = self.ticker_history['Date'].searchsorted(target_date)
+        """
+        the first trading date at or after target_date (the last one if target_date is beyond all available dates)
+        """
+        idx = min( int(self.calendar.next(target_date)), len(self.calendar) - 1 )
         return self.ticker_history['Date'].iloc[idx]
 
     def close_price_on_date(self, target_date):
-        max_idx = len(self.ticker_history) - 1
-        idx = min( self.ticker_history['Date'].searchsorted(target_date), max_idx ) # if the date is beyond all available dates, idx could be max_idx+1
-        #df = self.ticker_history[self.ticker_history['Date'] == target_date]
-        #if len(df) != 1:
-        #    raise ValueError('not exactly 1 match here')
+        idx = min( int(self.calendar.next(target_date)), len(self.calendar) - 1 ) # if the date is beyond all available dates, idx could be max_idx+1
         return float(self.ticker_history['Close'].iloc[idx]), self.ticker_history['Date'].iloc[idx]
 
+    def close_prices_on_dates(self, target_dates):
+        """
+        vectorized close_price_on_date: returns (close prices, actual dates) for an array of target dates
+        """
+        idx = np.minimum( self.calendar.next(target_dates), len(self.calendar) - 1 )
+        return self.ticker_history['Close'].to_numpy(dtype=float)[idx], self.calendar.date(idx)
+
     def key_value(self, this_key):
+        cache = self._valid_cache()
+        cache_key = ('key_value', this_key)
+        if cache_key in cache:
+            return cache[cache_key]
+        value = None
         if this_key is not None:
             if self.ticker_info is not None:
                 if this_key in self.ticker_info.keys():
                     if self.ticker_info[this_key] is not None:
-                        return round(self.ticker_info[this_key],7)
-        return None
+                        value = round(self.ticker_info[this_key],7)
+        cache[cache_key] = value
+        return value
 
     @property
     def price_target(self):
@@ -725,43 +1153,62 @@ class Ticker(object):
         else:
             return None
 
-    @property
+    @memoized_property
     def price_target_upside_pct(self):
         if self.price_target is None:
             return None
         else:
             return 100 * (self.price_target - self.last_close_price) / self.last_close_price
 
-    @property
+    @memoized_property
+    def price_target_simulation(self):
+        """
+        the Monte Carlo simulation of the close reaching the 1-year price target within a year (see simulate_price_target)
+        """
+        if self.price_target is None:
+            return None
+        try:
+            return simulate_price_target(self.ticker_history['Close'].to_numpy(dtype=float), self.price_target, seed=ticker_seed(self.ticker))
+        except ValueError: # not enough history, or no valid price target or last close
+            return None
+
+    @memoized_property
     def prob_price_target_upside(self):
-        if self.price_target_upside_pct is not None: 
-            return sigmoid(self.price_target_upside_pct/100)
+        """
+        the probability that the close reaches the price target within a year
+        """
+        if self.price_target_simulation is not None:
+            return self.price_target_simulation['probability']
         return None
 
-    @property
+    @memoized_property
     def last_1yr_dividends_pct(self):
         if self.pay_dividends:
-            if 'trailingAnnualDividendYield' in self.ticker_info.keys() and self.ticker_info['trailingAnnualDividendYield'] is not None:
-                return self.ticker_info['trailingAnnualDividendYield'] * 100
-            else:
-                dividends_df = self.ticker_data_dict['dividends'].reset_index(level=0)
-                dividends_df['Date'] = pd.to_datetime(dividends_df['Date'], format='%Y-%m-%d', utc=True)
-                last_1yr_dividends_df = dividends_df[ dividends_df['Date'] > (datetime.now(tz=timezone.utc) - timedelta(days=365.25)) ]
-                date_close_df = self.ticker_data_dict['history'][['Date','Close']]
-                dividends_info_df = pd.DataFrame(columns=['date','dividends','yield_pct'])
-                for idx, row in last_1yr_dividends_df.iterrows():
-                    try:
-                        close_price_on_this_date = float(date_close_df[date_close_df.Date == row['Date']].Close)
-                        dividends_yield_percent = 100*row['Dividends']/close_price_on_this_date
-                    except:
-                        dividends_yield_percent = 0
-                    dividends_info_df = dividends_info_df.append({'date': row['Date'].date(), 'dividends': row['Dividends'], 'yield_pct': dividends_yield_percent}, ignore_index = True)
-                #print(dividends_info_df)
-                if len(dividends_info_df) > 0:
-                    return dividends_info_df['yield_pct'].sum()
+            return last_1yr_dividends_pct(self.ticker_data_dict, events_df=self.dividend_events)
         return 0
 
-    @property
+    @memoized_property
+    def dividend_events(self):
+        """
+        one row per dividend: Date, Dividends, Close and yield_pct (see dividend_events_df)
+        """
+        return dividend_events_df(self.ticker_data_dict.get('dividends'), self.ticker_history)
+
+    @memoized_property
+    def trailing_dividend_yield(self):
+        """
+        the trailing-12-month dividend yield on every trading day (see trailing_dividend_yield_df)
+        """
+        return trailing_dividend_yield_df(self.ticker_data_dict.get('dividends'), self.ticker_history)
+
+    @memoized_property
+    def dividend_growth_streak(self):
+        """
+        the number of consecutive complete years of dividend growth
+        """
+        return dividend_growth_streak(self.ticker_data_dict.get('dividends'))
+
+    @memoized_property
     def pay_dividends(self):
         if 'dividends' in self.ticker_data_dict.keys():
             dividends_df = self.ticker_data_dict['dividends'].reset_index(level=0)
@@ -798,7 +1245,7 @@ class Ticker(object):
         """
         return self.key_value('pegRatio')
 
-    @property
+    @memoized_property
     def Eps_growth_rate(self):
         """
         Yahoo! Finance, uses a five-year expected growth rate to calculate the PEG ratio.
@@ -821,20 +1268,46 @@ class Ticker(object):
     def trailingEps(self):
         return self.key_value('trailingEps')
 
-    @property
+    @memoized_property
     def Eps_change_pct(self):
         if self.forwardEps is not None and self.trailingEps is not None:
             EPS_change_pct = 100*(self.forwardEps - self.trailingEps)/abs(self.trailingEps)
             return EPS_change_pct
         return None
 
-    @property
+    @memoized_property
     def prob_Eps_change_pct(self):
-        if self.Eps_change_pct is not None:
-            return sigmoid(self.Eps_change_pct/100)
+        """
+        the probability that the close reaches, within a year, the price implied by the EPS change at a constant P/E
+        (None unless both the trailing and the forward EPS are positive)
+        """
+        # the signs first: Eps_change_pct divides by the trailing EPS
+        if self.forwardEps is not None and self.trailingEps is not None and self.trailingEps > 0 and self.forwardEps > 0:
+            try:
+                return simulate_price_target(self.ticker_history['Close'].to_numpy(dtype=float), self.last_close_price * (1 + self.Eps_change_pct/100), seed=ticker_seed(self.ticker))['probability']
+            except ValueError: # not enough history, or no finite last close
+                return None
         return None
 
-    @property
+    @memoized_property
     def RSI(self):
-        from ._indicator import momentum_indicator
-        return momentum_indicator().RSI(close_price = self.ticker_history['Close'])
+        return self.history_view.RSI()
+
+    @memoized_property
+    def history_view(self):
+        """
+        the asof_view of the full ticker history (for a Ticker from as_of(): the view as of its last date)
+        """
+        return history_indicators(self.ticker_history).as_of()
+
+    def as_of(self, last_date = None):
+        """
+        the Ticker as it was on last_date: its history is a zero-copy prefix of this one, and its indicators are cut from the ones
+        already computed over the full history, so that walking last_date back is nearly free
+        """
+        view = self.history_view.indicators.as_of(last_date)
+        ticker_data_dict = dict(self.ticker_data_dict)
+        ticker_data_dict['history'] = view.history
+        ticker = Ticker(ticker_data_dict=ticker_data_dict)
+        ticker._valid_cache()['history_view'] = view
+        return ticker
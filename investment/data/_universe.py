@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import pandas as pd
+
+###########################################################################################
+
+class universe_index(object):
+    def __init__(self, ticker_group_dict=None, subgroup_group_dict=None, ticker_subgroup_dict=None, nasdaqlisted_df=None, otherlisted_df=None):
+        """
+        hash-based lookups over the ticker universe, so that membership and listing questions are O(1):
+
+        group_sets: {group: frozenset of tickers}
+        nasdaq_records, non_nasdaq_records: {ticker: {column: value}} from nasdaqlisted_df and otherlisted_df
+        ticker_industry, ticker_sector: reverse maps built from ticker_subgroup_dict and subgroup_group_dict
+        """
+        self.group_sets = {group: frozenset(tickers) for group, tickers in ticker_group_dict.items()}
+        self.nasdaq_records, self.nasdaq_duplicates = self.listing_records(nasdaqlisted_df)
+        self.non_nasdaq_records, self.non_nasdaq_duplicates = self.listing_records(otherlisted_df)
+        self.ticker_industry = {}
+        self.ticker_sector = {}
+        for group, subgroups in subgroup_group_dict.items():
+            if group == 'All':
+                continue
+            for subgroup in subgroups:
+                if subgroup == 'All' or subgroup not in ticker_subgroup_dict:
+                    continue
+                for ticker in ticker_subgroup_dict[subgroup]:
+                    self.ticker_industry[ticker] = subgroup
+                    self.ticker_sector[ticker] = group
+
+    @staticmethod
+    def listing_records(listed_df: pd.DataFrame = None):
+        """
+        returns ({ticker: record}, set of tickers listed more than once)
+        """
+        if listed_df is None or len(listed_df) == 0:
+            return {}, set()
+        tickers = listed_df['ticker'].tolist()
+        records = dict(zip(tickers, listed_df.drop(['ticker'], axis=1).to_dict('records')))
+        duplicates = set(listed_df['ticker'][listed_df['ticker'].duplicated()].tolist())
+        return records, duplicates
+
+    def in_group(self, ticker: str = None, group: str = None):
+        group_set = self.group_sets.get(group)
+        if group_set is None:
+            return False
+        return ticker in group_set
+
+    def groups_of(self, ticker: str = None):
+        return [group for group, group_set in self.group_sets.items() if ticker in group_set]
+
+    def nasdaq_record(self, ticker: str = None):
+        if ticker in self.nasdaq_duplicates:
+            raise ValueError(f'self.ticker = {ticker}, n_len should not be >1')
+        return self.nasdaq_records.get(ticker)
+
+    def non_nasdaq_record(self, ticker: str = None):
+        if ticker in self.non_nasdaq_duplicates:
+            raise ValueError(f'self.ticker = {ticker}, n_len should not be >1')
+        return self.non_nasdaq_records.get(ticker)
+
+    def industry(self, ticker: str = None):
+        return self.ticker_industry.get(ticker)
+
+    def sector(self, ticker: str = None):
+        return self.ticker_sector.get(ticker)
+
+    def apply_listing_diff(self, nasdaqlisted_df=None, otherlisted_df=None, listing_diff=None, ticker_group_dict=None, groups=[]):
+        """
+        update the listing records of the tickers in listing_diff, and the group sets of the given groups, without rebuilding the rest
+        """
+        for ticker in listing_diff['removed'] + listing_diff['added'] + listing_diff['changed']:
+            self.nasdaq_records.pop(ticker, None)
+            self.non_nasdaq_records.pop(ticker, None)
+        touched = listing_diff['added'] + listing_diff['changed']
+        if touched:
+            nasdaq_records, _ = self.listing_records(nasdaqlisted_df[ nasdaqlisted_df['ticker'].isin(touched) ])
+            non_nasdaq_records, _ = self.listing_records(otherlisted_df[ otherlisted_df['ticker'].isin(touched) ])
+            self.nasdaq_records.update(nasdaq_records)
+            self.non_nasdaq_records.update(non_nasdaq_records)
+        self.nasdaq_duplicates = set(nasdaqlisted_df['ticker'][nasdaqlisted_df['ticker'].duplicated()].tolist())
+        self.non_nasdaq_duplicates = set(otherlisted_df['ticker'][otherlisted_df['ticker'].duplicated()].tolist())
+        for group in groups:
+            self.group_sets[group] = frozenset(ticker_group_dict[group])
+
+###########################################################################################
+
+def listing_table(nasdaqlisted_df: pd.DataFrame = None, otherlisted_df: pd.DataFrame = None):
+    """
+    both listings in one ticker-indexed table of strings, with a 'listing' column ('nasdaq' or 'other')
+    """
+    frames = []
+    if nasdaqlisted_df is not None:
+        frames.append(nasdaqlisted_df.assign(listing='nasdaq'))
+    if otherlisted_df is not None:
+        frames.append(otherlisted_df.assign(listing='other'))
+    if len(frames) == 0:
+        return pd.DataFrame(columns=['listing'], index=pd.Index([], name='ticker'))
+    df = pd.concat(frames, axis=0, sort=False).drop_duplicates(subset=['ticker'], keep='first').set_index('ticker')
+    return df.fillna('').astype(str)
+
+def diff_listings(prev_nasdaqlisted_df: pd.DataFrame = None, prev_otherlisted_df: pd.DataFrame = None, nasdaqlisted_df: pd.DataFrame = None, otherlisted_df: pd.DataFrame = None):
+    """
+    returns {'added': [...], 'removed': [...], 'changed': [...]} (sorted tickers) between two snapshots of the nasdaqtrader listings
+
+    a ticker that moves between nasdaqlisted and otherlisted, or whose name/category/ETF flag changes, counts as 'changed'
+    """
+    prev = listing_table(prev_nasdaqlisted_df, prev_otherlisted_df)
+    curr = listing_table(nasdaqlisted_df, otherlisted_df)
+    added = curr.index.difference(prev.index)
+    removed = prev.index.difference(curr.index)
+    common = curr.index.intersection(prev.index)
+    columns = sorted(set(curr.columns) | set(prev.columns))
+    prev_common = prev.reindex(index=common, columns=columns, fill_value='')
+    curr_common = curr.reindex(index=common, columns=columns, fill_value='')
+    changed = common[ (prev_common.values != curr_common.values).any(axis=1) ]
+    return {'added': sorted(added.tolist()), 'removed': sorted(removed.tolist()), 'changed': sorted(changed.tolist())}
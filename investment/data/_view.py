@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from collections.abc import Mapping
+
+import numpy as np
+
+###########################################################################################
+
+class ticker_data_view(Mapping):
+    def __init__(self, ticker_data_dict: dict = None, window: slice = None):
+        """
+        a read-only view of a ticker data dict over a window (a slice of bars) of its history, in place of a deep copy:
+
+        the static sections (info, options and option chains, financial statements, holders, logo, ...) are the objects of the
+        ticker data dict, shared and never copied; 'history' is the window of the history rows, and the columns of the window are
+        numpy views of the full-history ones (column())
+
+        derived columns (e.g. indicators) are set on the view with set_column(): they are held by the view (copy on write), so the
+        shared history is never modified and other views of the same ticker data dict are unaffected
+        """
+        self.data = ticker_data_dict
+        n = len(ticker_data_dict['history'])
+        self.window = slice(*(window if window is not None else slice(None)).indices(n)[:2])
+        self._history = None
+        self._arrays = {}
+        self._derived = {}
+
+    def __getitem__(self, key):
+        if key == 'history':
+            return self.history
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"ticker_data_view({self.data.get('ticker')!r}, window={self.window.start}:{self.window.stop})"
+
+    @property
+    def n_bars(self):
+        return self.window.stop - self.window.start
+
+    @property
+    def history(self):
+        """
+        the history rows of the window (without the derived columns)
+        """
+        if self._history is None:
+            self._history = self.data['history'].iloc[self.window]
+        return self._history
+
+    def with_window(self, window: slice = None):
+        """
+        a view of the same ticker data dict over another window (the derived columns are not carried over)
+        """
+        return ticker_data_view(self.data, window)
+
+    def has_column(self, name: str = None):
+        return name in self._derived or name in self.data['history'].columns
+
+    def column(self, name: str = None):
+        """
+        a column of the window as a numpy array: a derived column, or a (zero-copy, when the dtype allows it) view of a history column
+        """
+        if name in self._derived:
+            return self._derived[name]
+        if name not in self._arrays:
+            # .values: the UTC dates as datetime64 (to_numpy() would box them as Timestamps)
+            self._arrays[name] = np.asarray(self.data['history'][name].values)[self.window]
+        return self._arrays[name]
+
+    def set_column(self, name: str = None, values = None):
+        """
+        set a derived column of the window (values: one per bar of the window)
+        """
+        values = np.asarray(values)
+        if len(values) != self.n_bars:
+            raise ValueError(f"the derived column [{name}] has {len(values)} values, while the window has {self.n_bars} bars")
+        self._derived[name] = values
+
+    def to_dict(self):
+        """
+        a plain ticker data dict of the window: the static sections shared, and the history of the window with the derived columns
+        (a copy of the window rows only)
+        """
+        ticker_data_dict = dict(self.data)
+        ticker_data_dict['history'] = self.history.assign(**self._derived) if len(self._derived) > 0 else self.history
+        return ticker_data_dict
@@ -5,6 +5,9 @@
 #  License: LGPL-3.0
 
 import sys
+import time
+
+_import_start_time = time.perf_counter()
 
 import matplotlib
 #print(matplotlib.rcsetup.interactive_bk)
@@ -16,8 +19,6 @@ if matplotlib.get_backend() not in matplotlib.rcsetup.non_interactive_bk:
     matplotlib.use('Qt5Agg') # backend
 
 import PySide2
-from PySide2.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineProfile
-from urllib.parse import urlparse
 
 from PySide2.QtWidgets import QApplication
 from PySide2.QtWidgets import QMainWindow, QWidget, QAction
@@ -27,12 +28,16 @@ from PySide2.QtWidgets import QTextEdit, QLineEdit, QTextBrowser
 from PySide2.QtWidgets import QCalendarWidget
 from PySide2.QtWidgets import QPushButton, QLabel, QProgressBar
 from PySide2.QtWidgets import QDialog, QToolBar
-from PySide2.QtGui import QFontDatabase, QTextDocument
+from PySide2.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+from PySide2.QtGui import QFontDatabase, QDesktopServices
 from PySide2 import QtCore
-from PySide2.QtCore import Qt, QThread, Signal, QUrl, QSortFilterProxyModel
+from PySide2.QtCore import Qt, QThread, Signal, QUrl, QSortFilterProxyModel, QObject, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex, QStringListModel
 
-import copy
+from collections import OrderedDict
+import multiprocessing
+import threading
 
+import os
 import pathlib
 from os.path import join
 
@@ -41,15 +46,13 @@ import matplotlib.pyplot as plt
 
 from datetime import date, datetime, timedelta, timezone
 
-from ..data import Ticker, get_ticker_data_dict, get_formatted_ticker_data, momentum_indicator, volume_indicator, moving_average, ticker_group_dict, subgroup_group_dict, ticker_subgroup_dict, group_desc_dict, global_data_root_dir, nasdaqlisted_df, otherlisted_df
+from ..data import Ticker, get_ticker_data_dict, get_formatted_ticker_data, momentum_indicator, volume_indicator, moving_average, ticker_group_dict, subgroup_group_dict, ticker_subgroup_dict, group_desc_dict, global_data_root_dir, get_universe_index, get_search_index, start_search_index_build, history_indicators, ticker_data_view, load_local_ticker_data_dict, iter_dividend_screen, rank_dividend_screen
 
 import numpy as np
 import pandas as pd
 
 from matplotlib.widgets import Cursor
 
-import time
-
 import random
 
 StyleSheet = '''
@@ -65,6 +68,9 @@ StyleSheet = '''
 
 App_name = "Investment"
 
+# the time from the import of this module to the first pass of the event loop with the app window shown (reported by main())
+startup_time_budget = 3.0 # seconds
+
 # https://stackoverflow.com/questions/35894171/redirect-qdebug-output-to-file-with-pyqt5
 def qt_message_handler(mode, context, message):
     if mode == QtCore.QtInfoMsg:
@@ -85,6 +91,7 @@ def qt_message_handler(mode, context, message):
 
 from matplotlib.dates import num2date
 from matplotlib.ticker import Formatter
+from matplotlib.collections import PolyCollection
 # https://matplotlib.org/gallery/ticks_and_spines/date_index_formatter.html
 class DateFormatter(Formatter):
     def __init__(self, dates):
@@ -99,6 +106,185 @@ class DateFormatter(Formatter):
         return np.datetime_as_string(np_datetime64, unit='M') # if unit='D' -> '2020-12-30'
         #return num2date(self.dates[ind]).strftime(self.fmt)
 
+def minmax_decimate(y = None, n_bins: int = None, start: int = 0, stop: int = None):
+    """
+    the bar indices and values of y[start:stop] reduced to its min and max within each of (at most) n_bins bins of consecutive bars,
+    in their order of occurrence, plus the first and last bars; all of y[start:stop] if it has no more than 2*n_bins bars
+
+    a line through these points looks the same as the full line at a resolution of n_bins pixels (NaNs are skipped)
+    """
+    stop = len(y) if stop is None else min(stop, len(y))
+    start = max(start, 0)
+    n = stop - start
+    if n <= 0:
+        return np.empty(0, dtype=int), np.empty(0)
+    if n_bins is None or n <= 2*n_bins:
+        return np.arange(start, stop), y[start:stop]
+    bin_size = -(-n // n_bins)
+    n_bins = -(-n // bin_size)
+    binned = np.full(n_bins*bin_size, np.nan)
+    binned[:n] = y[start:stop]
+    binned = binned.reshape(n_bins, bin_size)
+    is_nan = np.isnan(binned)
+    index_min = np.where(is_nan, np.inf, binned).argmin(axis=1)
+    index_max = np.where(is_nan, -np.inf, binned).argmax(axis=1)
+    index = np.sort(np.stack([index_min, index_max], axis=1), axis=1) + (start + np.arange(n_bins)*bin_size)[:, None]
+    index = np.concatenate([[start], index.ravel(), [stop-1]])
+    return index, y[index]
+
+def bar_decimate(heights = None, n_bins: int = None, start: int = 0, stop: int = None, width: float = 0.8):
+    """
+    the rectangles (vertices) of a bar chart of heights[start:stop] (bars at x = 0, 1, 2, ...), with the bars within each of (at most) n_bins bins
+    of consecutive bars merged into one bar as high as the highest of them (in absolute value), and the bar index each rectangle takes its color from
+    """
+    stop = len(heights) if stop is None else min(stop, len(heights))
+    start = max(start, 0)
+    n = stop - start
+    if n <= 0:
+        return np.empty((0, 4, 2)), np.empty(0, dtype=int)
+    bin_size = 1 if (n_bins is None or n <= n_bins) else -(-n // n_bins)
+    n_bins = -(-n // bin_size)
+    binned = np.zeros(n_bins*bin_size)
+    binned[:n] = np.nan_to_num(heights[start:stop])
+    bin_start = start + np.arange(n_bins)*bin_size
+    index = np.abs(binned.reshape(n_bins, bin_size)).argmax(axis=1) + bin_start
+    left = bin_start - width/2
+    right = np.minimum(bin_start + bin_size, stop) - 1 + width/2
+    top = np.nan_to_num(heights[index])
+    verts = np.empty((n_bins, 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = left
+    verts[:, 2, 0] = verts[:, 3, 0] = right
+    verts[:, 0, 1] = verts[:, 3, 1] = 0
+    verts[:, 1, 1] = verts[:, 2, 1] = top
+    return verts, index
+
+
+class decimated_line(object):
+    def __init__(self, axes=None, **kwargs):
+        """
+        a persistent line of a series y (at x = 0, 1, 2, ...), set with set_data() and drawn with minmax_decimate() at the pixel width of the canvas
+        """
+        self.y = np.empty(0)
+        self.artist, = axes.plot([], [], **kwargs)
+
+    def __len__(self):
+        return len(self.y)
+
+    def set_data(self, y=None):
+        self.y = np.asarray(y, dtype=float)
+
+    def limits(self, start: int = 0, stop: int = None):
+        return self.y[start:stop]
+
+    def decimate(self, start: int = 0, stop: int = None, n_bins: int = None):
+        self.artist.set_data(*minmax_decimate(self.y, n_bins, start, stop))
+
+
+class decimated_bars(object):
+    def __init__(self, axes=None, width: float = 0.8):
+        """
+        a persistent bar chart of heights (at x = 0, 1, 2, ...), set with set_data(), drawn as a single PolyCollection with bar_decimate() at the pixel width of the canvas
+        """
+        self.heights = np.empty(0)
+        self.colors = np.empty(0, dtype=object)
+        self.width = width
+        self.artist = PolyCollection([], edgecolors='none', linewidths=0)
+        axes.add_collection(self.artist, autolim=False)
+
+    def __len__(self):
+        return len(self.heights)
+
+    def set_data(self, heights=None, colors=None):
+        self.heights = np.asarray(heights, dtype=float)
+        self.colors = np.asarray(colors)
+
+    def limits(self, start: int = 0, stop: int = None):
+        heights = self.heights[start:stop]
+        return [0, np.nanmin(heights), np.nanmax(heights)] if len(heights) > 0 and np.isfinite(heights).any() else [0]
+
+    def decimate(self, start: int = 0, stop: int = None, n_bins: int = None):
+        verts, index = bar_decimate(self.heights, n_bins, start, stop, width=self.width)
+        self.artist.set_verts(verts)
+        self.artist.set_facecolor(self.colors[index])
+
+
+class decimated_fill_between(object):
+    def __init__(self, axes=None, y_ref: float = None, where=None, **kwargs):
+        """
+        axes.fill_between(x, y, y_ref, where=where(y, y_ref)) over the points of minmax_decimate(y), refilled on each decimation
+        """
+        self.axes = axes
+        self.y = np.empty(0)
+        self.y_ref = y_ref
+        self.where = where
+        self.kwargs = kwargs
+        self.artist = None
+
+    def __len__(self):
+        return len(self.y)
+
+    def set_data(self, y=None):
+        self.y = np.asarray(y, dtype=float)
+
+    def limits(self, start: int = 0, stop: int = None):
+        return [self.y_ref]
+
+    def decimate(self, start: int = 0, stop: int = None, n_bins: int = None):
+        if self.artist is not None:
+            self.artist.remove()
+        x, y = minmax_decimate(self.y, n_bins, start, stop)
+        self.artist = self.axes.fill_between(x, y, self.y_ref, where=self.where(y, self.y_ref), interpolate=True, **self.kwargs)
+
+
+class search_filter_proxy_model(QSortFilterProxyModel):
+    def __init__(self, parent=None, ticker_column: int = 0, rank_order: bool = False):
+        """
+        a proxy model keeping the rows whose ticker (in ticker_column) matches the query in the search index (symbol, name, sector, industry),
+        or whose text contains the query (the QSortFilterProxyModel fixed-string filter); with rank_order, the matches are sorted best first
+
+        the search index is case-insensitive: a case-sensitive filter, or a query typed before the index is built (in the background,
+        see start_search_index_build), only uses the fixed-string filter
+        """
+        super().__init__(parent)
+        self.ticker_column = ticker_column
+        self.rank_order = rank_order
+        self.ranks = None
+
+    def set_query(self, text: str = None):
+        text = text.strip()
+        self.ranks = None
+        if text and self.filterCaseSensitivity() == Qt.CaseInsensitive:
+            try:
+                search_index = get_search_index(wait=False)
+                if search_index is not None:
+                    self.ranks = {ticker: rank for rank, ticker in enumerate(search_index.query_tickers(text, limit=None))}
+            except Exception as e:
+                print(f"Warning: the search index is not available: {e}")
+        self.setFilterFixedString(text)
+        if self.rank_order:
+            self.invalidate()
+            self.sort(0 if self.ranks else -1)
+
+    def _ticker(self, source_row: int = None, source_parent=None):
+        arrays = getattr(self.sourceModel(), 'arrays', None) # dataframe_table_model: read the array, not through data()
+        if arrays is not None:
+            return arrays[self.ticker_column][source_row]
+        return self.sourceModel().index(source_row, self.ticker_column, source_parent).data()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.ranks and self._ticker(source_row, source_parent) in self.ranks:
+            return True
+        return super().filterAcceptsRow(source_row, source_parent)
+
+    def lessThan(self, left, right):
+        if not (self.rank_order and self.ranks):
+            return super().lessThan(left, right)
+        n_ranks = len(self.ranks)
+        left_rank = self.ranks.get(self._ticker(left.row(), left.parent()), n_ranks + left.row())
+        right_rank = self.ranks.get(self._ticker(right.row(), right.parent()), n_ranks + right.row())
+        return left_rank < right_rank
+
+
 # https://stackoverflow.com/questions/4827207/how-do-i-filter-the-pyqt-qcombobox-items-based-on-the-text-input
 class ExtendedComboBox(QComboBox):
     def __init__(self, parent=None):
@@ -108,8 +294,13 @@ class ExtendedComboBox(QComboBox):
         #self.setFocusPolicy(Qt.StrongFocus)
         self.setEditable(True)
 
-        # add a filter model to filter matching items
-        self.pFilterModel = QSortFilterProxyModel(self)
+        # the items are held in a list model, so that a whole ticker group is swapped in at once (set_items)
+        self.list_model = QStringListModel(self)
+        self.setModel(self.list_model)
+        self.view().setUniformItemSizes(True)
+
+        # add a filter model to filter matching items (by symbol, name, sector or industry, best matches first)
+        self.pFilterModel = search_filter_proxy_model(self, rank_order=True)
         self.pFilterModel.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.pFilterModel.setSourceModel(self.model())
 
@@ -120,7 +311,7 @@ class ExtendedComboBox(QComboBox):
         self.setCompleter(self.completer)
 
         # connect signals
-        self.lineEdit().textEdited.connect(self.pFilterModel.setFilterFixedString)
+        self.lineEdit().textEdited.connect(self.pFilterModel.set_query)
         self.completer.activated.connect(self.on_completer_activated)
 
     # on selection of an item from the completer, select the corresponding item from combobox 
@@ -154,84 +345,203 @@ class ExtendedComboBox(QComboBox):
 # https://matplotlib.org/3.3.0/gallery/misc/cursor_demo.html
 # https://matplotlib.org/users/event_handling.html
 class SnappingCursor(Cursor):
-    def __init__(self, plotline=None, actual_x_data=None, x_index=None, y_data=None, name=None, UI=None, *args, **kwargs):
+    def __init__(self, dates=None, y_data=None, name=None, UI=None, *args, **kwargs):
+        """
+        a crosshair (blitted when useblit=True) snapping to the bars of a series plotted at x = 0, 1, 2, ..., with the date, value and slope
+        of the bar under the mouse shown in the coordinate label of the canvas
+
+        the date labels and slopes are computed once per series (set_data), so that a mouse move only rounds x to a bar index;
+        the handlers are connected by Cursor itself, and disconnected with disconnect_events()
+        """
         super().__init__(*args, **kwargs)
-        if plotline is None:
-            self.x, self.y = x_index, y_data
-            self.actual_x_data = actual_x_data
-            self.use_x_index = True
-        else:
-            self.x, self.y = plotline.get_data()
-            self.actual_x_data = None
-            self.use_x_index = False
-        dy = (self.y.max() - self.y.min()) / self.y.size
-        self.y_grad = np.gradient(self.y, dy, edge_order=2)
-        self._last_index = None
         self.name = name
         self.UI = UI
+        self.set_data(dates=dates, y_data=y_data)
+
+    def set_data(self, dates=None, y_data=None):
+        # dates=None: only the series changes (e.g. rescaled to the viewport), the date labels are kept
+        self.y = np.asarray(y_data, dtype=float)
+        if dates is not None:
+            self.date_labels = np.datetime_as_string(np.asarray(dates, dtype='datetime64[ns]'), unit='D')
+        if self.y.size > 1:
+            dy = (np.nanmax(self.y) - np.nanmin(self.y)) / self.y.size if np.isfinite(self.y).any() else 0
+            self.y_grad = np.gradient(self.y, dy if (np.isfinite(dy) and dy > 0) else 1.0, edge_order=(2 if self.y.size > 2 else 1))
+        else:
+            self.y_grad = np.zeros(self.y.size)
+        self.n = self.y.size
+        self._last_index = None
 
     def onmove(self, event):
-        if event.inaxes:
-            if type(event.xdata) == np.float64:
-
-                if self.use_x_index:
-                    index = min(np.searchsorted(self.x, event.xdata), len(self.x)-1)
-                else:
-                    x_datetime = datetime(1970,1,1,tzinfo=timezone.utc) + timedelta(days=event.xdata)
-                    index = min(np.searchsorted(self.x, pd.to_datetime(x_datetime, utc=True)), len(self.x)-1) # np.datetime64() is used to be congruent with self.x
-                    
-                if index == self._last_index:
-                    return  # still on the same data point. Nothing to do.
-
-                self._last_index = index
-                event.xdata = self.x[index]
-                event.ydata = self.y[index]
-                event.ydata_grad = self.y_grad[index]
-
-                if self.use_x_index:
-                    text_str = f"{pd.to_datetime(self.actual_x_data[index], utc=True).date()}, {event.ydata:.2f}, slope={event.ydata_grad:.2f}"
-                else:
-                    text_str = f"{pd.to_datetime(event.xdata, utc=True).date()}, {event.ydata:.2f}, slope={event.ydata_grad:.2f}"
-
-                if self.name == 'ticker_canvas_cursor':
-                    self.UI.ticker_canvas_coord_label.setText(text_str)
-                if self.name == 'index_canvas_cursor':
-                    self.UI.index_canvas_coord_label.setText(text_str)
-
-            super().onmove(event)
+        if event.inaxes and event.xdata is not None and self.n > 0:
+            index = int(event.xdata + 0.5) # the nearest bar
+            index = 0 if index < 0 else (self.n - 1 if index >= self.n else index)
+            if index == self._last_index:
+                return  # still on the same data point. Nothing to do.
+            self._last_index = index
+            event.xdata = index
+            event.ydata = self.y[index]
+            text_str = f"{self.date_labels[index]}, {event.ydata:.2f}, slope={self.y_grad[index]:.2f}"
+            if self.name == 'ticker_canvas_cursor':
+                self.UI.ticker_canvas_coord_label.setText(text_str)
+            if self.name == 'index_canvas_cursor':
+                self.UI.index_canvas_coord_label.setText(text_str)
+        else:
+            self._last_index = None
+        super().onmove(event)
 
 
 # reference: https://matplotlib.org/faq/usage_faq.html
 class canvas(FigureCanvasQTAgg):
-    def __init__(self, parent=None, width=6.0, height=3.0, dpi=72, UI=None, tight_layout=True, *args, **kwargs):
+    zoom_factor = 0.8 # of the viewport width, per step of the mouse wheel
+
+    def __init__(self, parent=None, width=6.0, height=3.0, dpi=72, UI=None, tight_layout=True, draggable=False, *args, **kwargs):
         self.figure = plt.figure(figsize=(width, height), dpi=dpi, tight_layout=tight_layout, *args, **kwargs)
         self.axes = self.figure.add_subplot(111)
         self.axes.tick_params(axis='both', which='major', labelsize=10.0)
         self.axes.tick_params(axis='both', which='minor', labelsize=8.0)
         super().__init__(self.figure)
         self.dragging = False
+        self.tight_layout = tight_layout
         self._UI = UI
+        self.layout = None # what the axes are set up for: the same layout is redrawn by updating the data of its persistent artists
+        self.decimated = {} # {series name: decimated_line, decimated_bars or decimated_fill_between}, redecimated on resize and on x-axis zoom
+        self.date_formatter = DateFormatter(np.empty(0, dtype='datetime64[ns]'))
+        self.cursor = None
+        self.cursor_series = None # the name of the decimated series the crosshair follows
+        self.viewport = None # the bars in view, (start, stop): the series are the full history, the viewport is the x range
+        self.scale_y = True
+        self.y_include = []
+        self._decimation = None
+        self._xlim_cid = None
+        # the canvas-level handlers are connected once, for the lifetime of the canvas
+        self.mpl_connect('resize_event', self._resized)
+        if draggable:
+            # drag to pan and scroll to zoom: the viewport of both canvases is moved by UI_control._set_viewport
+            self.mpl_connect('button_press_event',   self.button_pressed)
+            self.mpl_connect('button_release_event', self.button_released)
+            self.mpl_connect('motion_notify_event',  self.onmove)
+            self.mpl_connect('scroll_event',         self.scrolled)
+
+    def reset_axes(self, layout=None):
+        """
+        clear the axes (and their persistent artists) to set them up for another layout
+        """
+        if self.cursor is not None:
+            self.cursor.disconnect_events()
+        self.axes.clear()
+        self.layout = layout
+        self.decimated = {}
+        self.cursor = None
+        self.cursor_series = None
+        self._decimation = None
+        self.axes.xaxis.set_major_formatter(self.date_formatter)
+        self._xlim_cid = self.axes.callbacks.connect('xlim_changed', self._xlim_changed) # clearing the axes also clears their callbacks
+
+    def n_bins(self):
+        # one bin per horizontal pixel of the axes
+        return max(int(self.axes.bbox.width), 1)
+
+    def add_decimated(self, name: str = None, decimated_artist=None):
+        self.decimated[name] = decimated_artist
+        return decimated_artist
+
+    def set_dates(self, dates=None):
+        # the date formatter of the x axis is updated in place
+        self.date_formatter.dates = dates
+
+    def n_bars(self):
+        return max([len(d) for d in self.decimated.values()] + [0])
+
+    def autoscale(self, scale_y: bool = True, y_include: list = []):
+        """
+        set the axis limits to the viewport with the axes margins, as autoscaling would do with only the bars in view plotted
+        (scale_y=False: the y limits are kept; y_include: values to keep within the y limits); see set_viewport
+        """
+        self.scale_y = scale_y
+        self.y_include = y_include
+        n_bars = self.n_bars()
+        start, stop = (0, n_bars) if self.viewport is None else self.viewport
+        start, stop = min(max(start, 0), max(n_bars-1, 0)), max(min(stop, n_bars), 1)
+        xmargin, ymargin = self.axes.margins()
+        xmin, xmax = start - 0.5, stop - 0.5
+        self.axes.set_xlim(xmin - xmargin*(xmax-xmin), xmax + xmargin*(xmax-xmin), auto=False)
+        if scale_y:
+            values = [np.asarray(d.limits(start, stop), dtype=float).ravel() for d in self.decimated.values()] + [np.asarray(y_include, dtype=float)]
+            values = np.concatenate(values)
+            values = values[np.isfinite(values)]
+            if len(values) > 0:
+                ymin, ymax = values.min(), values.max()
+                if ymax == ymin:
+                    expander = 0.05*abs(ymin) if ymin != 0 else 0.05
+                    ymin, ymax = ymin - expander, ymax + expander
+                self.axes.set_ylim(ymin - ymargin*(ymax-ymin), ymax + ymargin*(ymax-ymin), auto=False)
+
+    def set_viewport(self, viewport: tuple = None, scale_y: bool = None, y_include: list = None):
+        """
+        show the bars [start, stop) of the series (None: all of them), autoscaled (scale_y, y_include: see autoscale; None: as before)
+        """
+        self.viewport = viewport
+        self._decimation = None # the series may have been rescaled: redecimate even if the x limits are unchanged
+        self.autoscale(scale_y=self.scale_y if scale_y is None else scale_y, y_include=self.y_include if y_include is None else y_include)
+        self.redecimate()
+        self.draw_idle()
+
+    def redecimate(self, force: bool = False):
+        """
+        decimate the series again, for the visible x range (plus a bar on each side) and the current pixel width
+        """
+        if len(self.decimated) == 0:
+            return
+        xmin, xmax = self.axes.get_xlim()
+        n_bars = max(len(d) for d in self.decimated.values())
+        decimation = (min(max(int(np.floor(xmin)) - 1, 0), n_bars), max(min(int(np.ceil(xmax)) + 2, n_bars), 0), self.n_bins())
+        if decimation == self._decimation and not force:
+            return
+        self._decimation = decimation
+        start, stop, n_bins = decimation
+        for decimated_artist in self.decimated.values():
+            decimated_artist.decimate(start=start, stop=stop, n_bins=n_bins)
+        self.draw_idle()
+
+    def _resized(self, event):
+        self.redecimate()
+
+    def _xlim_changed(self, axes):
+        self.redecimate()
+
+    def freeze_layout(self, frozen: bool = True):
+        """
+        keep the axes where they are (no tight layout on each draw), e.g. during a drag, where only the data move
+        """
+        if self.tight_layout:
+            self.figure.set_tight_layout(not frozen)
+            if not frozen:
+                self.draw_idle()
 
     def button_pressed(self, event):
-        if event.inaxes:
-            if type(event.xdata) == np.float64:
-                self.dragging = True
-                self.original_x_datetime = datetime(1970,1,1,tzinfo=timezone.utc) + timedelta(days=event.xdata)
-                self.original_time_last_date = self._UI.control.time_last_date
-                self.time_diff = timedelta(0)
+        if event.inaxes and event.button == 1 and self._UI.control.ticker_viewport is not None:
+            self.dragging = True
+            # the drag is measured in pixels, as the x data coordinates move with the viewport
+            self._drag_origin = (event.x, self._UI.control.ticker_viewport)
+            for canvas in [self._UI.ticker_canvas, self._UI.index_canvas]:
+                canvas.freeze_layout(True)
 
     def button_released(self, event):
+        if not self.dragging:
+            return
         self.dragging = False
-        self._UI.control.time_last_date = self.original_time_last_date - self.time_diff
-        self._UI.control._ticker_lastdate_dialog_any_button_clicked()
+        for canvas in [self._UI.ticker_canvas, self._UI.index_canvas]:
+            canvas.freeze_layout(False)
 
     def onmove(self, event):
-        if event.inaxes:
-            if self.dragging:
-                if type(event.xdata) == np.float64:
-                    self.time_diff = datetime(1970,1,1,tzinfo=timezone.utc) + timedelta(days=event.xdata) - self.original_x_datetime
-                    #self._UI.control.time_last_date = self.original_time_last_date - self.time_diff
-                    #self._UI.control._ticker_lastdate_dialog_any_button_clicked()
+        if self.dragging and event.x is not None:
+            x, (start, stop) = self._drag_origin
+            shift = int(round((x - event.x) * (stop - start) / max(self.axes.bbox.width, 1)))
+            self._UI.control._set_viewport(start + shift, stop + shift)
+
+    def scrolled(self, event):
+        if event.inaxes and event.xdata is not None and self._UI.control.ticker_viewport is not None:
+            self._UI.control._zoom_viewport(center=event.xdata, factor=self.zoom_factor**event.step)
 
 class ticker_selection(ExtendedComboBox):
     def __init__(self, parent=None, *args, **kwargs):
@@ -240,33 +550,43 @@ class ticker_selection(ExtendedComboBox):
         self.reset()
     
     def reset(self):
-        self.clear()
-        self.addItem("-- Select or enter a ticker --")
+        self.set_items([])
         self.setFocusPolicy(Qt.ClickFocus)
 
+    def set_items(self, tickers: list = None):
+        # one model reset for the whole list, instead of one addItem() per ticker
+        self.list_model.setStringList(["-- Select or enter a ticker --"] + list(tickers))
+        self.setCurrentIndex(0) # a model reset leaves no current item (index -1), the first addItem() used to select the prompt
+
 
 class group_selection(QComboBox):
     def __init__(self, parent=None, *args, **kwargs):
         super().__init__(parent=parent, *args, **kwargs)
         self.setFixedWidth(parent.app_window.width*0.12)
+        self.list_model = QStringListModel(self)
+        self.setModel(self.list_model)
         self.reset()
 
     def reset(self):
-        self.addItem("-- Select a sector or ticker group --")
         self.groups = list(ticker_group_dict.keys())
-        for group in self.groups:
-            self.addItem(group)
+        self.list_model.setStringList(["-- Select a sector or ticker group --"] + self.groups)
+        self.setCurrentIndex(0) # a model reset leaves no current item (index -1), the first addItem() used to select the prompt
 
 
 class subgroup_selection(QComboBox):
     def __init__(self, parent=None, *args, **kwargs):
         super().__init__(parent=parent, *args, **kwargs)
         self.setFixedWidth(parent.app_window.width*0.12)
+        self.list_model = QStringListModel(self)
+        self.setModel(self.list_model)
         self.reset()
 
     def reset(self):
-        self.clear()
-        self.addItem("-- Select an industry or ticker subgroup --")
+        self.set_items([])
+
+    def set_items(self, subgroups: list = None):
+        self.list_model.setStringList(["-- Select an industry or ticker subgroup --"] + list(subgroups))
+        self.setCurrentIndex(0) # a model reset leaves no current item (index -1), the first addItem() used to select the prompt
 
 
 class index_selection(QComboBox):
@@ -450,21 +770,89 @@ class ticker_download_thread(QThread):
 
 
 class ticker_analyze_for_dividends_thread(QThread):
-    _signal = Signal(pd.DataFrame)
-    def __init__(self, app_window=None, tickers_to_analyze=[]):
+    # n_done, n_total, n_missing (not in the local data store), the dividend payers screened so far (ranked), finished
+    _signal = Signal(int, int, int, object, bool)
+    def __init__(self, app_window=None, tickers_to_analyze=[], online=False):
         super().__init__()
         self.app_window = app_window
         self.tickers_to_analyze = tickers_to_analyze
+        self.online = online
+        self.cancel_event = threading.Event()
+        self.emit_interval = 0.25 # seconds between two partial results
+
+    def cancel(self):
+        self.cancel_event.set()
+
     def run(self):
-        df = pd.DataFrame(columns=['ticker','recent 1-year dividends (%)'])
-        #tickers = ticker_group_dict['All']
-        #tickers = ['MSM', 'T', 'LUMN', 'CAT']
-        #tickers = ['HCHC', 'SPRT', 'NLOK', 'QRTEA', 'QRTEB', 'LORL', 'AIV', 'FF', 'VRS', 'IRCP', 'DHT', 'AM', 'OMP', 'FRO', 'ICMB', 'TRTX', 'BXG', 'CLWT', 'PATI', 'IVR', 'OMF', 'MFA', 'CSWC', 'ORC', 'IEP', 'VHC', 'MSM', 'ARI', 'NGVC', 'NHTC', 'RC', 'ACRE', 'GEO', 'CIM', 'NLY', 'EARN', 'STWD', 'EQC', 'MNDO', 'BKEP', 'RTLR', 'TLYS', 'TRMD', 'AFIN', 'DMLP', 'ANH', 'CHMI', 'NAT', 'HRZN', 'SSNT', 'OKE', 'AGNC', 'DX', 'EFC', 'ABR', 'HVT', 'OLP', 'CCAP', 'SFL', 'NBLX', 'MARPS', 'ETRN', 'GNL', 'SNDR', 'CMO', 'KREF', 'BXMT', 'CPLP', 'NEWT', 'MNRL', 'HT', 'BPY', 'EV', 'BPYU', 'ITIC', 'NCMI', 'GMLP', 'NMFC', 'APAM', 'TWO', 'XLE', 'AJX', 'PMT', 'AMRK', 'ARR', 'PKE', 'LOAN', 'BGS', 'WMB', 'MAC', 'HIHO', 'GOOD', 'VNO', 'GPP', 'BRG', 'AROC', 'PLYM', 'OPI', 'CNA', 'UNIT', 'FCAU', 'BRMK', 'VGR', 'HP', 'SBRA', 'BLX', 'SFE', 'UVV', 'MO', 'SOHO', 'HCAP', 'RGR', 'OHI', 'SPKE', 'CLNY', 'WDR', 'FHI', 'LMRK', 'NYMT', 'ISSC', 'APTS', 'SNR', 'DHIL', 'WSBF', 'FLMN', 'TOT', 'SYX', 'BRT', 'XOM', 'AMSF', 'FFG', 'CRWS', 'PK', 'PZN', 'QIWI', 'CIO', 'NPK', 'BKE', 'SRC', 'NRZ', 'CPLG', 'NVEC', 'WSR', 'LADR', 'KMI', 'NYCB', 'NHI', 'IIIN', 'GMRE', 'NAVI', 'SKT', 'NWBI', 'FSP', 'ATAX', 'NTB', 'BDN', 'ALX', 'HRB', 'CTO', 'T', ]
-        for ticker in self.tickers_to_analyze:
-            df = df.append({'ticker': ticker, 'recent 1-year dividends (%)': round(Ticker(ticker).last_1yr_dividends_pct,2)}, ignore_index=True)
-        df = df.sort_values(by=['recent 1-year dividends (%)'], ascending=False)
-        df = df[ df['recent 1-year dividends (%)'] > 0 ].reset_index().drop(['index'],axis=1)
-        self._signal.emit(df)
+        # the tickers are screened on a process pool, from the local data store unless online (see iter_dividend_screen);
+        # the workers are spawned, not forked: this process runs Qt and other threads (ticker loaders, the universe refresh), whose
+        # locks a fork would copy in whatever state they are (the app script must guard its main() with if __name__ == "__main__")
+        rows = []
+        n_done, n_total, n_missing = 0, len(self.tickers_to_analyze), 0
+        last_emit = 0
+        try:
+            for n_done, n_total, chunk_rows in iter_dividend_screen(self.tickers_to_analyze, data_root_dir=self.app_window.app_menu.preferences_dialog.data_root_dir, online=self.online, download_today_data=self.app_window.app_menu.preferences_dialog.download_today_data, mp_context=multiprocessing.get_context('spawn'), cancel_event=self.cancel_event):
+                rows += chunk_rows
+                n_missing += sum(status == 'missing' for _, _, status in chunk_rows)
+                if time.time() - last_emit > self.emit_interval:
+                    last_emit = time.time()
+                    self._signal.emit(n_done, n_total, n_missing, rank_dividend_screen(rows), False)
+        finally:
+            # also on an error in the pool, so that the dialog is reset
+            self._signal.emit(n_done, n_total, n_missing, rank_dividend_screen(rows), True)
+
+
+def ticker_data_signature(ticker: str = None, data_root_dir: str = None):
+    """
+    the mtimes of the cached data files of the ticker (None if it is not in the local data store), to tell whether a loaded ticker data dict is still current
+    """
+    data_dir = join(data_root_dir, "ticker_data/yfinance")
+    try:
+        return (os.stat(join(data_dir, f"{ticker}_history.csv")).st_mtime_ns, os.stat(join(data_dir, f"{ticker}_info_dict.pkl")).st_mtime_ns)
+    except OSError:
+        return None
+
+
+class ticker_loader_signals(QObject):
+    # ticker, mode, ticker data dict (None if it could not be loaded), data signature, error message
+    _signal = Signal(str, str, object, object, str)
+
+
+class ticker_loader(QRunnable):
+    def __init__(self, signals=None, ticker=None, mode='load', download_today_data=False, data_root_dir=None):
+        """
+        load a ticker data dict in a worker thread of a QThreadPool, and deliver it by signals._signal
+
+        mode = 'local': from the local data store only (prefetch), 'load': as get_ticker_data_dict() (downloads a ticker not in the store),
+        'redownload': force a redownload from yfinance
+
+        a loader that is cancelled before it runs delivers no data (a running one cannot be interrupted, and delivers its result anyway)
+        """
+        super().__init__()
+        self.setAutoDelete(False) # owned by UI_control until its result is delivered
+        self.signals = signals
+        self.ticker = ticker
+        self.mode = mode
+        self.download_today_data = download_today_data
+        self.data_root_dir = data_root_dir
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            self.signals._signal.emit(self.ticker, self.mode, None, None, 'cancelled')
+            return
+        ticker_data_dict = None
+        error = ''
+        try:
+            if self.mode == 'local':
+                ticker_data_dict = load_local_ticker_data_dict(ticker = self.ticker, data_root_dir = self.data_root_dir)
+            else:
+                ticker_data_dict = get_ticker_data_dict(ticker = self.ticker, force_redownload = (self.mode == 'redownload'), download_today_data = self.download_today_data, data_root_dir = self.data_root_dir)
+            if ticker_data_dict is not None and len(ticker_data_dict['history']) == 0:
+                ticker_data_dict, error = None, 'no history'
+        except Exception as e:
+            ticker_data_dict, error = None, str(e)
+        self.signals._signal.emit(self.ticker, self.mode, ticker_data_dict, ticker_data_signature(self.ticker, self.data_root_dir), error)
 
 
 class dialog_with_textbrowser(QDialog):
@@ -677,10 +1065,20 @@ class high_dividends_dialog(QDialog):
         #self.etf_db_checkbox.setEnabled(False)
         #self.equity_db_checkbox.setEnabled(False)
         #
+        self.online_checkbox = QCheckBox('Download the tickers not in the local data store (online)', parent=self)
+        self.online_checkbox.setChecked(False)
+        #
         self.exec_pushbutton = QPushButton('Analyze', parent=self)
         self.exec_pushbutton.clicked.connect(self._analyze_button_clicked)
         #
-        self.text_browser = QTextBrowser(parent=self)
+        self.progressbar = QProgressBar(parent=self, objectName="ProgressBar")
+        self.status_label = QLabel(parent=self)
+        self.table_view = QTableView(parent=self)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+        self.thread = None
         # layout
         self.layout = QGridLayout()
         self.layout.addWidget(self.label, 0, 0)
@@ -693,8 +1091,11 @@ class high_dividends_dialog(QDialog):
         self.layout.addWidget(self.comp_checkbox, 4, 0)
         self.layout.addWidget(self.etf_db_checkbox, 8, 0)
         self.layout.addWidget(self.equity_db_checkbox, 9, 0)
-        self.layout.addWidget(self.exec_pushbutton, 10, 0)
-        self.layout.addWidget(self.text_browser, 11, 0)
+        self.layout.addWidget(self.online_checkbox, 10, 0)
+        self.layout.addWidget(self.exec_pushbutton, 11, 0)
+        self.layout.addWidget(self.progressbar, 12, 0)
+        self.layout.addWidget(self.status_label, 13, 0)
+        self.layout.addWidget(self.table_view, 14, 0)
         self.setLayout(self.layout)
         self._update_checkbox_selection()
 
@@ -720,23 +1121,78 @@ class high_dividends_dialog(QDialog):
             self.tickers_to_analyze += ticker_group_dict['Equity database']
         self.tickers_to_analyze = sorted(list(set(self.tickers_to_analyze)))
         self.n_tickers = len(self.tickers_to_analyze)
-        self.exec_pushbutton.setText(f"Analyze {self.n_tickers} tickers for dividends")
+        if self.thread is None:
+            self.exec_pushbutton.setText(f"Analyze {self.n_tickers} tickers for dividends")
 
     def _analyze_button_clicked(self):
-        if self.n_tickers > 0:
-            #self.text_browser.clearHistory()
+        if self.thread is not None: # the button is 'Cancel' while a screen is running
             self.exec_pushbutton.setEnabled(False)
-            self.exec_pushbutton.repaint()
+            self.thread.cancel()
+        elif self.n_tickers > 0:
+            self.exec_pushbutton.setText('Cancel')
+            self.online_checkbox.setEnabled(False)
+            self.progressbar.setMinimum(0)
+            self.progressbar.setMaximum(self.n_tickers)
+            self.progressbar.setValue(0)
+            self.status_label.setText("Starting the worker processes...")
             #
-            self.thread=ticker_analyze_for_dividends_thread(app_window=self.app_window, tickers_to_analyze=self.tickers_to_analyze)
-            self.thread._signal.connect(self._analyze_completed)
+            self.thread=ticker_analyze_for_dividends_thread(app_window=self.app_window, tickers_to_analyze=self.tickers_to_analyze, online=self.online_checkbox.isChecked())
+            self.thread._signal.connect(self._analyze_progress)
+            self.thread.finished.connect(self._analyze_thread_finished)
             self.thread.start()
 
-    def _analyze_completed(self, df: pd.DataFrame):
-        self.text_browser.setHtml(df.to_html(index=False))
-        self.text_browser.repaint()
+    def _analyze_progress(self, n_done: int = None, n_total: int = None, n_missing: int = None, df: pd.DataFrame = None, finished: bool = False):
+        self.progressbar.setValue(n_done)
+        self.table_view.setModel(dataframe_table_model(df, parent=self.table_view))
+        status = f"{len(df)} dividend payers in {n_done}/{n_total} tickers"
+        if n_missing > 0:
+            status += f" ({n_missing} not in the local data store)"
+        if finished:
+            if n_done < n_total:
+                status += ": cancelled"
+            self.table_view.resizeColumnsToContents()
+        self.status_label.setText(status)
+
+    def _analyze_thread_finished(self):
+        # the last reference to the thread is only dropped once its run() has returned (QThread.finished)
+        self.thread = None
+        self.online_checkbox.setEnabled(True)
         self.exec_pushbutton.setEnabled(True)
-        self.exec_pushbutton.repaint()
+        self._update_checkbox_selection()
+
+    def reject(self):
+        if self.thread is not None:
+            self.thread.cancel()
+        super().reject()
+
+
+class dataframe_table_model(QAbstractTableModel):
+    def __init__(self, df: pd.DataFrame = None, parent=None):
+        """
+        a read-only table model over the columns of a DataFrame, kept as arrays of strings: the view only asks for the visible cells
+        """
+        super().__init__(parent)
+        self.columns = list(df.columns)
+        self.arrays = [df[column].fillna('').astype(str).to_numpy() for column in self.columns]
+        self.n_rows = len(df)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.n_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.arrays[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section]
+        return str(section)
 
 
 class ticker_db_dialog(QDialog):
@@ -746,10 +1202,11 @@ class ticker_db_dialog(QDialog):
         self.resize(self.app_window.width*0.4, self.app_window.height*0.6)
         self.search_label = QLabel('Search:', parent=self)
         self.search_lineedit = QLineEdit(parent=self)
+        self.search_lineedit.textChanged.connect(self._search_lineedit_text_changed)
         self.search_lineedit.returnPressed.connect(self._search_lineedit_return_pressed)
-        self.search_backward_checkbox = QCheckBox('Backward', parent=self)
         self.search_case_sensitive_checkbox = QCheckBox('Case Sensitive', parent=self)
-        self.text_browser = QTextBrowser(parent=self)
+        self.search_case_sensitive_checkbox.stateChanged.connect(self._search_lineedit_text_changed)
+        from ..data import nasdaqlisted_df, otherlisted_df
         if etf:
             df1 = nasdaqlisted_df[ nasdaqlisted_df['ETF'] == 'Y' ][['ticker', 'Security Name']]
             df2 = otherlisted_df[ otherlisted_df['ETF'] == 'Y' ][['ticker', 'Security Name', 'Exchange']]
@@ -763,140 +1220,44 @@ class ticker_db_dialog(QDialog):
                                                'Z': 'BATS Global Markets (BATS)',
                                                'V': 'Investors\' Exchange, LLC (IEXG)'})
         df = pd.concat([df1, df2],axis=0)[['ticker', 'Security Name', 'Exchange']].reset_index().drop(['index'],axis=1) # axis=0 (1): row (column)
-        self.text_browser.setHtml(df.to_html(index=True))
+        # table view: the model holds the listing, the proxy model sorts it and filters it (with the search index, and on all the columns)
+        self.table_model = dataframe_table_model(df, parent=self)
+        self.proxy_model = search_filter_proxy_model(self, ticker_column=0)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.proxy_model.setFilterKeyColumn(-1)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.table_view = QTableView(parent=self)
+        self.table_view.setModel(self.proxy_model)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(-1, Qt.AscendingOrder) # the listing order, until a column header is clicked
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setWordWrap(False)
+        self.table_view.verticalHeader().setDefaultSectionSize(self.table_view.fontMetrics().height() + 4) # fixed row heights: no per-row layout
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+        self.table_view.setColumnWidth(0, self.table_view.fontMetrics().averageCharWidth() * 10)
+        self.table_view.setColumnWidth(1, self.table_view.fontMetrics().averageCharWidth() * 60)
         # layout
         self.layout = QGridLayout()
         self.layout.addWidget(self.search_label, 0, 0)
         self.layout.addWidget(self.search_lineedit, 0, 1)
-        self.layout.addWidget(self.search_backward_checkbox, 0, 2)
-        self.layout.addWidget(self.search_case_sensitive_checkbox, 0, 3)
-        self.layout.addWidget(self.text_browser, 1, 0, 1, 4)
+        self.layout.addWidget(self.search_case_sensitive_checkbox, 0, 2)
+        self.layout.addWidget(self.table_view, 1, 0, 1, 3)
         self.setLayout(self.layout)
 
-    def _search_lineedit_return_pressed(self):
-        search_str = self.search_lineedit.text()
-        flag = QTextDocument.FindFlags()
-        if self.search_backward_checkbox.isChecked():
-            flag = flag | QTextDocument.FindBackward
+    def _search_lineedit_text_changed(self, *args):
         if self.search_case_sensitive_checkbox.isChecked():
-            flag = flag | QTextDocument.FindCaseSensitively
-        self.text_browser.find(search_str, flag)
-
-
-class research_dialog(QDialog):
-    def __init__(self, parent=None, *args, **kwargs):
-        super().__init__(parent=parent, *args, **kwargs)
-        self.app_window = parent
-        self.home_url_str = "https://google.com"
-        self.home_qurl = QUrl.fromUserInput(self.home_url_str)
-        self.home_url_str = self.home_qurl.toString()
-        # lineedit
-        self.web_url_lineedit = web_url(parent=self, url_str = self.home_url_str)
-        # webview
-        self.webview = web_view(parent=self, qurl = self.home_qurl)
-        self.web_url_lineedit.returnPressed.connect(self.web_url_entered)
-        self.webview.page().urlChanged.connect(self.webview_url_changed)
-        self.webview.page().titleChanged.connect(self.setWindowTitle)
-        # toolbar
-        self.toolBar = QToolBar(parent=self)
-        #
-        self.backButton = QPushButton(parent=self)
-        self.backButton.setText("Back")
-        self.backButton.setAutoDefault(False)
-        self.backButton.clicked.connect(self.webview.back)
-        self.toolBar.addWidget(self.backButton)
-        #
-        self.forwardButton = QPushButton(parent=self)
-        self.forwardButton.setText("Forward")
-        self.forwardButton.setAutoDefault(False)
-        self.forwardButton.clicked.connect(self.webview.forward)
-        self.toolBar.addWidget(self.forwardButton)
-        #
-        self.reloadButton = QPushButton(parent=self)
-        self.reloadButton.setText("Reload")
-        self.reloadButton.setAutoDefault(False)
-        self.reloadButton.clicked.connect(self.webview.reload)
-        self.toolBar.addWidget(self.reloadButton)
-        #
-        self.website1Button = QPushButton(parent=self)
-        self.website1Button.setText(self.webview.ref_website1)
-        self.website1Button.setAutoDefault(False)
-        self.website1Button.clicked.connect(self.webview.reload_website1)
-        self.toolBar.addWidget(self.website1Button)
-        #
-        self.website2Button = QPushButton(parent=self)
-        self.website2Button.setText(self.webview.ref_website2)
-        self.website2Button.setAutoDefault(False)
-        self.website2Button.clicked.connect(self.webview.reload_website2)
-        self.toolBar.addWidget(self.website2Button)
-        #
-        self.website3Button = QPushButton(parent=self)
-        self.website3Button.setText(self.webview.ref_website3)
-        self.website3Button.setAutoDefault(False)
-        self.website3Button.clicked.connect(self.webview.reload_website3)
-        self.toolBar.addWidget(self.website3Button)
-        # layout
-        self.layout = QGridLayout()
-        self.layout.addWidget(self.web_url_lineedit, 0, 0)
-        self.layout.addWidget(self.toolBar, 1, 0)
-        self.layout.addWidget(self.webview, 2, 0)
-        self.setLayout(self.layout)
-
-    def web_url_entered(self):
-        url_entered = self.web_url_lineedit.text()
-        qurl_entered = QUrl.fromUserInput(url_entered)
-        if qurl_entered.isValid():
-            self.webview.load(qurl_entered)
-
-    def webview_url_changed(self, qurl):
-        self.web_url_lineedit.setText(qurl.toString())
-
-
-class web_url(QLineEdit):
-    def __init__(self, url_str="", *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.setReadOnly(False)
-        self.setText(url_str)
-
-
-# https://myprogrammingnotes.com/suppress-js-error-output-qtwebengine.html
-class web_engine_page(QWebEnginePage):
-    def __init__(self, profile, parent):
-        super().__init__(profile, parent) # parent=None
-    def javaScriptConsoleMessage(self, *args, **kwargs):
-        pass
-    
+            self.proxy_model.setFilterCaseSensitivity(Qt.CaseSensitive)
+        else:
+            self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy_model.set_query(self.search_lineedit.text())
 
-# reference: https://doc.qt.io/qtforpython/examples/tabbedbrowser.html
-class web_view(QWebEngineView):
-    def __init__(self, parent, qurl):
-        super().__init__()
-        # references
-        #self.page().profile().cachePath()
-        #self.page().profile().cookieStore()
-        #self.page().profile().persistentStoragePath()
-        #self.page().profile().clearAllVisitedLinks()
-        #self.page().profile().clearHttpCache()
-        #self.page().profile().cookieStore().deleteAllCookies()
-        self.web_engine_profile = QWebEngineProfile()
-        #print(self.web_engine_profile.isOffTheRecord())
-        #print(self.web_engine_profile.persistentStoragePath())
-        self.web_engine_page = web_engine_page(profile=self.web_engine_profile, parent=self)
-        #print(self.web_engine_page.profile().isOffTheRecord())
-        self.setPage(self.web_engine_page)
-        if not self.page().profile().isOffTheRecord():
-            raise ValueError("the profile should be off-the-record.")
-        self.setUrl(qurl)
-        self.ref_website1 = "Investopedia"
-        self.ref_website2 = "Nasdaq"
-        self.ref_website3 = "Yahoo Finance"
-        #self.ref_website4 = "Finviz"
-    def reload_website1(self):
-        self.load(QUrl.fromUserInput("https://investopedia.com"))
-    def reload_website2(self):
-        self.load(QUrl.fromUserInput("https://www.nasdaq.com/"))
-    def reload_website3(self):
-        self.load(QUrl.fromUserInput("https://finance.yahoo.com/"))
+    def _search_lineedit_return_pressed(self):
+        if self.proxy_model.rowCount() > 0:
+            self.table_view.selectRow(0)
+            self.table_view.scrollToTop()
 
 
 class app_menu(object):
@@ -905,14 +1266,7 @@ class app_menu(object):
         self._default_preference_settings()
         self.about_dialog = about_dialog(parent=self.app_window)
         self.preferences_dialog = preferences_dialog(parent=self.app_window, force_redownload_yfinance_data=self.force_redownload_yfinance_data, download_today_data=self.download_today_data, data_root_dir=self.data_root_dir)
-        self.download_data_dialog = download_data_dialog(parent=self.app_window)
-        self.research_dialog = research_dialog(parent=self.app_window)
-        self.high_dividends_dialog = high_dividends_dialog(parent=self.app_window)
-        self.etf_db_dialog = ticker_db_dialog(parent=self.app_window, etf=True)
-        self.equity_db_dialog = ticker_db_dialog(parent=self.app_window, etf=False)
-        self.fed_funds_rate_dialog = fed_funds_rate_dialog(parent=self.app_window)
-        self.options_dialog = options_dialog(parent=self.app_window)
-        self.screener_dialog = screener_dialog(parent=self.app_window)
+        # the other dialogs are created on first use (see __getattr__)
         # about
         aboutAct = QAction('&About', parent=self.app_window)
         aboutAct.setShortcut('Ctrl+A')
@@ -927,7 +1281,7 @@ class app_menu(object):
         download_Act = QAction('&Download data as cache', parent=self.app_window)
         download_Act.setShortcut('Ctrl+D')
         download_Act.setStatusTip('Download the latest data of tickers and store as cache')
-        download_Act.triggered.connect(self.download_data_dialog.exec)        
+        download_Act.triggered.connect(lambda checked=False: self.exec_dialog('download_data_dialog'))        
         # exit
         exitAct = QAction('&Exit', parent=self.app_window)
         exitAct.setShortcut('Ctrl+Q')
@@ -944,28 +1298,28 @@ class app_menu(object):
         self.app_window.AppMenu.addAction(exitAct)
         # view
         webAct = QAction('&Useful websites', parent=self.app_window)
-        webAct.triggered.connect(self.research_dialog.exec)
+        webAct.triggered.connect(lambda checked=False: self.exec_dialog('research_dialog'))
         #
         high_dividendsAct = QAction('&High-dividend investments', parent=self.app_window)
-        high_dividendsAct.triggered.connect(self.high_dividends_dialog.exec)
+        high_dividendsAct.triggered.connect(lambda checked=False: self.exec_dialog('high_dividends_dialog'))
         #
         etf_db_Act = QAction('&ETF database', parent=self.app_window)
-        etf_db_Act.triggered.connect(self.etf_db_dialog.exec)
+        etf_db_Act.triggered.connect(lambda checked=False: self.exec_dialog('etf_db_dialog'))
         #
         equity_db_Act = QAction('&Equity database', parent=self.app_window)
-        equity_db_Act.triggered.connect(self.equity_db_dialog.exec)
+        equity_db_Act.triggered.connect(lambda checked=False: self.exec_dialog('equity_db_dialog'))
         #
         fed_funds_rate_Act = QAction('&Federal funds rate', parent=self.app_window)
         fed_funds_rate_Act.setShortcut('Ctrl+F')
-        fed_funds_rate_Act.triggered.connect(self.fed_funds_rate_dialog.exec)
+        fed_funds_rate_Act.triggered.connect(lambda checked=False: self.exec_dialog('fed_funds_rate_dialog'))
         #
         options_trading_Act = QAction('&Options trading', parent=self.app_window)
         options_trading_Act.setShortcut('Ctrl+O')
-        options_trading_Act.triggered.connect(self.options_dialog.exec)
+        options_trading_Act.triggered.connect(lambda checked=False: self.exec_dialog('options_dialog'))
         #
         screener_Act = QAction('&Screener', parent=self.app_window)
         screener_Act.setShortcut('Ctrl+S')
-        screener_Act.triggered.connect(self.screener_dialog.exec)
+        screener_Act.triggered.connect(lambda checked=False: self.exec_dialog('screener_dialog'))
         # 2. researchMenu
         self.app_window.ResearchMenu = self.app_window.menubar.addMenu('&Research')
         self.app_window.ResearchMenu.addAction(webAct)
@@ -979,6 +1333,34 @@ class app_menu(object):
         if self.add_additional_menu():
             self.build_additional_menu()
 
+    def _research_dialog(self):
+        from ._web import research_dialog # QtWebEngine is only loaded when the dialog is first opened
+        return research_dialog(parent=self.app_window)
+
+    # the dialogs created on first use: name -> factory(app_menu)
+    lazy_dialog_factory_dict = {
+        'download_data_dialog': lambda self: download_data_dialog(parent=self.app_window),
+        'research_dialog': lambda self: self._research_dialog(),
+        'high_dividends_dialog': lambda self: high_dividends_dialog(parent=self.app_window),
+        'etf_db_dialog': lambda self: ticker_db_dialog(parent=self.app_window, etf=True),
+        'equity_db_dialog': lambda self: ticker_db_dialog(parent=self.app_window, etf=False),
+        'fed_funds_rate_dialog': lambda self: fed_funds_rate_dialog(parent=self.app_window),
+        'options_dialog': lambda self: options_dialog(parent=self.app_window),
+        'screener_dialog': lambda self: screener_dialog(parent=self.app_window),
+    }
+
+    def __getattr__(self, name):
+        # only called for the attributes not set yet: create a lazy dialog on first access, and keep it
+        factory = type(self).lazy_dialog_factory_dict.get(name)
+        if factory is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        dialog = factory(self)
+        setattr(self, name, dialog)
+        return dialog
+
+    def exec_dialog(self, name: str = None):
+        return getattr(self, name).exec()
+
     def _default_preference_settings(self):
         self.force_redownload_yfinance_data = False
         self.download_today_data = True
@@ -1040,10 +1422,10 @@ class UI(QWidget):
         self.ticker_download_latest_data_from_yfinance_pushbutton = ticker_download_latest_data_from_yfinance_pushbutton(parent=self)
         self.ticker_canvas_coord_label = QLabel(text='', parent=self)
         self.ticker_lastdate_calendar_dialog = ticker_lastdate_calendar_dialog(parent=self)
-        self.ticker_canvas = canvas(parent=self, dpi=dpi, UI=self)
+        self.ticker_canvas = canvas(parent=self, dpi=dpi, UI=self, draggable=True)
         self.index_canvas_options = index_canvas_options(parent=self)
         self.index_canvas_coord_label = QLabel(text='', parent=self)
-        self.index_canvas = canvas(parent=self, dpi=dpi, UI=self)
+        self.index_canvas = canvas(parent=self, dpi=dpi, UI=self, draggable=True)
 
         self.message_dialog = message_dialog(parent=self)
 
@@ -1086,14 +1468,38 @@ class UI_control(object):
         self._UI.message_dialog.textinfo_ok_button.clicked.connect(self._message_dialog_textinfo_ok_button_clicked)
         self._UI.index_selection.currentIndexChanged.connect(self._index_selection_change)
         self._UI.index_canvas_options.currentIndexChanged.connect(self._index_canvas_options_change)
+        self._UI.ticker_textinfo.setOpenLinks(False) # links are handled by _ticker_textinfo_anchor_clicked
+        self._UI.ticker_textinfo.anchorClicked.connect(self._ticker_textinfo_anchor_clicked)
         self.timeframe_text = None
-        self.ticker_data_dict_in_effect = None
+        self.ticker_data_view = None
         self._ticker_selected = False
         self.selected_ticker = None
         self.ticker_canvas_cursor = None
         self.index_canvas_cursor = None
+        self.index_columns_dict = {'PVI and NVI': ['PVI','NVI','PVI_EMA9','NVI_EMA9','PVI_EMA255','NVI_EMA255'],
+                                   'RSI': ['RSI14'],
+                                   'MACD': ['MACD_macd','MACD_signal','MACD_histogram'],
+                                   'OBV': ['OBV','OBV_EMA9','OBV_EMA255'],
+                                   'Heat': ['Z_price_vol','Z_price_vol_EMA9','Z_price_vol_EMA255'],
+                                   'Supply & Demand': ['Z_price_vol','Z_price_vol_EMA9','Z_price_vol_EMA255']}
+        start_search_index_build() # in the background: the ticker searches use it once it is ready
+        self.ticker_loader_pool = QThreadPool()
+        self.ticker_loader_pool.setMaxThreadCount(max(2, min(4, QThreadPool.globalInstance().maxThreadCount())))
+        self.ticker_loader_signals = ticker_loader_signals()
+        self.ticker_loader_signals._signal.connect(self._ticker_loaded)
+        self._ticker_loaders = {} # {(ticker, mode): ticker_loader}, queued or running
+        self._ticker_waiting = None # (ticker, 'load' or 'redownload', refresh_only) to be shown once loaded
+        self._ticker_data_cache = OrderedDict() # {ticker: (ticker data dict, data signature)}, prefetched or recently viewed, most recently used last
+        self.ticker_data_cache_size = 16
+        self.ticker_prefetch_neighbours = 2
+        self._indicators_cache = OrderedDict() # {ticker: (history_indicators, history signature)}, most recently used last
+        self.indicators_cache_size = 32
+        self._index_view = None
+        self._index_view_start = 0
         self.timeframe_dict = {"1 week": 1/52, "2 weeks": 1/26, "1 month": 1/12, "2 months": 1/6, "3 months": 1/4, "6 months": 1/2, "1 year": 1.0, "2 years": 2.0, "5 years": 5.0, "10 years": 10.0, "15 years": 15.0, "20 years": 20.0, "30 years": 30.0, "All time": float('inf')}
         self.time_last_date = pd.to_datetime(date.today(), utc=True)
+        self.ticker_viewport = None # the bars in view on both canvases, (start, stop) over the full history (see _set_viewport)
+        self.viewport_min_bars = 5 # the narrowest zoom
         self.timeframe_selection_index = list(self.timeframe_dict).index('1 year') + 1
         self.index_options_selection_index = 1
         self.index_selection_index = 2
@@ -1142,21 +1548,14 @@ class UI_control(object):
                 self.index_options_selection_index = 1
                 self._UI.index_canvas_options.setCurrentIndex(self.index_options_selection_index) 
 
-            self._calc_index()
             self._draw_index_canvas()
 
     def _group_selection_change(self, index: int = None):
         if index > 0:
             self._group_selected = self._UI.group_selection.itemText(index)
             # subgroup selection
-            self._UI.subgroup_selection.reset()
-            for subgroup in subgroup_group_dict[self._group_selected]:
-                self._UI.subgroup_selection.addItem(subgroup)
-            self._UI.subgroup_selection.setCurrentIndex(1) # The item of index=1 is 'All'
-            # ticker selection
-            self._UI.ticker_selection.reset()
-            for ticker in ticker_group_dict[self._group_selected]:
-                self._UI.ticker_selection.addItem(ticker)
+            self._UI.subgroup_selection.set_items(subgroup_group_dict[self._group_selected])
+            self._UI.subgroup_selection.setCurrentIndex(1) # The item of index=1 is 'All': this also sets the ticker selection to the group
             # ticker texinfo
             self._UI.ticker_textinfo.setText(group_desc_dict[self._group_selected])
             # group_or_subgroup_selection_change
@@ -1166,15 +1565,12 @@ class UI_control(object):
         if index > 0:
             subgroup_selected = self._UI.subgroup_selection.itemText(index)
             # ticker selection
-            self._UI.ticker_selection.reset()
             if index == 1: # 'All'
-                for ticker in ticker_group_dict[self._group_selected]:
-                    self._UI.ticker_selection.addItem(ticker)
+                self._UI.ticker_selection.set_items(ticker_group_dict[self._group_selected])
                 # ticker texinfo
                 self._UI.ticker_textinfo.setText(group_desc_dict[self._group_selected])
             else:
-                for ticker in ticker_subgroup_dict[subgroup_selected]:
-                    self._UI.ticker_selection.addItem(ticker)
+                self._UI.ticker_selection.set_items(ticker_subgroup_dict[subgroup_selected])
                 # ticker texinfo
                 self._UI.ticker_textinfo.setText(group_desc_dict[self._group_selected] + f"\n\nSubgroup: [{subgroup_selected}]")
 
@@ -1182,11 +1578,11 @@ class UI_control(object):
         # ticker frame selection
         self._UI.ticker_timeframe_selection.reset()
         # ticker canvas
-        self._UI.ticker_canvas.axes.clear()
+        self._UI.ticker_canvas.reset_axes()
         self._UI.ticker_canvas.draw()
         self._UI.ticker_canvas_coord_label.clear()
         # index canvas
-        self._UI.index_canvas.axes.clear()
+        self._UI.index_canvas.reset_axes()
         self._UI.index_canvas.draw()
         self._UI.index_canvas_coord_label.clear()
         # index selection
@@ -1200,286 +1596,281 @@ class UI_control(object):
         self._UI.ticker_download_latest_data_from_yfinance_pushbutton.reset()
         # others
         self._ticker_selected = False
+        self._ticker_waiting = None
+        self._cancel_ticker_loaders()
 
     def _ticker_selection_change(self, index: int = None):
         if index > 0:
             self.selected_ticker = self._UI.ticker_selection.itemText(index).upper()
-            if self.selected_ticker not in ticker_group_dict['All']:
+            if not get_universe_index().in_group(self.selected_ticker, 'All'):
                 print(f"Info: unrecognized ticker was entered: [{self.selected_ticker}]")
 
-            self.ticker_data_dict_original = get_ticker_data_dict(ticker = self.selected_ticker, 
-                                                                  force_redownload = self._UI.app_window.app_menu.preferences_dialog.force_redownload_yfinance_data, 
-                                                                  download_today_data = self._UI.app_window.app_menu.preferences_dialog.download_today_data, 
-                                                                  data_root_dir=self._UI.app_window.app_menu.preferences_dialog.data_root_dir)
-            self.ticker_data_dict_in_effect = copy.deepcopy(self.ticker_data_dict_original)
-            self._calc_index()
-
-            self._UI.ticker_textinfo.setHtml(get_formatted_ticker_data(self.ticker_data_dict_in_effect, use_html=True))
+            self._load_ticker(self.selected_ticker, mode = 'redownload' if self._UI.app_window.app_menu.preferences_dialog.force_redownload_yfinance_data else 'load')
+            self._prefetch_tickers(index)
 
-            self._UI.ticker_timeframe_selection.reset()
-            for timeframe in self.timeframe_dict.keys():
-                self._UI.ticker_timeframe_selection.addItem(timeframe)
+    def _show_ticker(self, ticker_data_dict: dict = None):
+        self.ticker_data_dict_original = ticker_data_dict
+        self.ticker_indicators = self._get_ticker_indicators(self.selected_ticker, self.ticker_data_dict_original['history'])
+        self.ticker_calendar = self.ticker_indicators.calendar
+        # the data in effect is a view of the loaded ticker data dict: its sections are shared, not copied
+        self.ticker_data_view = ticker_data_view(self.ticker_data_dict_original)
+        self._calc_index()
 
-            self.time_last_date = self.ticker_data_dict_in_effect['history']['Date'].iloc[-1]
-            self._UI.ticker_lastdate_calendar_dialog.ticker_lastdate_calendar.setMaximumDate(self.time_last_date)
-            self._UI.ticker_lastdate_calendar_dialog.ticker_lastdate_calendar.setSelectedDate(self.time_last_date)
-            self._UI.ticker_lastdate_pushbutton.setText(f"Last Date: {str(self.time_last_date.date())}")
-            self._UI.ticker_timeframe_selection.setCurrentIndex(self.timeframe_selection_index) # this changes self.ticker_data_dict_in_effect
+        self._UI.ticker_textinfo.setHtml(get_formatted_ticker_data(self.ticker_data_view, use_html=True, include_option_chain=False))
 
-            self._UI.ticker_canvas_coord_label.clear()
-            self._UI.index_canvas_coord_label.clear()
-            self._draw_ticker_canvas()
-            self._draw_index_canvas()
+        self._UI.ticker_timeframe_selection.reset()
+        for timeframe in self.timeframe_dict.keys():
+            self._UI.ticker_timeframe_selection.addItem(timeframe)
 
-            self._UI.index_selection.reset()
-            self._UI.index_selection.addItem("PVI and NVI")
-            self._UI.index_selection.addItem("RSI")
-            self._UI.index_selection.addItem("MACD")
-            self._UI.index_selection.addItem("OBV")
-            self._UI.index_selection.addItem("Heat")
-            self._UI.index_selection.addItem("Supply & Demand")
-            self._UI.index_selection.setCurrentIndex(self.index_selection_index)
+        self.time_last_date = self.ticker_data_dict_original['history']['Date'].iloc[-1]
+        self._UI.ticker_lastdate_calendar_dialog.ticker_lastdate_calendar.setMaximumDate(self.time_last_date)
+        self._UI.ticker_lastdate_calendar_dialog.ticker_lastdate_calendar.setSelectedDate(self.time_last_date)
+        self._UI.ticker_lastdate_pushbutton.setText(f"Last Date: {str(self.time_last_date.date())}")
 
-            self._UI.ticker_lastdate_pushbutton.setEnabled(True)
-            self._UI.ticker_download_latest_data_from_yfinance_pushbutton.setEnabled(True)
+        self._UI.ticker_canvas_coord_label.clear()
+        self._UI.index_canvas_coord_label.clear()
+        self.ticker_viewport = None
+        self._draw_ticker_canvas()
+        self._draw_index_canvas()
+        self._UI.ticker_timeframe_selection.setCurrentIndex(self.timeframe_selection_index) # this sets the viewport
 
-            self._ticker_selected = True
+        self._UI.index_selection.reset()
+        self._UI.index_selection.addItem("PVI and NVI")
+        self._UI.index_selection.addItem("RSI")
+        self._UI.index_selection.addItem("MACD")
+        self._UI.index_selection.addItem("OBV")
+        self._UI.index_selection.addItem("Heat")
+        self._UI.index_selection.addItem("Supply & Demand")
+        self._UI.index_selection.setCurrentIndex(self.index_selection_index)
+
+        self._UI.ticker_lastdate_pushbutton.setEnabled(True)
+        self._UI.ticker_download_latest_data_from_yfinance_pushbutton.setEnabled(True)
+
+        self._ticker_selected = True
+
+    def _set_canvas_cursor(self, canvas=None, name: str = None, series: str = None, dates=None):
+        # the crosshair is created with the layout of the canvas (its handlers are disconnected by canvas.reset_axes()), and then only gets new data
+        canvas.cursor_series = series
+        y_data = canvas.decimated[series].y
+        if canvas.cursor is None:
+            canvas.cursor = SnappingCursor(dates=dates, y_data=y_data, ax=canvas.axes, useblit=True, color='black', linestyle='dashed', linewidth=1, name=name, UI=self._UI)
+        else:
+            canvas.cursor.set_data(dates=dates, y_data=y_data)
+        return canvas.cursor
 
     def _draw_ticker_canvas(self):
         canvas = self._UI.ticker_canvas
-        canvas.axes.clear()
-        # to skip non-existent dates on the plot
-        # x = self.ticker_data_dict_in_effect['history']['Date']
-        dates = self.ticker_data_dict_in_effect['history']['Date'].values
-        formatter = DateFormatter(dates)
-        canvas.axes.xaxis.set_major_formatter(formatter)
-        x = np.arange(len(dates))
+        data_view = self.ticker_data_view
+        # to skip non-existent dates on the plot, the bars are plotted at x = 0, 1, 2, ... and labeled with their dates
+        dates = data_view.column('Date')
         # volume bar
-        volumes = self.ticker_data_dict_in_effect['history']['Volume'].values
-        if volumes[0] is not None:
-            close = self.ticker_data_dict_in_effect['history']['Close']
-            scale_factor = (max(close.values) * 0.40) / max(volumes)
-            volumes = volumes * scale_factor
-            close_prev = self.ticker_data_dict_in_effect['history']['Close'].shift(1)
-            close_increase = (close >= close_prev).values
-            volume_color = ['#86cbc5' if chg else '#f69f9d' for chg in close_increase]
-            canvas.axes.bar(x, volumes, color=volume_color)
-        #
-        #ticker_plotline, = canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['Close'], color='tab:blue',                    linewidth=1)
-        canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['Close_EMA255'],             color='#9ed5f7', linestyle="dashed", linewidth=1)
-        canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['Close_EMA9'],               color='#9ed5f7',                     linewidth=1)
-        canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['Close'],                    color='tab:blue',                    linewidth=1)
-        canvas.axes.set_xlabel('Date', fontsize=10.0)
-        canvas.axes.set_ylabel('Close Price (EMA9, 255)', fontsize=10.0)
-        #
-        canvas.figure.autofmt_xdate()
-        ticker_plotline = None
-        actual_x_data = dates
-        x_index = x
-        y_data = self.ticker_data_dict_in_effect['history']['Close'].values
+        volumes = data_view.column('Volume')
+        has_volume = volumes[0] is not None
         #################################################
-        self.ticker_canvas_cursor = SnappingCursor(plotline=ticker_plotline, actual_x_data=actual_x_data, x_index=x_index, y_data=y_data, ax=canvas.axes, useblit=True, color='black', linestyle='dashed', linewidth=1, name='ticker_canvas_cursor', UI=self._UI)
-        canvas.mpl_connect('motion_notify_event',  self.ticker_canvas_cursor.onmove) # mpl = matplotlib
+        if canvas.layout != ('ticker', has_volume):
+            canvas.reset_axes(layout=('ticker', has_volume))
+            if has_volume:
+                canvas.add_decimated('Volume', decimated_bars(canvas.axes))
+            canvas.add_decimated('Close_EMA255', decimated_line(canvas.axes, color='#9ed5f7', linestyle="dashed", linewidth=1))
+            canvas.add_decimated('Close_EMA9',   decimated_line(canvas.axes, color='#9ed5f7',                     linewidth=1))
+            canvas.add_decimated('Close',        decimated_line(canvas.axes, color='tab:blue',                    linewidth=1))
+            canvas.axes.set_xlabel('Date', fontsize=10.0)
+            canvas.axes.set_ylabel('Close Price (EMA9, 255)', fontsize=10.0)
+            canvas.figure.autofmt_xdate()
         #################################################
-        canvas.mpl_connect('button_press_event',   canvas.button_pressed)
-        canvas.mpl_connect('button_release_event', canvas.button_released)
-        canvas.mpl_connect('motion_notify_event',  canvas.onmove)
+        if has_volume:
+            close = data_view.column('Close')
+            close_increase = np.concatenate([[False], close[1:] >= close[:-1]])
+            canvas.decimated['Volume'].set_data(volumes, colors=np.where(close_increase, '#86cbc5', '#f69f9d')) # scaled by _show_viewport
+        for column in ['Close_EMA255', 'Close_EMA9', 'Close']:
+            canvas.decimated[column].set_data(data_view.column(column))
+        canvas.set_dates(dates)
         #################################################
-        canvas.draw()
+        self.ticker_canvas_cursor = self._set_canvas_cursor(canvas, name='ticker_canvas_cursor', series='Close', dates=dates)
+        self._show_viewport(canvas, scale_y=True, y_include=[])
 
     def _draw_index_canvas(self):
-        actual_x_data = None
-        x_index = None
-        y_data = None
-
         canvas = self._UI.index_canvas
-        canvas.axes.clear()
-        canvas.axes.set_xlabel('Date', fontsize=10.0)
         #################################################
+        self._calc_selected_index()
         if self._index_selected is None:
+            canvas.reset_axes(layout=None)
+            canvas.axes.set_xlabel('Date', fontsize=10.0)
             canvas.axes.set_ylabel('Index to be selected', fontsize=10.0)
-            canvas.draw()
+            canvas.draw_idle()
             return
-
-        elif self._index_selected == 'PVI and NVI':
-            canvas.axes.set_ylabel('PVI (green) and NVI (orange) (EMA9, 255)', fontsize=10.0)
-            if all(v is None for v in self.ticker_data_dict_in_effect['history']['PVI_EMA9']):
-                canvas.draw()
+        data_view = self.ticker_data_view
+        # to skip non-existent dates on the plot, the bars are plotted at x = 0, 1, 2, ... and labeled with their dates
+        dates = data_view.column('Date')
+        scale_y = True
+        y_include = []
+        #################################################
+        if self._index_selected == 'PVI and NVI':
+            if all(v is None for v in data_view.column('PVI_EMA9')):
+                canvas.reset_axes(layout=('PVI and NVI', False))
+                canvas.axes.set_xlabel('Date', fontsize=10.0)
+                canvas.axes.set_ylabel('PVI (green) and NVI (orange) (EMA9, 255)', fontsize=10.0)
+                canvas.draw_idle()
                 return
-            # to skip non-existent dates on the plot
-            dates = self.ticker_data_dict_in_effect['history']['Date'].values
-            formatter = DateFormatter(dates)
-            canvas.axes.xaxis.set_major_formatter(formatter)
-            x = np.arange(len(dates))
-            #
-            #index_plotline_PVI, = canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['PVI'], color='tab:green',    linewidth=1.0)
-            #index_plotline_NVI, = canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['NVI'], color='tab:orange',   linewidth=1.0)
-            canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['PVI_EMA255'], color='#baf1b2', linestyle="dashed", linewidth=1.0)
-            canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['NVI_EMA255'], color='#efb663', linestyle="dashed", linewidth=1.0)
-            canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['PVI_EMA9'],   color='#baf1b2',                     linewidth=1.0)
-            canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['NVI_EMA9'],   color='#efb663',                     linewidth=1.0)
-            canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['PVI'], color='tab:green',    linewidth=1.0)
-            canvas.axes.plot(x, self.ticker_data_dict_in_effect['history']['NVI'], color='tab:orange',   linewidth=1.0)
-            #################################################
-            canvas.figure.autofmt_xdate()
+            columns = ['PVI_EMA255', 'NVI_EMA255', 'PVI_EMA9', 'NVI_EMA9', 'PVI', 'NVI']
+            if canvas.layout != ('PVI and NVI', True):
+                canvas.reset_axes(layout=('PVI and NVI', True))
+                canvas.axes.set_ylabel('PVI (green) and NVI (orange) (EMA9, 255)', fontsize=10.0)
+                #index_plotline_PVI, = canvas.axes.plot(x, data_view.column('PVI'), color='tab:green',    linewidth=1.0)
+                #index_plotline_NVI, = canvas.axes.plot(x, data_view.column('NVI'), color='tab:orange',   linewidth=1.0)
+                canvas.add_decimated('PVI_EMA255', decimated_line(canvas.axes, color='#baf1b2', linestyle="dashed", linewidth=1.0))
+                canvas.add_decimated('NVI_EMA255', decimated_line(canvas.axes, color='#efb663', linestyle="dashed", linewidth=1.0))
+                canvas.add_decimated('PVI_EMA9',   decimated_line(canvas.axes, color='#baf1b2',                     linewidth=1.0))
+                canvas.add_decimated('NVI_EMA9',   decimated_line(canvas.axes, color='#efb663',                     linewidth=1.0))
+                canvas.add_decimated('PVI',        decimated_line(canvas.axes, color='tab:green',                   linewidth=1.0))
+                canvas.add_decimated('NVI',        decimated_line(canvas.axes, color='tab:orange',                  linewidth=1.0))
+            for column in columns:
+                canvas.decimated[column].set_data(data_view.column(column))
             if self.index_options_selection_index == 1:
-                #index_plotline = index_plotline_PVI
-                index_plotline = None
-                actual_x_data = dates
-                x_index = x
-                y_data = self.ticker_data_dict_in_effect['history']['PVI'].values
+                cursor_series = 'PVI'
             elif self.index_options_selection_index == 2:
-                #index_plotline = index_plotline_NVI
-                index_plotline = None
-                actual_x_data = dates
-                x_index = x
-                y_data = self.ticker_data_dict_in_effect['history']['NVI'].values
+                cursor_series = 'NVI'
             else:
                 raise ValueError("index options selection index not within range")
 
         elif self._index_selected == 'RSI':
-            # to skip non-existent dates on the plot
-            dates = self.ticker_data_dict_in_effect['history']['Date'].values
-            formatter = DateFormatter(dates)
-            canvas.axes.xaxis.set_major_formatter(formatter)
-            x = np.arange(len(dates))
-            #
-            n_ticks = len(x)
-            y70 = np.empty(n_ticks); y70.fill(70)
-            y30 = np.empty(n_ticks); y30.fill(30)
-            canvas.axes.set_ylabel('RSI14', fontsize=10.0)
-            canvas.axes.set_ylim(0, 100)
-            y = self.ticker_data_dict_in_effect['history']['RSI14']
-            canvas.axes.plot(x, y30, '--', color='black', linewidth=0.5)
-            canvas.axes.plot(x, y70, '--', color='black', linewidth=0.5)
-            canvas.axes.fill_between(x, y30, y70, where=(y30<y70), color='tab:blue',  alpha=0.05, interpolate=True)
-            canvas.axes.fill_between(x, y,   y70, where=(y>y70),   color='tab:green', alpha=0.3,  interpolate=True)
-            canvas.axes.fill_between(x, y,   y30, where=(y<y30),   color='tab:red',   alpha=0.3,  interpolate=True)
-            #index_plotline, = canvas.axes.plot(x, y, color='tab:blue', linewidth=1)
-            canvas.axes.plot(x, y, color='tab:blue', linewidth=1)
-            #
-            canvas.figure.autofmt_xdate()
-            index_plotline = None
-            actual_x_data = dates
-            x_index = x
-            y_data = y.values
+            if canvas.layout != ('RSI',):
+                canvas.reset_axes(layout=('RSI',))
+                canvas.axes.set_ylabel('RSI14', fontsize=10.0)
+                canvas.axes.set_ylim(0, 100)
+                canvas.axes.axhline(30, linestyle='--', color='black', linewidth=0.5)
+                canvas.axes.axhline(70, linestyle='--', color='black', linewidth=0.5)
+                canvas.axes.axhspan(30, 70, color='tab:blue', alpha=0.05, linewidth=0)
+                canvas.add_decimated('RSI14_above_70', decimated_fill_between(canvas.axes, 70, where=np.greater, color='tab:green', alpha=0.3))
+                canvas.add_decimated('RSI14_below_30', decimated_fill_between(canvas.axes, 30, where=np.less,    color='tab:red',   alpha=0.3))
+                #index_plotline, = canvas.axes.plot(x, y, color='tab:blue', linewidth=1)
+                canvas.add_decimated('RSI14', decimated_line(canvas.axes, color='tab:blue', linewidth=1))
+            for name in ['RSI14_above_70', 'RSI14_below_30', 'RSI14']:
+                canvas.decimated[name].set_data(data_view.column('RSI14'))
+            scale_y = False
+            cursor_series = 'RSI14'
 
         elif self._index_selected == 'MACD':
             # https://stackoverflow.com/questions/43029895/python-matlabplot-with-datetime-numpy-array-how-to-skip-days-in-plot
-            # to skip non-existent dates on the plot
-            dates = self.ticker_data_dict_in_effect['history']['Date'].values
-            formatter = DateFormatter(dates)
-            canvas.axes.xaxis.set_major_formatter(formatter)
-            x = np.arange(len(dates))
-            #
-            canvas.axes.set_ylabel('MACD', fontsize=10.0)
-            MACD_macd = self.ticker_data_dict_in_effect['history']['MACD_macd']
-            MACD_signal = self.ticker_data_dict_in_effect['history']['MACD_signal']
-            MACD_histogram = self.ticker_data_dict_in_effect['history']['MACD_histogram']
-            # The ternary operator has the same syntax:
-            # [(token if emoticon_re.search(token) else token.lower()) for token in tokens]
+            if canvas.layout != ('MACD',):
+                canvas.reset_axes(layout=('MACD',))
+                canvas.axes.set_ylabel('MACD', fontsize=10.0)
+                canvas.axes.axhline(0, linestyle='--', color='black', linewidth=0.5)
+                canvas.add_decimated('MACD_histogram', decimated_bars(canvas.axes))
+                canvas.add_decimated('MACD_macd',      decimated_line(canvas.axes, color='tab:blue', linewidth=1))
+                canvas.add_decimated('MACD_signal',    decimated_line(canvas.axes, color='tab:orange', linewidth=1))
+            MACD_macd = data_view.column('MACD_macd')
+            MACD_signal = data_view.column('MACD_signal')
+            MACD_histogram = data_view.column('MACD_histogram')
             color_cross_above_and_increase = '#26A69A'
             color_cross_above_and_decrease = '#B2DFDB'
             color_cross_below_and_increase = '#FFCDD2'
             color_cross_below_and_decrease = '#EF5350'
-            MACD_increase = (MACD_histogram > MACD_histogram.shift(1)).values
-            MACD_hist_color = [((color_cross_above_and_increase if MACD_increase[idx] else color_cross_above_and_decrease) if cross>=0 else (color_cross_below_and_increase if MACD_increase[idx] else color_cross_below_and_decrease)) for idx, cross in enumerate(MACD_histogram)]
-            # 
-            n_ticks = len(x)
-            y0 = np.empty(n_ticks); y0.fill(0)
-            canvas.axes.plot(x, y0, '--', color='black', linewidth=0.5)
-            #
-            canvas.axes.bar(x, MACD_histogram, color=MACD_hist_color)
-            canvas.axes.plot(x, MACD_macd, color='tab:blue', linewidth=1)
-            canvas.axes.plot(x, MACD_signal, color='tab:orange', linewidth=1)
-            #
-            canvas.figure.autofmt_xdate()
-            index_plotline = None
-            actual_x_data = dates
-            x_index = x
-            y_data = MACD_macd.values
+            MACD_increase = np.concatenate([[False], MACD_histogram[1:] > MACD_histogram[:-1]])
+            MACD_cross_above = MACD_histogram >= 0
+            MACD_hist_color = np.where(MACD_cross_above, np.where(MACD_increase, color_cross_above_and_increase, color_cross_above_and_decrease), 
+                                                         np.where(MACD_increase, color_cross_below_and_increase, color_cross_below_and_decrease))
+            canvas.decimated['MACD_histogram'].set_data(MACD_histogram, colors=MACD_hist_color)
+            canvas.decimated['MACD_macd'].set_data(MACD_macd)
+            canvas.decimated['MACD_signal'].set_data(MACD_signal)
+            y_include = [0]
+            cursor_series = 'MACD_macd'
 
         elif self._index_selected == 'OBV':
-            # to skip non-existent dates on the plot
-            dates = self.ticker_data_dict_in_effect['history']['Date'].values
-            formatter = DateFormatter(dates)
-            canvas.axes.xaxis.set_major_formatter(formatter)
-            x = np.arange(len(dates))
-            canvas.axes.set_ylabel('On-Balance Volume (EMA9, EMA255)', fontsize=10.0)
-            obv = self.ticker_data_dict_in_effect['history']['OBV']
-            obv_255 = self.ticker_data_dict_in_effect['history']['OBV_EMA255']
-            obv_9 = self.ticker_data_dict_in_effect['history']['OBV_EMA9']
-            color_obv = '#3A6CA8'
-            canvas.axes.plot(x, obv_255, color='#9ed5f7', linestyle="dashed", linewidth=1)
-            canvas.axes.plot(x, obv_9,   color='#9ed5f7',                     linewidth=1)
-            canvas.axes.plot(x, obv,     color=color_obv, linewidth=1)
-            #
-            canvas.figure.autofmt_xdate()
-            index_plotline = None
-            actual_x_data = dates
-            x_index = x
-            y_data = obv.values
-
-        elif self._index_selected == 'Heat':
-            # to skip non-existent dates on the plot
-            dates = self.ticker_data_dict_in_effect['history']['Date'].values
-            formatter = DateFormatter(dates)
-            canvas.axes.xaxis.set_major_formatter(formatter)
-            x = np.arange(len(dates))
-            #
-            n_ticks = len(x)
-            y0 = np.empty(n_ticks); y0.fill(0)
-            canvas.axes.plot(x, y0, '--', color='#0e6b0e', linewidth=0.5)
-            #
-            canvas.axes.set_ylabel('Standardized Price * Volume (EMA9, EMA255)', fontsize=10.0)
-            Z_price_vol = self.ticker_data_dict_in_effect['history']['Z_price_vol']
-            Z_price_vol_EMA9 = self.ticker_data_dict_in_effect['history']['Z_price_vol_EMA9']
-            Z_price_vol_EMA255 = self.ticker_data_dict_in_effect['history']['Z_price_vol_EMA255']
-            color_Z_price_vol = '#3A6CA8'
-            canvas.axes.plot(x, Z_price_vol_EMA255, color='#9ed5f7', linestyle="dashed", linewidth=1)
-            canvas.axes.plot(x, Z_price_vol_EMA9,   color='tab:red',                     linewidth=1)
-            canvas.axes.plot(x, Z_price_vol,        color=color_Z_price_vol,             linewidth=1)
-            #
-            canvas.figure.autofmt_xdate()
-            index_plotline = None
-            actual_x_data = dates
-            x_index = x
-            y_data = Z_price_vol.values
-
-        elif self._index_selected == 'Supply & Demand':
-            # to skip non-existent dates on the plot
-            dates = self.ticker_data_dict_in_effect['history']['Date'].values
-            formatter = DateFormatter(dates)
-            canvas.axes.xaxis.set_major_formatter(formatter)
-            x = np.arange(len(dates))
-            #
-            n_ticks = len(x)
-            y0 = np.empty(n_ticks); y0.fill(0)
-            canvas.axes.plot(x, y0, '--', color='#0e6b0e', linewidth=0.5)
-            #
-            canvas.axes.set_ylabel('Standardized Price * Volume (EMA9, EMA255)', fontsize=10.0)
-            Z_price_vol = self.ticker_data_dict_in_effect['history']['Z_price_vol']
-            Z_price_vol_EMA9 = self.ticker_data_dict_in_effect['history']['Z_price_vol_EMA9']
-            Z_price_vol_EMA255 = self.ticker_data_dict_in_effect['history']['Z_price_vol_EMA255']
-            color_Z_price_vol = '#3A6CA8'
-            canvas.axes.plot(x, Z_price_vol_EMA255, color='#9ed5f7', linestyle="dashed", linewidth=1)
-            canvas.axes.plot(x, Z_price_vol_EMA9,   color='tab:red',                     linewidth=1)
-            canvas.axes.plot(x, Z_price_vol,        color=color_Z_price_vol,             linewidth=1)
-            #
-            canvas.figure.autofmt_xdate()
-            index_plotline = None
-            actual_x_data = dates
-            x_index = x
-            y_data = Z_price_vol.values
+            if canvas.layout != ('OBV',):
+                canvas.reset_axes(layout=('OBV',))
+                canvas.axes.set_ylabel('On-Balance Volume (EMA9, EMA255)', fontsize=10.0)
+                color_obv = '#3A6CA8'
+                canvas.add_decimated('OBV_EMA255', decimated_line(canvas.axes, color='#9ed5f7', linestyle="dashed", linewidth=1))
+                canvas.add_decimated('OBV_EMA9',   decimated_line(canvas.axes, color='#9ed5f7',                     linewidth=1))
+                canvas.add_decimated('OBV',        decimated_line(canvas.axes, color=color_obv, linewidth=1))
+            for column in ['OBV_EMA255', 'OBV_EMA9', 'OBV']:
+                canvas.decimated[column].set_data(data_view.column(column))
+            cursor_series = 'OBV'
+
+        elif self._index_selected in ['Heat', 'Supply & Demand']:
+            if canvas.layout != ('Z_price_vol',):
+                canvas.reset_axes(layout=('Z_price_vol',))
+                canvas.axes.axhline(0, linestyle='--', color='#0e6b0e', linewidth=0.5)
+                canvas.axes.set_ylabel('Standardized Price * Volume (EMA9, EMA255)', fontsize=10.0)
+                color_Z_price_vol = '#3A6CA8'
+                canvas.add_decimated('Z_price_vol_EMA255', decimated_line(canvas.axes, color='#9ed5f7', linestyle="dashed", linewidth=1))
+                canvas.add_decimated('Z_price_vol_EMA9',   decimated_line(canvas.axes, color='tab:red',                     linewidth=1))
+                canvas.add_decimated('Z_price_vol',        decimated_line(canvas.axes, color=color_Z_price_vol,             linewidth=1))
+            for column in ['Z_price_vol_EMA255', 'Z_price_vol_EMA9', 'Z_price_vol']:
+                canvas.decimated[column].set_data(data_view.column(column))
+            y_include = [0]
+            cursor_series = 'Z_price_vol'
 
         else:
             raise ValueError(f"Unexpected self._index_selected = [{self._index_selected}]")
 
         #################################################
-        self.index_canvas_cursor = SnappingCursor(plotline=index_plotline, actual_x_data=actual_x_data, x_index=x_index, y_data=y_data, ax=canvas.axes, useblit=True, color='black', linestyle='dashed', linewidth=1, name='index_canvas_cursor', UI=self._UI)
-        canvas.mpl_connect('motion_notify_event', self.index_canvas_cursor.onmove)
+        if canvas.cursor is None:
+            # new layout
+            canvas.axes.set_xlabel('Date', fontsize=10.0)
+            canvas.figure.autofmt_xdate()
+        canvas.set_dates(dates)
         #################################################
-        canvas.draw()
+        self.index_canvas_cursor = self._set_canvas_cursor(canvas, name='index_canvas_cursor', series=cursor_series, dates=dates)
+        self._show_viewport(canvas, scale_y=scale_y, y_include=y_include)
+
+    def _set_viewport(self, start: int = None, stop: int = None):
+        """
+        show the bars [start, stop) of the full history on both canvases (clamped to the history): a timeframe, a last date,
+        a drag or a zoom only moves this integer window over the series already plotted, and the canvases are redecimated
+        """
+        n_bars = len(self.ticker_calendar)
+        width = min(max(stop - start, 1), n_bars)
+        start = min(max(start, 0), n_bars - width)
+        viewport = (start, start + width)
+        if viewport == self.ticker_viewport:
+            return
+        self.ticker_viewport = viewport
+        # the last date follows the viewport
+        self.time_last_date = self.ticker_calendar.date(viewport[1] - 1)
+        self._UI.ticker_lastdate_calendar_dialog.ticker_lastdate_calendar.setSelectedDate(self.time_last_date)
+        self._UI.ticker_lastdate_pushbutton.setText(f"Last Date: {str(self.time_last_date.date())}")
+        self._show_viewport(self._UI.ticker_canvas)
+        self._show_viewport(self._UI.index_canvas)
+
+    def _zoom_viewport(self, center: float = None, factor: float = None):
+        start, stop = self.ticker_viewport
+        width = min(max(int(round((stop - start) * factor)), self.viewport_min_bars), len(self.ticker_calendar))
+        # the bar under the mouse stays in place
+        start = int(round(center - (center - start) * width / (stop - start)))
+        self._set_viewport(start, start + width)
+
+    def _show_viewport(self, canvas=None, scale_y: bool = None, y_include: list = None):
+        """
+        set the viewport of the canvas, after rescaling its series that depend on the bars in view: the volume bars (to 40% of
+        the highest close in view), PVI and NVI (each to 0 ~ 1000 in view), and Z_price_vol (standardized as of the last bar in view)
+        """
+        data_view = self.ticker_data_view
+        start, stop = (0, len(self.ticker_calendar)) if self.ticker_viewport is None else self.ticker_viewport
+        decimated = canvas.decimated
+        rescaled = []
+        if 'Volume' in decimated:
+            volumes = data_view.column('Volume').astype(float)
+            scale_factor = (np.nanmax(data_view.column('Close')[start:stop]) * 0.40) / np.nanmax(volumes[start:stop])
+            decimated['Volume'].set_data(volumes * scale_factor, colors=decimated['Volume'].colors)
+        if 'PVI' in decimated:
+            for group in [['PVI','PVI_EMA9','PVI_EMA255'], ['NVI','NVI_EMA9','NVI_EMA255']]:
+                group_max = max(np.nanmax(data_view.column(column)[start:stop]) for column in group)
+                group_min = min(np.nanmin(data_view.column(column)[start:stop]) for column in group)
+                for column in group:
+                    decimated[column].set_data((data_view.column(column) - group_min) / (group_max - group_min) * 1000)
+                rescaled += group
+        if 'Z_price_vol' in decimated and self.ticker_indicators.has_volume:
+            # the columns are standardized over the full history (self._index_view): restandardize them as of the last bar in view
+            mean, std = self._index_view.price_vol_mean_std()
+            asof_mean, asof_std = self.ticker_indicators.as_of(stop).price_vol_mean_std()
+            for column in ['Z_price_vol','Z_price_vol_EMA9','Z_price_vol_EMA255']:
+                decimated[column].set_data((data_view.column(column) * std + mean - asof_mean) / asof_std)
+                rescaled.append(column)
+        if canvas.cursor is not None and canvas.cursor_series in rescaled:
+            canvas.cursor.set_data(y_data=decimated[canvas.cursor_series].y)
+        canvas.set_viewport(self.ticker_viewport, scale_y=scale_y, y_include=y_include)
 
     def _index_canvas_options_change(self, index: int = None):
         if index > 0:
@@ -1493,58 +1884,77 @@ class UI_control(object):
             self.timeframe_selection_index = index
 
             if self.timeframe_text in self.timeframe_dict.keys():
-                history_df = self.ticker_data_dict_original['history'].copy()
                 if self.timeframe_text == "All time":
-                    time_first_date = history_df['Date'].iloc[0]
+                    time_first_date = self.ticker_calendar.first_date
                 else:
                     time_first_date = self.time_last_date - timedelta(days=365.25*self.timeframe_dict[self.timeframe_text])
-                history_df = history_df[(time_first_date<=history_df['Date']) & (history_df['Date']<=self.time_last_date)].copy()
-                if len(history_df) == 0:
+                window = self.ticker_calendar.slice(time_first_date, self.time_last_date)
+                if window.stop == window.start:
                     self._UI.message_dialog.textinfo.setText(f"No data available within the specified date range: {str(time_first_date.date())} ~ {str(self.time_last_date.date())}")
                     self._UI.message_dialog.exec()
                     return
-                self.ticker_data_dict_in_effect['history'] = history_df
-
-            self._calc_index()
-            self._draw_ticker_canvas()
-            self._draw_index_canvas()
+                self._set_viewport(window.start, window.stop)
+
+    def _get_ticker_indicators(self, ticker: str = None, history_df: pd.DataFrame = None):
+        """
+        the full-history indicators of the ticker, kept for the session as long as its history is unchanged
+        """
+        signature = (len(history_df), history_df['Date'].iloc[-1], history_df['Close'].iloc[-1])
+        if ticker in self._indicators_cache:
+            indicators, cached_signature = self._indicators_cache.pop(ticker)
+            if cached_signature == signature:
+                self._indicators_cache[ticker] = (indicators, signature)
+                return indicators
+        indicators = history_indicators(history_df)
+        self._indicators_cache[ticker] = (indicators, signature)
+        while len(self._indicators_cache) > self.indicators_cache_size:
+            self._indicators_cache.popitem(last=False)
+        return indicators
 
     def _calc_index(self):
-        history_df = self.ticker_data_dict_in_effect['history']
-        history_all_df = self.ticker_data_dict_original['history']
-        ######################
-        # positive volume index and negative volume index
-        history_all_df['PVI'], history_all_df['NVI'], history_all_df['PVI_EMA9'], history_all_df['NVI_EMA9'], history_all_df['PVI_EMA255'], history_all_df['NVI_EMA255'] = volume_indicator(short_periods=9, long_periods=255).PVI_NVI(history_all_df['Close'], history_all_df['Volume'])
-        history_df[['PVI','NVI','PVI_EMA9','NVI_EMA9','PVI_EMA255','NVI_EMA255']] = history_all_df[history_all_df['Date'].isin(history_df['Date'])][['PVI','NVI','PVI_EMA9','NVI_EMA9','PVI_EMA255','NVI_EMA255']]
-        PVI_max = max(history_df[['PVI','PVI_EMA9','PVI_EMA255']].max())
-        PVI_min = min(history_df[['PVI','PVI_EMA9','PVI_EMA255']].min())
-        NVI_max = max(history_df[['NVI','NVI_EMA9','NVI_EMA255']].max())
-        NVI_min = min(history_df[['NVI','NVI_EMA9','NVI_EMA255']].min())
-        # this is to keep PVI indexes between 0 and 1000
-        history_df[['PVI','PVI_EMA9','PVI_EMA255']] = (history_df[['PVI','PVI_EMA9','PVI_EMA255']] - PVI_min) / (PVI_max - PVI_min) * 1000
-        # this is to keep NVI indexes between 0 and 1000
-        history_df[['NVI','NVI_EMA9','NVI_EMA255']] = (history_df[['NVI','NVI_EMA9','NVI_EMA255']] - NVI_min) / (NVI_max - NVI_min) * 1000
+        data_view = self.ticker_data_view
+        # the window is a contiguous range of the full history: the indicators are cut from the full-history ones, as of its last bar
+        window = data_view.window
+        self._index_view = self.ticker_indicators.as_of(window.stop)
+        self._index_view_start = window.start
         ######################
-        history_all_df['RSI14'] = momentum_indicator().RSI(close_price=history_all_df['Close'], RSI_periods=14)
-        history_df['RSI14'] = history_all_df[history_all_df['Date'].isin(history_df['Date'])]['RSI14']
+        # the ticker canvas always shows the close EMAs; the other indicators are computed on demand by _calc_selected_index
+        data_view.set_column('Close_EMA9', self._index_view.close_EMA(periods=9)[window.start:])
+        data_view.set_column('Close_EMA255', self._index_view.close_EMA(periods=255)[window.start:])
+
+    def _calc_selected_index(self):
+        """
+        set the columns of the selected index (self._index_selected) on the data view in effect, unless they are already there
+        """
+        data_view = self.ticker_data_view
+        columns = self.index_columns_dict.get(self._index_selected)
+        if columns is None or all(data_view.has_column(column) for column in columns):
+            return
+        view = self._index_view
+        start = self._index_view_start
         ######################
-        history_all_df['MACD_macd'], history_all_df['MACD_signal'], history_all_df['MACD_histogram'] = momentum_indicator().MACD(close_price=history_all_df['Close'], fast_period=12, slow_period=26, signal_period=9)
-        history_df[['MACD_macd','MACD_signal','MACD_histogram']] = history_all_df[history_all_df['Date'].isin(history_df['Date'])][['MACD_macd','MACD_signal','MACD_histogram']]
+        if self._index_selected == 'PVI and NVI':
+            # positive volume index and negative volume index
+            # (rescaled to 0 ~ 1000 over the bars in view by _show_viewport)
+            for column, values in zip(['PVI','NVI','PVI_EMA9','NVI_EMA9','PVI_EMA255','NVI_EMA255'], view.PVI_NVI(short_periods=9, long_periods=255)):
+                data_view.set_column(column, values[start:])
         ######################
-        history_all_df['OBV'] = momentum_indicator().OBV(close_price=history_all_df['Close'], volume=history_all_df['Volume'])
-        history_all_df['OBV_EMA9'] = moving_average(periods=9).exponential(history_all_df['OBV'])
-        history_all_df['OBV_EMA255'] = moving_average(periods=255).exponential(history_all_df['OBV'])
-        history_df[['OBV', 'OBV_EMA9', 'OBV_EMA255']] = history_all_df[history_all_df['Date'].isin(history_df['Date'])][['OBV', 'OBV_EMA9', 'OBV_EMA255']]
+        elif self._index_selected == 'RSI':
+            data_view.set_column('RSI14', view.RSI(RSI_periods=14)[start:])
         ######################
-        history_all_df['Z_price_vol'] = momentum_indicator().Z_price_vol(close_price=history_all_df['Close'], volume=history_all_df['Volume'])
-        history_all_df['Z_price_vol_EMA9'] = moving_average(periods=9).exponential(history_all_df['Z_price_vol'])
-        history_all_df['Z_price_vol_EMA255'] = moving_average(periods=255).exponential(history_all_df['Z_price_vol'])
-        history_df[['Z_price_vol','Z_price_vol_EMA9','Z_price_vol_EMA255']] = history_all_df[history_all_df['Date'].isin(history_df['Date'])][['Z_price_vol','Z_price_vol_EMA9','Z_price_vol_EMA255']]  
+        elif self._index_selected == 'MACD':
+            for column, values in zip(['MACD_macd','MACD_signal','MACD_histogram'], view.MACD(fast_period=12, slow_period=26, signal_period=9)):
+                data_view.set_column(column, values[start:])
         ######################
-        history_all_df['Close_EMA9'], history_all_df['Close_EMA255'] = moving_average(periods=9).exponential(history_all_df['Close']), moving_average(periods=255).exponential(history_all_df['Close'])
-        history_df[['Close_EMA9', 'Close_EMA255']] = history_all_df[history_all_df['Date'].isin(history_df['Date'])][['Close_EMA9', 'Close_EMA255']]
+        elif self._index_selected == 'OBV':
+            data_view.set_column('OBV', view.OBV()[start:])
+            data_view.set_column('OBV_EMA9', view.OBV_EMA(periods=9)[start:])
+            data_view.set_column('OBV_EMA255', view.OBV_EMA(periods=255)[start:])
         ######################
-        self.ticker_data_dict_in_effect['history'] = history_df
+        elif self._index_selected in ['Heat', 'Supply & Demand']:
+            data_view.set_column('Z_price_vol', view.Z_price_vol()[start:])
+            data_view.set_column('Z_price_vol_EMA9', view.Z_price_vol_EMA(periods=9)[start:])
+            data_view.set_column('Z_price_vol_EMA255', view.Z_price_vol_EMA(periods=255)[start:])
 
     def _ticker_lastdate_pushbutton_clicked(self):
         if self._ticker_selected:
@@ -1552,12 +1962,112 @@ class UI_control(object):
 
     def _ticker_download_latest_data_from_yfinance(self):
         if self._ticker_selected:
-            self.ticker_data_dict_original = get_ticker_data_dict(ticker = self.selected_ticker, force_redownload = True, download_today_data=self._UI.app_window.app_menu.preferences_dialog.download_today_data, data_root_dir=self._UI.app_window.app_menu.preferences_dialog.data_root_dir)
-            self._ticker_lastdate_dialog_use_last_available_date_button_clicked()
-            self.ticker_data_dict_in_effect['info'] = copy.deepcopy(self.ticker_data_dict_original['info'])
-            self._UI.ticker_textinfo.setHtml(get_formatted_ticker_data(self.ticker_data_dict_in_effect, use_html=True))
+            self._load_ticker(self.selected_ticker, mode = 'redownload', refresh_only = True)
+
+    def _show_redownloaded_ticker(self, ticker_data_dict: dict = None):
+        if self._ticker_selected:
+            self.ticker_data_dict_original = ticker_data_dict
+            self.ticker_indicators = self._get_ticker_indicators(self.selected_ticker, self.ticker_data_dict_original['history'])
+            self.ticker_calendar = self.ticker_indicators.calendar
+            self.ticker_data_view = ticker_data_view(self.ticker_data_dict_original)
+            self._calc_index()
+            self.ticker_viewport = None
+            self._draw_ticker_canvas()
+            self._draw_index_canvas()
+            self._ticker_lastdate_dialog_use_last_available_date_button_clicked() # this sets the viewport
+            self._UI.ticker_textinfo.setHtml(get_formatted_ticker_data(self.ticker_data_view, use_html=True, include_option_chain=False))
             self._UI.repaint() # to cope with a bug in PyQt5
 
+    def _cached_ticker_data_dict(self, ticker: str = None):
+        """
+        the prefetched or recently viewed ticker data dict of the ticker, if its data files have not changed since it was loaded
+        """
+        if ticker not in self._ticker_data_cache:
+            return None
+        ticker_data_dict, signature = self._ticker_data_cache.pop(ticker)
+        if signature is None or signature != ticker_data_signature(ticker, self._UI.app_window.app_menu.preferences_dialog.data_root_dir):
+            return None
+        self._ticker_data_cache[ticker] = (ticker_data_dict, signature)
+        return ticker_data_dict
+
+    def _cache_ticker_data_dict(self, ticker: str = None, ticker_data_dict: dict = None, signature: tuple = None):
+        self._ticker_data_cache.pop(ticker, None)
+        self._ticker_data_cache[ticker] = (ticker_data_dict, signature)
+        while len(self._ticker_data_cache) > self.ticker_data_cache_size:
+            self._ticker_data_cache.popitem(last=False)
+
+    def _start_ticker_loader(self, ticker: str = None, mode: str = 'load', priority: int = 0):
+        if (ticker, mode) in self._ticker_loaders:
+            return
+        loader = ticker_loader(signals = self.ticker_loader_signals, ticker = ticker, mode = mode, 
+                               download_today_data = self._UI.app_window.app_menu.preferences_dialog.download_today_data, 
+                               data_root_dir = self._UI.app_window.app_menu.preferences_dialog.data_root_dir)
+        self._ticker_loaders[(ticker, mode)] = loader
+        self.ticker_loader_pool.start(loader, priority)
+
+    def _cancel_ticker_loaders(self, keep: list = []):
+        """
+        cancel the loaders whose ticker is not in keep (those not started yet are taken off the queue)
+        """
+        for key, loader in list(self._ticker_loaders.items()):
+            if key[0] in keep:
+                continue
+            loader.cancelled = True
+            if self.ticker_loader_pool.tryTake(loader):
+                del self._ticker_loaders[key]
+
+    def _load_ticker(self, ticker: str = None, mode: str = 'load', refresh_only: bool = False):
+        """
+        show the ticker: at once if its data dict is cached (and no redownload is requested), otherwise once a worker has loaded it (_ticker_loaded)
+        """
+        self._ticker_waiting = (ticker, mode, refresh_only)
+        if mode == 'load':
+            ticker_data_dict = self._cached_ticker_data_dict(ticker)
+            if ticker_data_dict is not None:
+                self._ticker_waiting = None
+                self._show_ticker(ticker_data_dict)
+                return
+            if (ticker, 'local') in self._ticker_loaders:
+                self._ticker_loaders[(ticker, 'local')].cancelled = False # already being prefetched: wait for it
+                return
+        self._start_ticker_loader(ticker, mode, priority = 1)
+
+    def _prefetch_tickers(self, index: int = None):
+        """
+        prefetch (from the local data store) the tickers next to the selected one in ticker_selection, nearest first
+        """
+        tickers = []
+        for offset in range(1, self.ticker_prefetch_neighbours + 1):
+            for neighbour_index in [index + offset, index - offset]:
+                if 0 < neighbour_index < self._UI.ticker_selection.count():
+                    tickers.append(self._UI.ticker_selection.itemText(neighbour_index).upper())
+        self._cancel_ticker_loaders(keep = tickers + [self.selected_ticker])
+        for ticker in tickers:
+            if ticker not in self._ticker_data_cache:
+                self._start_ticker_loader(ticker, 'local')
+
+    def _ticker_loaded(self, ticker: str = None, mode: str = None, ticker_data_dict: dict = None, signature: tuple = None, error: str = None):
+        self._ticker_loaders.pop((ticker, mode), None)
+        if ticker_data_dict is not None:
+            self._cache_ticker_data_dict(ticker, ticker_data_dict, signature)
+        if self._ticker_waiting is None or self._ticker_waiting[0] != ticker:
+            return
+        _, waiting_mode, refresh_only = self._ticker_waiting
+        if waiting_mode == 'redownload' and mode != 'redownload':
+            return
+        if ticker_data_dict is None:
+            if mode == 'local':
+                self._start_ticker_loader(ticker, 'load', priority = 1) # not in the local data store
+            else:
+                self._ticker_waiting = None
+                print(f"Warning: Unable to load this ticker = {ticker}: {error}")
+            return
+        self._ticker_waiting = None
+        if refresh_only:
+            self._show_redownloaded_ticker(ticker_data_dict)
+        else:
+            self._show_ticker(ticker_data_dict)
+
     def _ticker_lastdate_dialog_use_last_available_date_button_clicked(self):
         self.time_last_date = self.ticker_data_dict_original['history']['Date'].iloc[-1]
         self._UI.ticker_lastdate_calendar_dialog.ticker_lastdate_calendar.setMaximumDate(self.time_last_date)
@@ -1574,15 +2084,41 @@ class UI_control(object):
         self._UI.ticker_lastdate_pushbutton.setText(f"Last Date: {str(self.time_last_date.date())}")
         self._ticker_timeframe_selection_change(self.timeframe_selection_index)
 
+    def _ticker_textinfo_anchor_clicked(self, url):
+        if url.scheme() == 'investment':
+            # sections of the ticker report rendered on request
+            if url.path() == 'option_chain' and self._ticker_selected:
+                scroll_position = self._UI.ticker_textinfo.verticalScrollBar().value()
+                self._UI.ticker_textinfo.setHtml(get_formatted_ticker_data(self.ticker_data_view, use_html=True, include_option_chain=True))
+                self._UI.ticker_textinfo.verticalScrollBar().setValue(scroll_position)
+        else:
+            QDesktopServices.openUrl(url)
+
     def _message_dialog_textinfo_ok_button_clicked(self):
         self._UI.message_dialog.hide()
 
 
+def _report_startup_time(phase_times: dict = None):
+    total_time = time.perf_counter() - _import_start_time
+    phases = ", ".join(f"{phase} {seconds:.2f} s" for phase, seconds in phase_times.items())
+    print(f"Info: the app window is interactive {total_time:.2f} s after the import of the GUI module ({phases}, first event loop pass {total_time-sum(phase_times.values()):.2f} s)")
+    if total_time > startup_time_budget:
+        print(f"Warning: the startup time exceeds its budget of {startup_time_budget:.2f} s")
+
 def main(appmenu=None):
+    phase_times = OrderedDict(imports=time.perf_counter()-_import_start_time)
+    start_time = time.perf_counter()
+    # QtWebEngine is imported on first use (research dialog), after the QApplication: it requires shared OpenGL contexts
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setStyleSheet(StyleSheet)
+    phase_times['application'] = time.perf_counter() - start_time
+    start_time = time.perf_counter()
     window = app_window(app=app, appmenu=appmenu)
     window.show()
+    phase_times['window'] = time.perf_counter() - start_time
+    # the first timer event is processed once the event loop runs, after the window is shown and painted
+    QtCore.QTimer.singleShot(0, lambda: _report_startup_time(phase_times))
     app.exec_()
 
 
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+# QtWebEngine is heavy to load: this module is only imported when the research dialog is first opened (see app_menu),
+# which requires the Qt::AA_ShareOpenGLContexts attribute to be set before the QApplication is created (see main())
+
+from PySide2.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineProfile
+
+from PySide2.QtWidgets import QGridLayout
+from PySide2.QtWidgets import QLineEdit
+from PySide2.QtWidgets import QPushButton
+from PySide2.QtWidgets import QDialog, QToolBar
+from PySide2.QtCore import QUrl
+
+###########################################################################################
+
+class research_dialog(QDialog):
+    def __init__(self, parent=None, *args, **kwargs):
+        super().__init__(parent=parent, *args, **kwargs)
+        self.app_window = parent
+        self.home_url_str = "https://google.com"
+        self.home_qurl = QUrl.fromUserInput(self.home_url_str)
+        self.home_url_str = self.home_qurl.toString()
+        # lineedit
+        self.web_url_lineedit = web_url(parent=self, url_str = self.home_url_str)
+        # webview
+        self.webview = web_view(parent=self, qurl = self.home_qurl)
+        self.web_url_lineedit.returnPressed.connect(self.web_url_entered)
+        self.webview.page().urlChanged.connect(self.webview_url_changed)
+        self.webview.page().titleChanged.connect(self.setWindowTitle)
+        # toolbar
+        self.toolBar = QToolBar(parent=self)
+        #
+        self.backButton = QPushButton(parent=self)
+        self.backButton.setText("Back")
+        self.backButton.setAutoDefault(False)
+        self.backButton.clicked.connect(self.webview.back)
+        self.toolBar.addWidget(self.backButton)
+        #
+        self.forwardButton = QPushButton(parent=self)
+        self.forwardButton.setText("Forward")
+        self.forwardButton.setAutoDefault(False)
+        self.forwardButton.clicked.connect(self.webview.forward)
+        self.toolBar.addWidget(self.forwardButton)
+        #
+        self.reloadButton = QPushButton(parent=self)
+        self.reloadButton.setText("Reload")
+        self.reloadButton.setAutoDefault(False)
+        self.reloadButton.clicked.connect(self.webview.reload)
+        self.toolBar.addWidget(self.reloadButton)
+        #
+        self.website1Button = QPushButton(parent=self)
+        self.website1Button.setText(self.webview.ref_website1)
+        self.website1Button.setAutoDefault(False)
+        self.website1Button.clicked.connect(self.webview.reload_website1)
+        self.toolBar.addWidget(self.website1Button)
+        #
+        self.website2Button = QPushButton(parent=self)
+        self.website2Button.setText(self.webview.ref_website2)
+        self.website2Button.setAutoDefault(False)
+        self.website2Button.clicked.connect(self.webview.reload_website2)
+        self.toolBar.addWidget(self.website2Button)
+        #
+        self.website3Button = QPushButton(parent=self)
+        self.website3Button.setText(self.webview.ref_website3)
+        self.website3Button.setAutoDefault(False)
+        self.website3Button.clicked.connect(self.webview.reload_website3)
+        self.toolBar.addWidget(self.website3Button)
+        # layout
+        self.layout = QGridLayout()
+        self.layout.addWidget(self.web_url_lineedit, 0, 0)
+        self.layout.addWidget(self.toolBar, 1, 0)
+        self.layout.addWidget(self.webview, 2, 0)
+        self.setLayout(self.layout)
+
+    def web_url_entered(self):
+        url_entered = self.web_url_lineedit.text()
+        qurl_entered = QUrl.fromUserInput(url_entered)
+        if qurl_entered.isValid():
+            self.webview.load(qurl_entered)
+
+    def webview_url_changed(self, qurl):
+        self.web_url_lineedit.setText(qurl.toString())
+
+
+class web_url(QLineEdit):
+    def __init__(self, url_str="", *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setReadOnly(False)
+        self.setText(url_str)
+
+
+# https://myprogrammingnotes.com/suppress-js-error-output-qtwebengine.html
+class web_engine_page(QWebEnginePage):
+    def __init__(self, profile, parent):
+        super().__init__(profile, parent) # parent=None
+    def javaScriptConsoleMessage(self, *args, **kwargs):
+        pass
+    
+
+# reference: https://doc.qt.io/qtforpython/examples/tabbedbrowser.html
+class web_view(QWebEngineView):
+    def __init__(self, parent, qurl):
+        super().__init__()
+        # references
+        #self.page().profile().cachePath()
+        #self.page().profile().cookieStore()
+        #self.page().profile().persistentStoragePath()
+        #self.page().profile().clearAllVisitedLinks()
+        #self.page().profile().clearHttpCache()
+        #self.page().profile().cookieStore().deleteAllCookies()
+        self.web_engine_profile = QWebEngineProfile()
+        #print(self.web_engine_profile.isOffTheRecord())
+        #print(self.web_engine_profile.persistentStoragePath())
+        self.web_engine_page = web_engine_page(profile=self.web_engine_profile, parent=self)
+        #print(self.web_engine_page.profile().isOffTheRecord())
+        self.setPage(self.web_engine_page)
+        if not self.page().profile().isOffTheRecord():
+            raise ValueError("the profile should be off-the-record.")
+        self.setUrl(qurl)
+        self.ref_website1 = "Investopedia"
+        self.ref_website2 = "Nasdaq"
+        self.ref_website3 = "Yahoo Finance"
+        #self.ref_website4 = "Finviz"
+    def reload_website1(self):
+        self.load(QUrl.fromUserInput("https://investopedia.com"))
+    def reload_website2(self):
+        self.load(QUrl.fromUserInput("https://www.nasdaq.com/"))
+    def reload_website3(self):
+        self.load(QUrl.fromUserInput("https://finance.yahoo.com/"))
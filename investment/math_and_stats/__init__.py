@@ -5,6 +5,7 @@
 #  License: LGPL-3.0
 
 from ._math import probability
-from ._stats import sigmoid, two_sample_proportion_z_test, one_sample_proportion_z_test, chisq_test
+from ._stats import sigmoid, two_sample_proportion_z_test, one_sample_proportion_z_test, chisq_test, one_sample_proportion_z_tests, two_sample_proportion_z_tests, chisq_tests, bonferroni_correction, benjamini_hochberg_correction, hypothesis_test_table
+from ._conditional import conditional_probability_table
 
-__all__ = ["probability","sigmoid","two_sample_proportion_z_test","one_sample_proportion_z_test","chisq_test"]
\ No newline at end of file
+__all__ = ["probability","sigmoid","two_sample_proportion_z_test","one_sample_proportion_z_test","chisq_test","one_sample_proportion_z_tests","two_sample_proportion_z_tests","chisq_tests","bonferroni_correction","benjamini_hochberg_correction","hypothesis_test_table","conditional_probability_table"]
\ No newline at end of file
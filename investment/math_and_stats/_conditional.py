@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from ._math import probability
+from ._stats import two_sample_proportion_z_tests, p_value_corrections
+
+import numpy as np
+import pandas as pd
+
+###########################################################################################
+
+bootstrap_chunk = 100 # bootstrap draws per chunk
+
+def _event_array(events = None):
+    """
+    events (DataFrame/array of bars x tickers, or one Series/1-d array) -> (float array of bars x tickers with NaN where undefined, DataFrame)
+    """
+    events_df = pd.DataFrame(events) if not isinstance(events, pd.DataFrame) else events
+    return events_df.to_numpy(dtype=float, na_value=np.nan), events_df
+
+def _cell_counts(a = None, b = None, valid = None, block_length: int = None):
+    """
+    the counts of the 4 cells (A and B, A and not B, not A and B, not A and not B) per block of block_length bars and per ticker:
+    int array of n_blocks x tickers x 4, reduced block by block from the counts of A and B, A, B and the valid bars
+    """
+    n_bars, n_tickers = a.shape
+    if n_bars == 0:
+        return np.zeros((1, n_tickers, 4), dtype=np.int64)
+    starts = np.arange(0, n_bars, block_length)
+    a = a & valid
+    b = b & valid
+    n_A_and_B, n_A, n_B, n = (np.add.reduceat(x, starts, axis=0, dtype=np.int32) for x in (a & b, a, b, valid))
+    return np.stack([n_A_and_B, n_A - n_A_and_B, n_B - n_A_and_B, n - n_A - n_B + n_A_and_B], axis=-1).astype(np.int64)
+
+def _conditional_probabilities(counts = None):
+    """
+    cell counts (... x 4) -> P(A), P(A|B), P(B|A), lift = P(A|B)/P(A); NaN where undefined
+    """
+    n_A_and_B, n_A_and_not_B, n_not_A_and_B, n_not_A_and_not_B = np.moveaxis(counts, -1, 0)
+    n_A = n_A_and_B + n_A_and_not_B
+    n_B = n_A_and_B + n_not_A_and_B
+    n = n_A + n_not_A_and_B + n_not_A_and_not_B
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_A = n_A / n
+        p_B = n_B / n
+        p_B_given_A = n_A_and_B / n_A
+        # Bayes' rule (probability.p_A_given_B) where P(B|A) is defined, the counts otherwise (no A: P(A|B) = 0)
+        p_A_given_B = np.where(n_A > 0, probability().p_A_given_B(p_B_given_A, p_A, p_B), n_A_and_B / n_B)
+        lift = p_A_given_B / p_A
+    return p_A, p_A_given_B, p_B_given_A, lift
+
+def conditional_probability_table(A = None, B = None, valid = None, groups = None, n_bootstrap: int = 1000, block_length: int = 20, confidence: float = 0.95, correction: str = 'fdr_bh', seed = None):
+    """
+    estimate P(A|B), P(B|A) and the lift P(A|B)/P(A) of two events observed on the bars of a history panel, per ticker, per group
+    (e.g. industry) and for the whole universe, with block-bootstrap confidence intervals, in one vectorized pass
+
+    A, B: the events per bar and ticker, boolean DataFrames (dates x tickers, e.g. from indicator_panel_df()) or arrays of the same
+    shape; NaN marks a bar where an event is undefined (not counted)
+    valid: an optional boolean mask of the bars to count, of the same shape
+    groups: an optional {ticker: group} (dict or Series), e.g. the industry of each ticker (tickers without a group are left out of the groups)
+    n_bootstrap, block_length: the bootstrap resamples blocks of block_length consecutive bars (the same blocks for all the tickers,
+    so that the group and universe estimates are resampled consistently); events over overlapping windows (e.g. the next 20-day
+    return) are autocorrelated, so the blocks should be at least as long as these windows (block_length=1: the iid bootstrap)
+    correction: the multiple-comparison correction of the p-values ('fdr_bh', 'bonferroni' or None), applied per level
+
+    example:
+        close = indicator_panel_df(ticker_data_dict_dict, 'Close')
+        RSI14 = indicator_panel_df(ticker_data_dict_dict, lambda indicators: indicators.RSI(RSI_periods=14))
+        A = (close.shift(-20) > close).where(close.shift(-20).notna() & close.notna())
+        B = (RSI14 < 30).where(RSI14.notna())
+        conditional_probability_table(A, B, groups=ticker_industry_dict)
+
+    returns a DataFrame indexed by (level, name), with level 'ticker', 'group' or 'universe':
+        n, n_A, n_B, n_A_and_B: the counts of valid bars, of A, of B, of A and B
+        P_A, P_A_given_B, P_B_given_A, lift and the (low, high) bounds of the confidence intervals of the last 3
+        z, p_value, p_adjusted: the two-sample proportion z-test of P(A|B) = P(A|not B) (i.e. lift = 1)
+    """
+    a, A_df = _event_array(A)
+    b, _ = _event_array(B)
+    if a.shape != b.shape:
+        raise ValueError(f"the events A and B should have the same shape, not {a.shape} and {b.shape}")
+    mask = ~np.isnan(a) & ~np.isnan(b)
+    if valid is not None:
+        valid = np.asarray(valid, dtype=bool)
+        if valid.ndim == 1:
+            valid = valid[:, np.newaxis]
+        mask &= valid
+    tickers = list(A_df.columns)
+    block_counts = _cell_counts(np.nan_to_num(a) != 0, np.nan_to_num(b) != 0, mask, block_length=max(1, int(block_length)))
+
+    # the units (tickers, groups, universe) as sums of tickers: a membership matrix of tickers x units
+    index = [('ticker', ticker) for ticker in tickers]
+    membership = [np.eye(len(tickers), dtype=np.int64)]
+    if groups is not None:
+        group_of = pd.Series(groups, dtype=object).reindex(tickers)
+        group_names = sorted(set(group_of.dropna()))
+        membership.append(np.column_stack([(group_of == group).to_numpy() for group in group_names]).astype(np.int64) if len(group_names) > 0 else np.zeros((len(tickers), 0), dtype=np.int64))
+        index += [('group', group) for group in group_names]
+    membership.append(np.ones((len(tickers), 1), dtype=np.int64))
+    index.append(('universe', 'All'))
+    membership = np.hstack(membership)
+    unit_counts = np.einsum('bkc,ku->buc', block_counts, membership) # blocks x units x 4
+    counts = unit_counts.sum(axis=0)
+
+    p_A, p_A_given_B, p_B_given_A, lift = _conditional_probabilities(counts)
+    n_A = counts[:, 0] + counts[:, 1]
+    n_B = counts[:, 0] + counts[:, 2]
+    n = counts.sum(axis=1)
+    z, p_value, _, _ = two_sample_proportion_z_tests(counts[:, 0], counts[:, 1], n_B, n - n_B)
+    df = pd.DataFrame({'n': n, 'n_A': n_A, 'n_B': n_B, 'n_A_and_B': counts[:, 0], 'P_A': p_A,
+                       'P_A_given_B': p_A_given_B, 'P_B_given_A': p_B_given_A, 'lift': lift},
+                      index=pd.MultiIndex.from_tuples(index, names=['level', 'name']))
+
+    # bootstrap: the resampled counts of all the units are the block-weight matrix times the block counts
+    if n_bootstrap is not None and n_bootstrap > 0:
+        n_blocks = unit_counts.shape[0]
+        rng = np.random.default_rng(seed)
+        flat_counts = unit_counts.reshape(n_blocks, -1).astype(float)
+        boot_stats = []
+        # in chunks of draws: only the 3 statistics of all the draws are kept, not their n_bootstrap x units x 4 counts
+        for n_done in range(0, n_bootstrap, bootstrap_chunk):
+            m = min(bootstrap_chunk, n_bootstrap - n_done)
+            weights = rng.multinomial(n_blocks, np.full(n_blocks, 1/n_blocks), size=m).astype(float)
+            boot_stats.append(_conditional_probabilities((weights @ flat_counts).reshape(m, *unit_counts.shape[1:]))[1:])
+        boot_p_A_given_B, boot_p_B_given_A, boot_lift = (np.concatenate(stat) for stat in zip(*boot_stats))
+        q = 100 * np.array([(1-confidence)/2, (1+confidence)/2])
+        for name, boot in [('P_A_given_B', boot_p_A_given_B), ('P_B_given_A', boot_p_B_given_A), ('lift', boot_lift)]:
+            boot = np.where(np.isfinite(boot), boot, np.nan)
+            defined = ~np.isnan(boot).all(axis=0)
+            bounds = np.full((2, boot.shape[1]), np.nan)
+            if defined.any():
+                bounds[:, defined] = np.nanpercentile(boot[:, defined], q, axis=0)
+            df[f'{name}_low'] = bounds[0]
+            df[f'{name}_high'] = bounds[1]
+
+    df['z'] = z
+    df['p_value'] = p_value
+    if correction is None:
+        df['p_adjusted'] = p_value
+    elif correction in p_value_corrections:
+        levels = df.index.get_level_values('level')
+        df['p_adjusted'] = np.nan
+        for level in levels.unique():
+            df.loc[levels == level, 'p_adjusted'] = p_value_corrections[correction](p_value[levels == level])
+    else:
+        raise ValueError(f"correction should be one of {list(p_value_corrections.keys())} or None, not [{correction}]")
+    return df
@@ -5,18 +5,117 @@
 #  License: LGPL-3.0
 
 import math
-from scipy.special import expit
-from scipy.stats import norm, chisquare
+
+import numpy as np
+import pandas as pd
 
 def sigmoid(z):
+    from scipy.special import expit # scipy is slow to import, so only when needed
     return expit(z) # 1.0 / (1.0 + np.exp(-z)) # to cope with the overflow problem with np.exp()
 
 def p_value_for_z_score(z, sided=2):
+    from scipy.stats import norm
     return sided * (1 - norm.cdf(abs(z)))
 
 def z_score_for_p_value(p, sided=2):
+    from scipy.stats import norm
     return norm.ppf(1 - p/sided)
 
+def _p_value(z, alternative='two-sided'):
+    from scipy.stats import norm
+    if alternative == 'two-sided':
+        return 2 * norm.sf(np.abs(z))
+    elif alternative == 'greater':
+        return norm.sf(z)
+    elif alternative == 'less':
+        return norm.cdf(z)
+    raise ValueError(f"alternative should be 'two-sided', 'greater' or 'less', not [{alternative}]")
+
+def one_sample_proportion_z_tests(p, p0, n, alternative='two-sided', confidence=0.95):
+    """
+    one_sample_proportion_z_test() over arrays (broadcast): H0: p = p0, with p the proportion observed in n trials
+
+    alternative: 'two-sided', 'greater' (H1: p > p0) or 'less' (H1: p < p0)
+    returns (z, p_value, CI_low, CI_high) arrays, with the (two-sided, Wald) confidence interval of p; NaN where n = 0 or p0 is 0 or 1
+    """
+    p, p0, n = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (p, p0, n)))
+    undefined = (n <= 0) | (p0 <= 0) | (p0 >= 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(undefined, np.nan, (p-p0) / np.sqrt(p0*(1-p0)/n))
+        CI = np.where(undefined, np.nan, z_score_for_p_value(1-confidence) * np.sqrt(p*(1-p)/n))
+    return z, _p_value(z, alternative), p-CI, p+CI
+
+def two_sample_proportion_z_tests(num1, num2, denom1, denom2, alternative='two-sided', confidence=0.95):
+    """
+    two_sample_proportion_z_test() over arrays (broadcast): H0: p1 = p2, with p1 = num1/denom1 and p2 = num2/denom2
+
+    alternative: 'two-sided', 'greater' (H1: p1 > p2) or 'less' (H1: p1 < p2)
+    returns (z, p_value, CI_low, CI_high) arrays, with the (two-sided, unpooled Wald) confidence interval of p1-p2; NaN where undefined
+    """
+    num1, num2, denom1, denom2 = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (num1, num2, denom1, denom2)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = (num1+num2) / (denom1+denom2)
+        p1 = num1/denom1
+        p2 = num2/denom2
+        z = (p1-p2) / np.sqrt(p*(1-p)*(1/denom1+1/denom2))
+        CI = z_score_for_p_value(1-confidence) * np.sqrt(p1*(1-p1)/denom1 + p2*(1-p2)/denom2)
+    return z, _p_value(z, alternative), p1-p2-CI, p1-p2+CI
+
+def chisq_tests(num1, num2):
+    """
+    chisq_test() over arrays (broadcast): the chi-square test of two counts against equal expected counts (1 degree of freedom)
+
+    returns (chisq, p_value) arrays
+    """
+    from scipy.stats import chi2
+    num1, num2 = np.broadcast_arrays(np.asarray(num1, dtype=float), np.asarray(num2, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chisq = (num1-num2)**2 / (num1+num2)
+    return chisq, chi2.sf(chisq, 1)
+
+def bonferroni_correction(p_values):
+    """
+    the Bonferroni-adjusted p-values (family-wise error rate), over the non-NaN p-values
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    return np.minimum(p_values * np.count_nonzero(~np.isnan(p_values)), 1)
+
+def benjamini_hochberg_correction(p_values):
+    """
+    the Benjamini-Hochberg-adjusted p-values (q-values, false discovery rate), over the non-NaN p-values
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    adjusted = np.full(p_values.shape, np.nan)
+    valid = ~np.isnan(p_values)
+    m = np.count_nonzero(valid)
+    if m > 0:
+        order = np.argsort(p_values[valid])
+        ranked = p_values[valid][order] * m / np.arange(1, m+1)
+        q_values = np.empty(m)
+        q_values[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1)
+        adjusted[valid] = q_values
+    return adjusted
+
+p_value_corrections = {'bonferroni': bonferroni_correction, 'fdr_bh': benjamini_hochberg_correction}
+
+def hypothesis_test_table(index=None, estimate=None, z=None, p_value=None, CI_low=None, CI_high=None, correction='fdr_bh', alpha=0.05):
+    """
+    the results of a batch of tests as a DataFrame (one row per test, e.g. per ticker): estimate, z, p_value, p_adjusted, CI_low,
+    CI_high and significant (p_adjusted < alpha)
+
+    correction: 'fdr_bh' (Benjamini-Hochberg), 'bonferroni' or None (p_adjusted = p_value)
+    example: hypothesis_test_table(tickers, p, *one_sample_proportion_z_tests(p, p0, n, alternative='greater'))
+    """
+    p_value = np.ravel(p_value)
+    if correction is None:
+        p_adjusted = p_value
+    elif correction in p_value_corrections:
+        p_adjusted = p_value_corrections[correction](p_value)
+    else:
+        raise ValueError(f"correction should be one of {list(p_value_corrections.keys())} or None, not [{correction}]")
+    return pd.DataFrame({'estimate': np.ravel(estimate), 'z': np.ravel(z), 'p_value': p_value, 'p_adjusted': p_adjusted,
+                         'CI_low': np.ravel(CI_low), 'CI_high': np.ravel(CI_high), 'significant': p_adjusted < alpha}, index=index)
+
 def one_sample_proportion_z_test(p, p0, n):
     """
     Example: p=23/124=0.19
@@ -41,4 +140,5 @@ def two_sample_proportion_z_test(num1, num2, denom1, denom2):
     print(f'z = {z:.4f}, p = {p_value:.5f}')
 
 def chisq_test(num1, num2):
+    from scipy.stats import chisquare
     return chisquare([num1, num2])
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import numpy as np
+import pandas as pd
+
+from investment.data import history_indicators, momentum_indicator, volume_indicator, moving_average
+
+def assert_close(asof, recomputed, name: str = None, n: int = None):
+    asof = np.asarray(asof, dtype=float)
+    recomputed = np.asarray(recomputed, dtype=float)
+    assert asof.shape == recomputed.shape, f"{name} as of {n} bars: shape {asof.shape} != {recomputed.shape}"
+    assert np.allclose(asof, recomputed, rtol=1e-12, atol=1e-12, equal_nan=True), f"{name} as of {n} bars: max difference {np.nanmax(np.abs(asof - recomputed))}"
+
+# a random-walk history: the as-of cuts of the indicators computed once should match a full recompute on the cut history
+rng = np.random.default_rng(0)
+n_bars = 600
+history_df = pd.DataFrame({'Date': pd.date_range('2018-01-01', periods=n_bars, freq='B', tz='UTC'),
+                           'Open': 1.0, 'High': 1.0, 'Low': 1.0,
+                           'Close': 50*np.exp(np.cumsum(rng.normal(0, 0.02, n_bars))),
+                           'Volume': rng.integers(1000, 100000, n_bars).astype(float)})
+indicators = history_indicators(history_df)
+
+for n in [15, 16, 40, 300, n_bars]: # the full RSI needs more than RSI_periods bars
+    view = indicators.as_of(n)
+    assert len(view) == n and view.last_date == history_df['Date'].iloc[n-1]
+    close = history_df['Close'].iloc[:n].to_numpy()
+    volume = history_df['Volume'].iloc[:n].to_numpy()
+    assert_close(view.RSI(RSI_periods=14), momentum_indicator().RSI(close_price=close, RSI_periods=14), 'RSI', n)
+    for asof, recomputed, name in zip(view.MACD(), momentum_indicator().MACD(close_price=close), ['MACD', 'MACD signal', 'MACD histogram']):
+        assert_close(asof, recomputed, name, n)
+    for periods in [9, 255]:
+        assert_close(view.close_EMA(periods=periods), moving_average(periods=periods).exponential(close), f'close EMA{periods}', n)
+    obv = momentum_indicator().OBV(close_price=close, volume=volume)
+    assert_close(view.OBV(), obv, 'OBV', n)
+    assert_close(view.OBV_EMA(periods=9), moving_average(periods=9).exponential(obv), 'OBV EMA9', n)
+    for asof, recomputed, name in zip(view.PVI_NVI(), volume_indicator(short_periods=9, long_periods=255).PVI_NVI(close, volume), ['PVI', 'NVI', 'PVI EMA9', 'NVI EMA9', 'PVI EMA255', 'NVI EMA255']):
+        assert_close(asof, recomputed, name, n)
+    Z_price_vol = momentum_indicator().Z_price_vol(close_price=close, volume=volume)
+    assert_close(view.Z_price_vol(), Z_price_vol, 'Z_price_vol', n)
+    assert_close(view.Z_price_vol_EMA(periods=9), moving_average(periods=9).exponential(Z_price_vol), 'Z_price_vol EMA9', n)
+
+# a cut by date is the cut by the number of bars up to and including that date
+assert len(indicators.as_of(history_df['Date'].iloc[299])) == 300
+assert len(indicators.as_of(history_df['Date'].iloc[299] + pd.Timedelta(hours=12))) == 300
+assert len(indicators.as_of()) == n_bars
+
+print("asof: OK")
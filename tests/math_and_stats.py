@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import numpy as np
+
+from investment.math_and_stats import one_sample_proportion_z_tests, hypothesis_test_table
+
+# the tests with n = 0, p0 = 0 or p0 = 1 are undefined: NaN, never significant, and left out of the multiple-comparison corrections
+p = np.array([0.6, 0.5, 0.2, 0.7])
+p0 = np.array([0.5, 0.5, 0.0, 1.0])
+n = np.array([400, 0, 100, 100])
+z, p_value, CI_low, CI_high = one_sample_proportion_z_tests(p, p0, n)
+assert np.isfinite([z[0], p_value[0], CI_low[0], CI_high[0]]).all()
+assert np.isnan(z[1:]).all() and np.isnan(p_value[1:]).all() and np.isnan(CI_low[1:]).all() and np.isnan(CI_high[1:]).all()
+for correction in ['fdr_bh', 'bonferroni']:
+    df = hypothesis_test_table(['A', 'B', 'C', 'D'], p, z, p_value, CI_low, CI_high, correction=correction)
+    assert df['significant'].tolist() == [True, False, False, False]
+    assert df.loc['A', 'p_adjusted'] == df.loc['A', 'p_value'] # the only defined test
+print("math_and_stats: OK")
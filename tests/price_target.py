@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import numpy as np
+
+from investment.data import simulate_price_target, ticker_seed
+
+rng = np.random.default_rng(0)
+close = 50*np.exp(np.cumsum(rng.normal(0.0003, 0.02, 1500)))
+
+# the same ticker seed reproduces the simulation, another ticker or seed does not
+for method in ['bootstrap', 'gbm']:
+    result = simulate_price_target(close, close[-1]*1.2, n_paths=4000, method=method, seed=ticker_seed('AAA'))
+    again = simulate_price_target(close, close[-1]*1.2, n_paths=4000, method=method, seed=ticker_seed('AAA'))
+    assert result['probability'] == again['probability'] and result['CI_low'] == again['CI_low'] and result['CI_high'] == again['CI_high']
+    assert (result['convergence'].to_numpy() == again['convergence'].to_numpy()).all()
+    assert simulate_price_target(close, close[-1]*1.2, n_paths=4000, method=method, seed=ticker_seed('BBB'))['probability'] != result['probability']
+    assert simulate_price_target(close, close[-1]*1.2, n_paths=4000, method=method, seed=ticker_seed('AAA', seed=1))['probability'] != result['probability']
+
+# the 95% Wilson interval brackets the estimate, including at 0, and narrows with the number of paths
+for price_target in [close[-1]*0.5, close[-1]*0.9, close[-1]*1.1, close[-1]*1.5, close[-1]*100]:
+    for n_paths in [500, 5000]:
+        result = simulate_price_target(close, price_target, n_paths=n_paths, chunk_paths=1000, seed=ticker_seed('AAA'))
+        assert 0 <= result['CI_low'] <= result['probability'] <= result['CI_high'] <= 1, result
+        assert result['n_paths'] == n_paths and len(result['convergence']) == -(-n_paths // 1000)
+assert simulate_price_target(close, close[-1]*100, n_paths=1000, seed=ticker_seed('AAA'))['probability'] == 0
+narrow = simulate_price_target(close, close[-1]*1.1, n_paths=8000, seed=ticker_seed('AAA'))
+wide = simulate_price_target(close, close[-1]*1.1, n_paths=500, seed=ticker_seed('AAA'))
+assert narrow['CI_high'] - narrow['CI_low'] < wide['CI_high'] - wide['CI_low']
+
+# a price target or a last close that is not a positive number, or too short a history, is rejected
+for price_target, prices in [(0, close), (-1, close), (np.nan, close), (None, close), (60, np.append(close, np.nan)), (60, close[:30])]:
+    try:
+        simulate_price_target(prices, price_target, n_paths=100)
+        raise AssertionError(f"simulate_price_target(price_target={price_target}) should raise ValueError")
+    except ValueError:
+        pass
+
+print("price_target: OK")
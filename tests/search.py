@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+from investment.data import ticker_search_index
+
+# records (ticker, name, sector, industry): each ticker matches the query "gold" in one field only
+records = [('GOLD', 'Barrick Corp', 'Basic Materials', 'Mining'),         # exact symbol
+           ('GOLDXY', 'Precious Trust', 'Financial', 'Asset Management'),  # symbol prefix (a longer symbol)
+           ('GOLDX', 'Precious Fund', 'Financial', 'Asset Management'),    # symbol prefix
+           ('AUR', 'Goldfields Ltd', 'Basic Materials', 'Mining'),         # name
+           ('SEC', 'Alpha Inc', 'Gold Producers', 'Mining'),               # sector
+           ('IND', 'Beta Inc', 'Basic Materials', 'Gold Royalties'),       # industry
+           ('MARI', 'Marigold Inc', 'Consumer', 'Retail'),                 # substring
+           ('ZZZ', 'Other Inc', 'Technology', 'Software')]                 # no match
+index = ticker_search_index(records)
+assert len(index) == len(records)
+
+# exact symbol > symbol prefix (shorter symbol first) > name > sector/industry > substring; the query is case-insensitive
+for query in ['gold', 'GOLD', ' GoLd ']:
+    assert index.query_tickers(query, limit=None) == ['GOLD', 'GOLDX', 'GOLDXY', 'AUR', 'IND', 'SEC', 'MARI'], index.query_tickers(query, limit=None)
+df = index.query('gold', limit=None)
+assert df['score'].is_monotonic_decreasing and (df['score'] > 0).all()
+assert index.query_tickers('gold', limit=2) == ['GOLD', 'GOLDX']
+assert index.query_tickers('gold', limit=None, tickers=['MARI', 'AUR', 'ZZZ', 'NONE']) == ['AUR', 'MARI']
+
+# every word of the query should match
+assert index.query_tickers('gold mining', limit=None) == ['GOLD', 'AUR', 'SEC']
+assert index.query_tickers('gold software', limit=None) == []
+
+# an empty query matches nothing
+for query in ['', '   ']:
+    assert index.query_tickers(query, limit=None) == []
+    assert (index.scores(query) == 0).all()
+    assert len(index.query(query)) == 0
+
+print("search: OK")
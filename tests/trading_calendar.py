@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+#  Author: Investment Prediction Enthusiast <investment.ml.prediction@gmail.com>
+#
+#  License: LGPL-3.0
+
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+from investment.data import trading_calendar, Ticker
+from investment.data._data import read_ticker_data_dict
+
+# the bar indices of a trading calendar are row positions of the history: unsorted or duplicate dates are rejected, not reordered
+for dates in [['2020-01-02', '2020-01-03', '2020-01-03', '2020-01-06'], ['2020-01-02', '2020-01-06', '2020-01-03']]:
+    try:
+        trading_calendar(dates)
+        raise AssertionError(f"trading_calendar({dates}) should raise ValueError")
+    except ValueError:
+        pass
+
+# a history with an unsorted and a duplicate date is sorted and deduplicated where it is read (the last row of a date is kept)
+with tempfile.TemporaryDirectory() as tmp_dir:
+    history_file = os.path.join(tmp_dir, "TEST_history.csv")
+    info_file = os.path.join(tmp_dir, "TEST_info_dict.pkl")
+    pd.DataFrame({'Date': ['2020-01-02', '2020-01-06', '2020-01-03', '2020-01-03', '2020-01-07'],
+                  'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': [10.0, 13.0, 11.0, 12.0, 14.0], 'Volume': 1000}).to_csv(history_file, index=False)
+    with open(info_file, "wb") as f:
+        pickle.dump({'info': {}}, f)
+    ticker_data_dict = read_ticker_data_dict(ticker='TEST', ticker_history_df_file=history_file, ticker_info_dict_file=info_file)
+    history_df = ticker_data_dict['history']
+    assert history_df['Close'].tolist() == [10.0, 12.0, 13.0, 14.0]
+
+    ticker = Ticker(ticker_data_dict=ticker_data_dict)
+    assert len(ticker.calendar) == len(history_df)
+    assert int(ticker.calendar.next('2020-01-03')) == 1
+    close, date = ticker.close_price_on_date('2020-01-03')
+    assert close == 12.0 and str(date.date()) == '2020-01-03'
+    close, date = ticker.close_price_on_date('2020-01-04') # a weekend: the next trading date
+    assert close == 13.0 and str(date.date()) == '2020-01-06'
+    closes, dates = ticker.close_prices_on_dates(['2020-01-02', '2020-01-05', '2020-01-31'])
+    assert closes.tolist() == [10.0, 13.0, 14.0]
+    assert ticker.calendar.slice('2020-01-03', '2020-01-06') == slice(1, 3)
+    assert len(ticker.history_view.indicators.as_of('2020-01-03')) == 2
+
+print("trading_calendar: OK")